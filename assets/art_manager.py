@@ -9,6 +9,11 @@ import pygame
 import os
 import math
 from config import COLORS
+from graphics.procedural_textures import get_procedural_textures
+from assets.surface_registry import get_surface_registry
+from managers.game_log import get_logger
+
+logger = get_logger("art_manager")
 
 class ArtManager:
     """
@@ -19,7 +24,8 @@ class ArtManager:
     def __init__(self):
         """Initialize art manager"""
         self.assets = {}
-        self.default_assets = {}
+        self.default_assets = {}        # name -> loader (surfaces are held by the surface registry)
+        self.registry = get_surface_registry()
         self.asset_folders = {
             'characters': 'assets/art/characters/',
             'angels': 'assets/art/angels/',           # Added Angels folder
@@ -40,7 +46,7 @@ class ArtManager:
         # Load custom art
         self._load_custom_art()
         
-        print("🎨 Art Manager initialized with Angels and EVA Units")
+        logger.info("🎨 Art Manager initialized with Angels and EVA Units")
     
     def _create_readme(self, path, folder_type):
         """Create README files for each asset folder"""
@@ -218,57 +224,69 @@ Recommended size: 16x16 or 32x32 pixels
     
     def _generate_default_art(self):
         """Generate default pixel art including Angels"""
-        print("🎨 Generating default pixel art (including Angels)...")
+        logger.info("🎨 Generating default pixel art (including Angels)...")
         
         # === CHARACTER SPRITES ===
-        self.default_assets['shinji'] = self._create_character_sprite((101, 67, 33), (50, 50, 100))
-        self.default_assets['asuka'] = self._create_character_sprite((255, 140, 0), (255, 0, 0))
-        self.default_assets['rei'] = self._create_character_sprite((200, 200, 255), (255, 255, 255))
-        self.default_assets['misato'] = self._create_character_sprite((75, 0, 130), (128, 0, 128))
-        self.default_assets['gendo'] = self._create_character_sprite((101, 67, 33), (20, 20, 20))
-        self.default_assets['ritsuko'] = self._create_character_sprite((255, 215, 0), (255, 255, 255))
+        self._add_default('shinji', self._create_character_sprite, (101, 67, 33), (50, 50, 100))
+        self._add_default('asuka', self._create_character_sprite, (255, 140, 0), (255, 0, 0))
+        self._add_default('rei', self._create_character_sprite, (200, 200, 255), (255, 255, 255))
+        self._add_default('misato', self._create_character_sprite, (75, 0, 130), (128, 0, 128))
+        self._add_default('gendo', self._create_character_sprite, (101, 67, 33), (20, 20, 20))
+        self._add_default('ritsuko', self._create_character_sprite, (255, 215, 0), (255, 255, 255))
         
         # === CHARACTER PORTRAITS ===
-        self.default_assets['shinji_portrait'] = self._create_portrait((101, 67, 33), (50, 50, 100))
-        self.default_assets['asuka_portrait'] = self._create_portrait((255, 140, 0), (255, 0, 0))
-        self.default_assets['rei_portrait'] = self._create_portrait((200, 200, 255), (255, 255, 255))
-        self.default_assets['misato_portrait'] = self._create_portrait((75, 0, 130), (128, 0, 128))
+        self._add_default('shinji_portrait', self._create_portrait, (101, 67, 33), (50, 50, 100))
+        self._add_default('asuka_portrait', self._create_portrait, (255, 140, 0), (255, 0, 0))
+        self._add_default('rei_portrait', self._create_portrait, (200, 200, 255), (255, 255, 255))
+        self._add_default('misato_portrait', self._create_portrait, (75, 0, 130), (128, 0, 128))
         
         # === ANGEL SPRITES ===
-        self.default_assets['sachiel'] = self._create_angel_sachiel()
-        self.default_assets['shamshel'] = self._create_angel_shamshel()
-        self.default_assets['ramiel'] = self._create_angel_ramiel()
-        self.default_assets['tutorial_angel'] = self._create_tutorial_angel()
-        self.default_assets['angel_core'] = self._create_angel_core()
+        self._add_default('sachiel', self._create_angel_sachiel)
+        self._add_default('shamshel', self._create_angel_shamshel)
+        self._add_default('ramiel', self._create_angel_ramiel)
+        self._add_default('tutorial_angel', self._create_tutorial_angel)
+        self._add_default('angel_core', self._create_angel_core)
         
         # === EVA UNIT SPRITES ===
-        self.default_assets['eva_01'] = self._create_eva_unit((128, 0, 128), "01")  # Purple
-        self.default_assets['eva_00'] = self._create_eva_unit((0, 100, 200), "00")   # Blue
-        self.default_assets['eva_02'] = self._create_eva_unit((200, 0, 0), "02")     # Red
+        self._add_default('eva_01', self._create_eva_unit, (128, 0, 128), "01")    # Purple
+        self._add_default('eva_00', self._create_eva_unit, (0, 100, 200), "00")    # Blue
+        self._add_default('eva_02', self._create_eva_unit, (200, 0, 0), "02")      # Red
         
         # === BACKGROUNDS ===
-        self.default_assets['bedroom_bg'] = self._create_bedroom_background()
-        self.default_assets['nerv_hq_bg'] = self._create_nerv_background()
-        self.default_assets['tokyo3_bg'] = self._create_city_background()
-        self.default_assets['combat_bg'] = self._create_combat_background()
-        self.default_assets['angel_battle_bg'] = self._create_angel_battle_background()
+        self._add_default('bedroom_bg', self._create_bedroom_background)
+        self._add_default('nerv_hq_bg', self._create_nerv_background)
+        self._add_default('tokyo3_bg', self._create_city_background)
+        self._add_default('combat_bg', self._create_combat_background)
+        self._add_default('angel_battle_bg', self._create_angel_battle_background)
         
         # === EFFECTS ===
-        self.default_assets['at_field'] = self._create_at_field_effect()
-        self.default_assets['attack_effect'] = self._create_attack_effect()
-        self.default_assets['explosion'] = self._create_explosion_effect()
+        self._add_default('at_field', self._create_at_field_effect)
+        self._add_default('attack_effect', self._create_attack_effect)
+        self._add_default('explosion', self._create_explosion_effect)
         
         # === UI ELEMENTS ===
-        self.default_assets['dialogue_box'] = self._create_dialogue_box()
-        self.default_assets['hud_panel'] = self._create_hud_panel()
+        self._add_default('dialogue_box', self._create_dialogue_box)
+        self._add_default('hud_panel', self._create_hud_panel)
         
         # === ICONS ===
-        self.default_assets['health_icon'] = self._create_health_icon()
-        self.default_assets['energy_icon'] = self._create_energy_icon()
-        self.default_assets['sync_icon'] = self._create_sync_icon()
-        self.default_assets['angel_icon'] = self._create_angel_icon()
+        self._add_default('health_icon', self._create_health_icon)
+        self._add_default('energy_icon', self._create_energy_icon)
+        self._add_default('sync_icon', self._create_sync_icon)
+        self._add_default('angel_icon', self._create_angel_icon)
         
-        print("✅ Default pixel art generated (including Angels and EVAs)")
+        logger.info("✅ Default pixel art generated (including Angels and EVAs)")
+    
+    def _add_default(self, name, factory, *args):
+        """Build a default asset and register it (evictable, since it can be drawn again)"""
+        loader = lambda: factory(*args)
+        self.default_assets[name] = loader
+        self.registry.register("art_manager", name, loader(), loader)
+    
+    def get_asset(self, name):
+        """Get custom art if present, otherwise the default (None if unknown)"""
+        if name in self.assets:
+            return self.assets[name]
+        return self.registry.get("art_manager", name)
     
     def _create_angel_sachiel(self, size=(80, 120)):
         """Create Sachiel (First Angel) sprite"""
@@ -481,14 +499,8 @@ Recommended size: 16x16 or 32x32 pixels
         surface = pygame.Surface(size)
         
         # Dark, ominous sky
-        for y in range(size[1]//2):
-            ratio = y / (size[1]//2)
-            color = (
-                int(20 + (60 - 20) * ratio),
-                int(20 + (40 - 20) * ratio),
-                int(40 + (80 - 40) * ratio)
-            )
-            pygame.draw.line(surface, color, (0, y), (size[0], y))
+        sky = get_procedural_textures().vertical_gradient((size[0], size[1]//2), (20, 20, 40), (60, 40, 80))
+        surface.blit(sky, (0, 0))
         
         # Destroyed cityscape
         ground_rect = pygame.Rect(0, size[1]//2, size[0], size[1]//2)
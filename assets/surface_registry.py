@@ -0,0 +1,167 @@
+"""
+===============================
+SURFACE REGISTRY
+===============================
+Memory accounting for long-lived game surfaces
+
+FEATURES:
+- ✅ Bytes per surface (width × height × bytes per pixel), grouped by owner
+- ✅ Surfaces with a loader can be evicted and are rebuilt on next use
+- ✅ Memory budget enforced by evicting least recently used surfaces
+- ✅ Surfaces without a loader are counted while their owner keeps them (weak reference)
+- ✅ Self-managed caches (thumbnails, textures, transforms, text blocks) report their bytes too
+- ✅ Per-owner report for the debug overlay
+"""
+
+import weakref
+from collections import OrderedDict
+from managers.game_log import get_logger
+
+logger = get_logger("surface_registry")
+
+try:
+    from config import SURFACE_MEMORY_BUDGET
+except ImportError:
+    SURFACE_MEMORY_BUDGET = 48 * 1024 * 1024
+
+
+def surface_bytes(surface):
+    """Approximate memory used by a surface's pixels"""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class SurfaceRegistry:
+    """
+    SURFACE REGISTRY
+    LRU of owned surfaces with a byte budget over the evictable ones
+    """
+    
+    def __init__(self, budget=SURFACE_MEMORY_BUDGET):
+        """Initialize registry"""
+        self.budget = budget
+        # (owner, name) -> [surface (None when evicted, weak reference without a loader), bytes, loader]
+        self.entries = OrderedDict()
+        self.resident_bytes = 0
+        self.collected = []             # (key, reference) of weakly tracked surfaces freed by their owners
+        self.caches = {}                # owner -> get_memory_usage() of a cache that evicts on its own
+        self.stats = {"registered": 0, "evicted": 0, "reloaded": 0}
+    
+    # === REGISTRATION ===
+    
+    def register(self, owner, name, surface, loader=None):
+        """Track a surface (loader() rebuilds it, making it evictable); returns the surface"""
+        key = (owner, name)
+        self.release(owner, name)
+        size = surface_bytes(surface)
+        if loader is None:
+            # Owner keeps the only strong reference; dropping it removes the entry
+            held = weakref.ref(surface, lambda ref, key=key: self.collected.append((key, ref)))
+        else:
+            held = surface
+        self.entries[key] = [held, size, loader]
+        self.resident_bytes += size
+        self.stats["registered"] += 1
+        self._enforce_budget(key)
+        return surface
+    
+    def get(self, owner, name):
+        """Get a surface, rebuilding it if it was evicted (None if never registered)"""
+        self._purge_collected()
+        key = (owner, name)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        
+        self.entries.move_to_end(key)
+        if entry[2] is None:
+            return entry[0]()
+        if entry[0] is None:
+            entry[0] = entry[2]()
+            entry[1] = surface_bytes(entry[0])
+            self.resident_bytes += entry[1]
+            self.stats["reloaded"] += 1
+            self._enforce_budget(key)
+        return entry[0]
+    
+    def release(self, owner, name):
+        """Stop tracking one surface"""
+        entry = self.entries.pop((owner, name), None)
+        if entry is not None and entry[0] is not None:
+            self.resident_bytes -= entry[1]
+    
+    def release_owner(self, owner):
+        """Stop tracking every surface of an owner"""
+        for key in [key for key in self.entries if key[0] == owner]:
+            self.release(*key)
+    
+    def register_cache(self, owner, memory_usage):
+        """Report a cache that manages its own memory; memory_usage() returns (bytes, surfaces)"""
+        self.caches[owner] = memory_usage
+    
+    def _purge_collected(self):
+        """Drop entries whose weakly tracked surface was freed"""
+        while self.collected:
+            key, ref = self.collected.pop()
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] is ref:
+                self.release(*key)
+    
+    def _enforce_budget(self, keep):
+        """Evict least recently used rebuildable surfaces until under budget"""
+        self._purge_collected()
+        if self.resident_bytes <= self.budget:
+            return
+        
+        for key, entry in self.entries.items():
+            if self.resident_bytes <= self.budget:
+                break
+            if key == keep or entry[0] is None or entry[2] is None:
+                continue
+            # Callers must not hold on to registered surfaces, or eviction frees nothing
+            entry[0] = None
+            self.resident_bytes -= entry[1]
+            self.stats["evicted"] += 1
+    
+    # === REPORTING ===
+    
+    def get_report(self):
+        """Get resident bytes and surface counts per owner, largest owner first"""
+        self._purge_collected()
+        owners = {}
+        for (owner, name), (surface, size, loader) in self.entries.items():
+            report = owners.setdefault(owner, {"bytes": 0, "surfaces": 0, "evictable": 0, "evicted": 0})
+            if surface is None:
+                report["evicted"] += 1
+                continue
+            report["bytes"] += size
+            report["surfaces"] += 1
+            if loader is not None:
+                report["evictable"] += 1
+        for owner, memory_usage in self.caches.items():
+            size, count = memory_usage()
+            report = owners.setdefault(owner, {"bytes": 0, "surfaces": 0, "evictable": 0, "evicted": 0})
+            report["bytes"] += size
+            report["surfaces"] += count
+            report["evictable"] += count
+        return OrderedDict(sorted(owners.items(), key=lambda item: item[1]["bytes"], reverse=True))
+    
+    def get_stats(self):
+        """Get registry statistics"""
+        self._purge_collected()
+        stats = dict(self.stats)
+        stats["surfaces"] = len(self.entries)
+        stats["resident_mb"] = round(self.resident_bytes / (1024 * 1024), 1)
+        stats["cache_mb"] = round(sum(memory_usage()[0] for memory_usage in self.caches.values()) / (1024 * 1024), 1)
+        stats["budget_mb"] = round(self.budget / (1024 * 1024), 1)
+        return stats
+
+
+_shared_registry = None
+
+
+def get_surface_registry():
+    """Get the shared surface registry"""
+    global _shared_registry
+    if _shared_registry is None:
+        _shared_registry = SurfaceRegistry()
+    return _shared_registry
@@ -0,0 +1,259 @@
+"""
+===============================
+THUMBNAIL PIPELINE
+===============================
+Background image decoding for the art gallery
+
+FEATURES:
+- ✅ Decode and downscale on a worker pool (main thread never blocks on disk)
+- ✅ Disk thumbnail cache keyed by path + modification time
+- ✅ Bounded in-memory thumbnail LRU (flat memory for thousands of images)
+- ✅ Full-resolution LRU limited by a byte budget
+- ✅ Stale requests cancelled when they scroll out of the prefetch window
+- ✅ Memory caches keyed by path + modification time, so edited images reload
+"""
+
+import pygame
+import hashlib
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from assets.surface_registry import get_surface_registry, surface_bytes
+from managers.game_log import get_logger
+
+logger = get_logger("thumbnail_pipeline")
+
+try:
+    from config import THUMBNAIL_CACHE_PATH, THUMBNAIL_SIZE, GALLERY_FULL_IMAGE_BUDGET
+except ImportError:
+    THUMBNAIL_CACHE_PATH = "assets/art/.thumbnails"
+    THUMBNAIL_SIZE = (140, 100)
+    GALLERY_FULL_IMAGE_BUDGET = 64 * 1024 * 1024
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tga', '.webp')
+SOURCE_STAT_INTERVAL = 1.0          # Seconds a source file's modification time is trusted
+
+
+class ThumbnailPipeline:
+    """
+    THUMBNAIL PIPELINE
+    Worker-pool thumbnail and full image loader with memory and disk caches
+    """
+    
+    def __init__(self, cache_folder=THUMBNAIL_CACHE_PATH, thumbnail_size=THUMBNAIL_SIZE,
+                 max_workers=4, max_thumbnails=256, full_image_budget=GALLERY_FULL_IMAGE_BUDGET):
+        """Initialize worker pool and caches"""
+        self.cache_folder = cache_folder
+        self.thumbnail_size = tuple(thumbnail_size)
+        self.max_thumbnails = max_thumbnails
+        self.full_image_budget = full_image_budget
+        
+        os.makedirs(self.cache_folder, exist_ok=True)
+        
+        # === WORKERS ===
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="thumbnail")
+        self.completed = queue.Queue()      # Filled by workers, drained on the main thread
+        self.pending = {}                   # (kind, source) -> Future
+        
+        # === MEMORY CACHES ===
+        # Keyed by source = (path, mtime_ns); an edited file gets a new key and the old entry ages out
+        self.thumbnails = OrderedDict()     # source -> Surface
+        self.full_images = OrderedDict()    # source -> Surface
+        self.full_image_bytes = 0
+        self.failed = set()                 # sources that could not be decoded
+        self.source_times = {}              # path -> mtime_ns, refreshed every SOURCE_STAT_INTERVAL
+        self.source_times_checked = 0.0
+        
+        # === STATISTICS ===
+        self.stats = {"disk_hits": 0, "decoded": 0, "cancelled": 0, "evicted_full": 0}
+        
+        logger.info(f"🖼️ Thumbnail pipeline ready ({max_workers} workers)")
+    
+    # === REQUESTS ===
+    
+    def get_thumbnail(self, path):
+        """Get a thumbnail if ready, otherwise queue it and return None"""
+        source = self._source(path)
+        surface = self.thumbnails.get(source)
+        if surface is not None:
+            self.thumbnails.move_to_end(source)
+            return surface
+        self._submit("thumb", source)
+        return None
+    
+    def prefetch(self, paths):
+        """Queue thumbnails that will be visible soon"""
+        for path in paths:
+            source = self._source(path)
+            if source not in self.thumbnails:
+                self._submit("thumb", source)
+    
+    def retain(self, paths):
+        """Cancel queued thumbnail jobs that are no longer wanted"""
+        wanted = set(paths)
+        for key, future in list(self.pending.items()):
+            if key[0] == "thumb" and key[1][0] not in wanted and future.cancel():
+                del self.pending[key]
+                self.stats["cancelled"] += 1
+    
+    def get_full_image(self, path):
+        """Get a full-resolution image if ready, otherwise queue it and return None"""
+        source = self._source(path)
+        surface = self.full_images.get(source)
+        if surface is not None:
+            self.full_images.move_to_end(source)
+            return surface
+        self._submit("full", source)
+        return None
+    
+    def is_failed(self, path):
+        """Check if an image could not be decoded"""
+        return self._source(path) in self.failed
+    
+    def _source(self, path):
+        """Cache key for a path at its current modification time (None if the file is gone)"""
+        now = time.monotonic()
+        if now - self.source_times_checked >= SOURCE_STAT_INTERVAL:
+            self.source_times.clear()
+            self.source_times_checked = now
+        
+        mtime = self.source_times.get(path)
+        if mtime is None and path not in self.source_times:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = None
+            self.source_times[path] = mtime
+        return (path, mtime)
+    
+    def _submit(self, kind, source):
+        """Queue a decode job unless one is already pending"""
+        key = (kind, source)
+        if key in self.pending or source in self.failed:
+            return
+        
+        job = self._load_thumbnail if kind == "thumb" else self._load_full_image
+        future = self.executor.submit(job, source)
+        self.pending[key] = future
+        future.add_done_callback(lambda done, key=key: self.completed.put((key, done)))
+    
+    # === WORKER JOBS ===
+    
+    def _cache_path(self, source):
+        """Disk cache file for a source path at its modification time"""
+        path, mtime = source
+        digest = hashlib.sha1(f"{os.path.abspath(path)}|{mtime}|{self.thumbnail_size}".encode('utf-8'))
+        return os.path.join(self.cache_folder, digest.hexdigest() + ".png")
+    
+    def _load_thumbnail(self, source):
+        """Load a thumbnail from the disk cache or decode and downscale the source"""
+        path = source[0]
+        cache_path = self._cache_path(source)
+        if os.path.exists(cache_path):
+            return pygame.image.load(cache_path), True
+        
+        image = pygame.image.load(path)
+        thumbnail = self._fit(image, self.thumbnail_size)
+        
+        temp_path = f"{cache_path[:-4]}.{threading.get_ident()}.tmp.png"
+        try:
+            pygame.image.save(thumbnail, temp_path)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not cache thumbnail for {path}: {e}")
+        return thumbnail, False
+    
+    def _load_full_image(self, source):
+        """Decode a full-resolution image"""
+        return pygame.image.load(source[0]), False
+    
+    def _fit(self, image, size):
+        """Downscale image to fit inside size, keeping aspect ratio"""
+        width, height = image.get_size()
+        scale = min(size[0] / max(1, width), size[1] / max(1, height), 1.0)
+        target = (max(1, int(width * scale)), max(1, int(height * scale)))
+        try:
+            return pygame.transform.smoothscale(image, target)
+        except ValueError:
+            # smoothscale needs 24/32-bit surfaces (e.g. palettized GIFs fail)
+            return pygame.transform.scale(image, target)
+    
+    # === MAIN THREAD ===
+    
+    def update(self):
+        """Move finished jobs into the caches (call once per frame)"""
+        while True:
+            try:
+                key, future = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            
+            kind, source = key
+            if self.pending.get(key) is future:
+                del self.pending[key]
+            if future.cancelled():
+                continue
+            
+            try:
+                surface, from_disk = future.result()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not load image {source[0]}: {e}")
+                self.failed.add(source)
+                continue
+            
+            # Convert for fast blitting once a display exists
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            
+            if kind == "thumb":
+                self.stats["disk_hits" if from_disk else "decoded"] += 1
+                self.thumbnails[source] = surface
+                while len(self.thumbnails) > self.max_thumbnails:
+                    self.thumbnails.popitem(last=False)
+            else:
+                self._store_full_image(source, surface)
+    
+    def _store_full_image(self, source, surface):
+        """Add a full image, evicting least recently used ones over budget"""
+        self.full_images[source] = surface
+        self.full_image_bytes += surface_bytes(surface)
+        while self.full_image_bytes > self.full_image_budget and len(self.full_images) > 1:
+            _, evicted = self.full_images.popitem(last=False)
+            self.full_image_bytes -= surface_bytes(evicted)
+            self.stats["evicted_full"] += 1
+    
+    def cancel_pending(self):
+        """Cancel every queued job (e.g. when leaving the gallery)"""
+        for key, future in list(self.pending.items()):
+            if future.cancel():
+                del self.pending[key]
+                self.stats["cancelled"] += 1
+    
+    def get_memory_usage(self):
+        """Get (bytes, surfaces) held by the thumbnail and full image caches"""
+        thumbnail_bytes = sum(surface_bytes(surface) for surface in self.thumbnails.values())
+        return thumbnail_bytes + self.full_image_bytes, len(self.thumbnails) + len(self.full_images)
+    
+    def get_stats(self):
+        """Get cache statistics"""
+        stats = dict(self.stats)
+        stats["thumbnails"] = len(self.thumbnails)
+        stats["full_images"] = len(self.full_images)
+        stats["full_image_mb"] = round(self.full_image_bytes / (1024 * 1024), 1)
+        stats["pending"] = len(self.pending)
+        return stats
+
+
+_shared_pipeline = None
+
+
+def get_thumbnail_pipeline():
+    """Get the shared thumbnail pipeline (workers are reused across visits)"""
+    global _shared_pipeline
+    if _shared_pipeline is None:
+        _shared_pipeline = ThumbnailPipeline()
+        get_surface_registry().register_cache("thumbnail_pipeline", _shared_pipeline.get_memory_usage)
+    return _shared_pipeline
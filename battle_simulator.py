@@ -0,0 +1,273 @@
+"""
+===============================
+HEADLESS BATTLE SIMULATOR
+===============================
+Monte Carlo balancing runs for ActionBattleScene
+
+FEATURES:
+- ✅ Fights run on the same BattleCore and Angel AI as the real scene
+- ✅ Scripted player policies (aggressive, guarded, sync burst) pressing keys at a human cadence
+- ✅ Thousands of seeded fights spread over every core with ProcessPoolExecutor
+- ✅ Win rates, time-to-kill distributions and sync-ratio curves per Angel
+- ✅ JSON report plus an optional long-format CSV for spreadsheets
+
+USAGE:
+    python battle_simulator.py --fights 5000 --output battle_report.json
+    python battle_simulator.py --angels Sachiel,Ramiel --policies guarded --csv battle.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import VERSION
+from entities.battle_core import BattleCore
+
+ANGELS = ["Sachiel", "Shamshel", "Ramiel"]
+TTK_BUCKET = 5                      # Seconds per time-to-kill histogram bucket
+ACTION_INTERVAL = 0.45              # Mean seconds between a player's key presses (the scene acts on KEYDOWN)
+ACTION_JITTER = 0.3                 # Each gap varies by up to ±30%
+
+
+# === PLAYER POLICIES ===
+# Each policy picks one action per action slot: "attack", "at_field", "special" or None
+
+def _aggressive_policy(battle):
+    """Attack every slot"""
+    return "attack"
+
+
+def _guarded_policy(battle):
+    """Raise the AT field against telegraphed attacks, otherwise attack"""
+    if battle.angel_brain.is_winding_up() and not battle.at_field_active:
+        return "at_field"
+    return "attack"
+
+
+def _sync_burst_policy(battle):
+    """Guarded, but spend sync on special attacks whenever possible"""
+    action = _guarded_policy(battle)
+    if action == "attack" and battle.sync_ratio >= 80:
+        return "special"
+    return action
+
+
+POLICIES = {
+    "aggressive": _aggressive_policy,
+    "guarded": _guarded_policy,
+    "sync_burst": _sync_burst_policy
+}
+
+
+# === SIMULATION ===
+
+def simulate_fight(angel_name, policy_name, seed, dt=1 / 30, action_interval=ACTION_INTERVAL, max_time=120.0):
+    """Run one fight to the end and summarize it"""
+    battle = BattleCore(angel_name, random.Random(seed))
+    cadence = random.Random(f"cadence-{seed}")     # Separate stream, so the fight's own rolls do not shift
+    policy = POLICIES[policy_name]
+    actions = {"attack": battle.player_attack, "at_field": battle.activate_at_field,
+               "special": battle.special_attack}
+    
+    next_action = 0.0
+    next_sample = 0.0
+    sync_samples = []
+    while not battle.is_over() and battle.elapsed < max_time:
+        battle.update(dt)
+        if battle.phase != "combat":
+            continue
+        
+        # Sync ratio once per second of combat
+        if battle.combat_time >= next_sample:
+            sync_samples.append(battle.sync_ratio)
+            next_sample += 1.0
+        
+        if battle.combat_time >= next_action:
+            action = policy(battle)
+            if action:
+                actions[action]()
+            next_action += action_interval * cadence.uniform(1 - ACTION_JITTER, 1 + ACTION_JITTER)
+    
+    return {
+        "result": battle.phase if battle.is_over() else "timeout",
+        "time_to_kill": battle.combat_time,
+        "eva_health": battle.eva_health,
+        "sync_samples": sync_samples
+    }
+
+
+def _simulate_batch(job):
+    """Worker: run a block of seeds for one matchup and return partial totals"""
+    angel_name, policy_name, seeds, dt, action_interval, max_time = job
+    totals = {"victory": 0, "defeat": 0, "timeout": 0, "time_to_kill": [], "eva_health": 0,
+              "sync_sums": [], "sync_counts": []}
+    for seed in seeds:
+        fight = simulate_fight(angel_name, policy_name, seed, dt, action_interval, max_time)
+        totals[fight["result"]] += 1
+        totals["eva_health"] += fight["eva_health"]
+        if fight["result"] == "victory":
+            totals["time_to_kill"].append(fight["time_to_kill"])
+        for second, sync in enumerate(fight["sync_samples"]):
+            if second == len(totals["sync_sums"]):
+                totals["sync_sums"].append(0.0)
+                totals["sync_counts"].append(0)
+            totals["sync_sums"][second] += sync
+            totals["sync_counts"][second] += 1
+    return angel_name, policy_name, totals
+
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of pre-sorted values"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return round(sorted_values[index], 2)
+
+
+def _summarize(angel_name, policy_name, totals, fights):
+    """Turn merged totals into one matchup report"""
+    kills = sorted(totals["time_to_kill"])
+    histogram = {}
+    for ttk in kills:
+        bucket = int(ttk // TTK_BUCKET) * TTK_BUCKET
+        label = f"{bucket}-{bucket + TTK_BUCKET}"
+        histogram[label] = histogram.get(label, 0) + 1
+    
+    return {
+        "angel": angel_name,
+        "policy": policy_name,
+        "fights": fights,
+        "win_rate": round(totals["victory"] / fights, 4),
+        "defeat_rate": round(totals["defeat"] / fights, 4),
+        "timeout_rate": round(totals["timeout"] / fights, 4),
+        "mean_eva_health_left": round(totals["eva_health"] / fights, 2),
+        "time_to_kill": {
+            "mean": round(sum(kills) / len(kills), 2) if kills else None,
+            "p10": _percentile(kills, 0.1),
+            "p50": _percentile(kills, 0.5),
+            "p90": _percentile(kills, 0.9),
+            "histogram": histogram
+        },
+        # Mean sync ratio at each second of combat (fights still running at that second)
+        "sync_curve": [round(total / count, 2) for total, count in zip(totals["sync_sums"], totals["sync_counts"])]
+    }
+
+
+def run_simulation(angels, policies, fights, workers=None, seed=0, dt=1 / 30, action_interval=ACTION_INTERVAL,
+                   max_time=120.0, chunk_size=250):
+    """Simulate every Angel/policy matchup across a process pool"""
+    jobs = []
+    for angel_offset, angel_name in enumerate(angels):
+        for policy_offset, policy_name in enumerate(policies):
+            # Distinct, reproducible seed ranges per matchup
+            base = seed + (angel_offset * len(policies) + policy_offset) * fights
+            for start in range(0, fights, chunk_size):
+                seeds = range(base + start, base + min(fights, start + chunk_size))
+                jobs.append((angel_name, policy_name, seeds, dt, action_interval, max_time))
+    
+    merged = {}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for angel_name, policy_name, totals in executor.map(_simulate_batch, jobs):
+            current = merged.get((angel_name, policy_name))
+            if current is None:
+                merged[(angel_name, policy_name)] = totals
+                continue
+            for key in ("victory", "defeat", "timeout", "eva_health"):
+                current[key] += totals[key]
+            current["time_to_kill"].extend(totals["time_to_kill"])
+            for second, (total, count) in enumerate(zip(totals["sync_sums"], totals["sync_counts"])):
+                if second == len(current["sync_sums"]):
+                    current["sync_sums"].append(0.0)
+                    current["sync_counts"].append(0)
+                current["sync_sums"][second] += total
+                current["sync_counts"][second] += count
+    elapsed = time.perf_counter() - started
+    
+    total_fights = fights * len(angels) * len(policies)
+    return {
+        "fights_per_matchup": fights,
+        "elapsed_seconds": round(elapsed, 3),
+        "fights_per_second": round(total_fights / elapsed, 1) if elapsed > 0 else None,
+        "matchups": [_summarize(angel_name, policy_name, merged[(angel_name, policy_name)], fights)
+                     for angel_name in angels for policy_name in policies]
+    }
+
+
+def write_csv(results, path):
+    """Write matchups as long-format rows: angel, policy, metric, x, value"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["angel", "policy", "metric", "x", "value"])
+        for matchup in results["matchups"]:
+            prefix = [matchup["angel"], matchup["policy"]]
+            for metric in ("win_rate", "defeat_rate", "timeout_rate", "mean_eva_health_left"):
+                writer.writerow(prefix + [metric, "", matchup[metric]])
+            for metric in ("mean", "p10", "p50", "p90"):
+                writer.writerow(prefix + [f"time_to_kill_{metric}", "", matchup["time_to_kill"][metric]])
+            for bucket, count in matchup["time_to_kill"]["histogram"].items():
+                writer.writerow(prefix + ["time_to_kill_histogram", bucket, count])
+            for second, sync in enumerate(matchup["sync_curve"]):
+                writer.writerow(prefix + ["sync_ratio", second, sync])
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Headless Monte Carlo battle simulator")
+    parser.add_argument("--angels", default=",".join(ANGELS),
+                        help=f"comma-separated Angel names (default: {','.join(ANGELS)})")
+    parser.add_argument("--policies", default=",".join(POLICIES),
+                        help=f"comma-separated player policies (default: {','.join(POLICIES)})")
+    parser.add_argument("--fights", type=int, default=2000, help="fights per Angel/policy matchup")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="simulation worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="first fight seed")
+    parser.add_argument("--dt", type=float, default=1 / 30, help="simulation time step in seconds")
+    parser.add_argument("--action-interval", type=float, default=ACTION_INTERVAL,
+                        help=f"mean seconds between player key presses (default: {ACTION_INTERVAL})")
+    parser.add_argument("--max-time", type=float, default=120.0, help="seconds before a fight times out")
+    parser.add_argument("--output", default="battle_report.json",
+                        help="JSON results file ('-' for stdout)")
+    parser.add_argument("--csv", metavar="FILE", help="also write long-format CSV results")
+    args = parser.parse_args()
+    
+    policies = args.policies.split(",")
+    unknown = [policy for policy in policies if policy not in POLICIES]
+    if unknown:
+        parser.error(f"unknown policies: {', '.join(unknown)}")
+    
+    report = {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+    # Progress goes to stderr so '--output -' leaves stdout as plain JSON
+    print(f"⚔️ Simulating {args.fights} fights per matchup...", file=sys.stderr)
+    report.update(run_simulation(args.angels.split(","), policies, args.fights, args.workers, args.seed,
+                                 args.dt, args.action_interval, args.max_time))
+    print(f"⏱️ {report['fights_per_second']} fights/s", file=sys.stderr)
+    
+    output = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(output)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        print(f"📊 Results written to {os.path.abspath(args.output)}", file=sys.stderr)
+    
+    if args.csv:
+        write_csv(report, args.csv)
+        print(f"📊 CSV written to {os.path.abspath(args.csv)}", file=sys.stderr)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,11 +38,46 @@ COLORS = {
 ASSETS_PATH = "assets"
 SAVE_PATH = "saves"
 DATA_PATH = "data"
+DIALOGUE_BUNDLE_PATH = "data/dialogues.bundle"  # Built by: python -m data.dialogue_bundle
+
+# === BACKGROUND I/O SETTINGS ===
+IO_QUEUE_SIZE = 64              # Distinct files waiting to be written before writers block
+
+# === DIALOGUE BACKUP SETTINGS ===
+DIALOGUE_BACKUP_VERSIONS = 20   # Versions kept per dialogue file
+DIALOGUE_BACKUP_DAYS = 30       # Older versions are dropped (0 keeps them until the version limit)
+
+# === ART GALLERY SETTINGS ===
+THUMBNAIL_CACHE_PATH = "assets/art/.thumbnails"
+THUMBNAIL_SIZE = (140, 100)
+GALLERY_FULL_IMAGE_BUDGET = 64 * 1024 * 1024  # Bytes of full-resolution images kept in memory
+
+# === TRANSFORM CACHE SETTINGS ===
+TRANSFORM_ANGLE_STEP = 3.0              # Rotations snap to this many degrees
+TRANSFORM_SCALE_STEP = 0.01             # Scale factors snap to this step
+TRANSFORM_CACHE_BUDGET = 32 * 1024 * 1024  # Bytes of scaled/rotated surfaces kept in memory
+
+# === SURFACE MEMORY SETTINGS ===
+SURFACE_MEMORY_BUDGET = 48 * 1024 * 1024   # Bytes of registered art kept before rebuildable art is evicted
 
 # === PLAYER SETTINGS ===
 PLAYER_SPEED = 250  # Increased from 180 for smoother gameplay
 PLAYER_SIZE = (20, 30)
 
+# === NAVIGATION SETTINGS ===
+NAV_CELL_SIZE = 16              # Pixels per walkability grid cell
+NAV_FRAME_BUDGET_MS = 2.0       # Pathfinding time allowed per frame
+NAV_PATH_CACHE_SIZE = 128       # Smoothed paths kept per scene
+
+# === AI SETTINGS ===
+AI_TICK_RATE = 15               # Angel AI updates per second (independent of FPS)
+
+# === CROWD SETTINGS ===
+CROWD_SIZE = 240                # Pedestrians in the town streets (0 disables the crowd)
+CROWD_CELL_SIZE = 24            # Uniform grid cell for neighbour queries
+CROWD_LOD_RADIUS = 250          # Pedestrians further from the player re-steer less often
+CROWD_FAR_STEER_INTERVAL = 0.25 # Seconds between steering updates for far pedestrians
+
 # === PLAYER START VALUES ===
 PLAYER_START_HEALTH = 100
 PLAYER_START_SYNC_RATIO = 50.0
@@ -65,11 +100,18 @@ AUDIO_FREQUENCY = 44100
 AUDIO_SIZE = -16
 AUDIO_CHANNELS = 2
 AUDIO_BUFFER = 512
+AUDIO_VOICES = 16                   # Mixer channels shared by all sound effects
+AUDIO_SOUND_PATH = "assets/sounds"
+AUDIO_MUSIC_PATH = "assets/music"
+AUDIO_CROSSFADE_MS = 1200           # Total music switch time (fade out + fade in)
+AUDIO_REPEAT_INTERVAL_MS = 60       # Minimum gap between repeats of one sound
 
 # === DEBUG SETTINGS ===
 DEBUG_MODE = False
 SHOW_FPS = False
-LOG_LEVEL = "INFO"
+LOG_LEVEL = "INFO"                  # DEBUG, INFO, WARNING, ERROR or CRITICAL
+LOG_RATE_BURST = 5                  # Lines one call site may log per window before it is muted
+LOG_RATE_WINDOW = 5.0               # Seconds per rate-limit window (muted lines are counted)
 
 # === GAME METADATA ===
 VERSION = "1.0.0"
@@ -87,5 +129,9 @@ EXPERIENCE_PER_LEVEL = 100
 HUD_WIDTH = 220
 MESSAGE_DISPLAY_TIME = 3.0
 TOOLTIP_DELAY = 0.5
+AUTO_ADVANCE_BASE_DELAY = 1.0   # Seconds to hold a fully revealed line
+AUTO_ADVANCE_PER_CHAR = 0.03    # Extra hold time per character
 
-print("⚙️ Complete configuration loaded with all player constants")
\ No newline at end of file
+# Status goes to stderr so tools can write results to stdout
+import sys
+print("⚙️ Complete configuration loaded with all player constants", file=sys.stderr)
\ No newline at end of file
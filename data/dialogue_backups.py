@@ -0,0 +1,155 @@
+"""
+===============================
+DIALOGUE BACKUP STORE
+===============================
+Content-addressed version history for dialogue files
+
+FEATURES:
+- ✅ Each distinct file content stored once, named by its SHA-1 hash
+- ✅ Saving unchanged content adds no version and writes no file
+- ✅ Small history index (version, hash, time) per dialogue in one index file
+- ✅ Retention by version count and age; unreferenced content deleted
+- ✅ Restore any version by number without scanning the backup folder
+- ✅ All writes go through the background I/O service
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from managers.io_service import get_io_service
+from managers.game_log import get_logger
+
+logger = get_logger("dialogue_backups")
+
+try:
+    from config import DIALOGUE_BACKUP_VERSIONS, DIALOGUE_BACKUP_DAYS
+except ImportError:
+    DIALOGUE_BACKUP_VERSIONS = 20
+    DIALOGUE_BACKUP_DAYS = 30
+
+BACKUP_INDEX_VERSION = 1
+
+
+class DialogueBackupStore:
+    """
+    DIALOGUE BACKUP STORE
+    Per-dialogue version lists pointing at shared, hash-named content files
+    """
+    
+    def __init__(self, folder, max_versions=DIALOGUE_BACKUP_VERSIONS, max_days=DIALOGUE_BACKUP_DAYS):
+        """Initialize store and load its history index"""
+        self.folder = folder
+        self.objects_folder = os.path.join(folder, "objects")
+        self.index_path = os.path.join(folder, "index.json")
+        self.max_versions = max(1, max_versions)
+        self.max_days = max_days
+        
+        # Dialogue name -> [{"version", "hash", "saved"}], oldest first
+        self.history = {}
+        self.references = {}            # hash -> number of versions using it
+        
+        self.stats = {"stored": 0, "deduplicated": 0, "pruned": 0}
+        self._load_index()
+    
+    def _load_index(self):
+        """Load the history index (a missing or unreadable index starts empty)"""
+        get_io_service().flush(self.index_path)
+        if not os.path.exists(self.index_path):
+            return
+        
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            self.history = index.get("dialogues", {})
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read dialogue backup index: {e}")
+            self.history = {}
+        
+        for versions in self.history.values():
+            for entry in versions:
+                self.references[entry["hash"]] = self.references.get(entry["hash"], 0) + 1
+    
+    def _object_path(self, content_hash):
+        """Content file for a hash"""
+        return os.path.join(self.objects_folder, content_hash + ".json")
+    
+    # === BACKUP ===
+    
+    def backup(self, name, content):
+        """Record content (bytes) as the newest version of a dialogue; returns its version number"""
+        content_hash = hashlib.sha1(content).hexdigest()
+        versions = self.history.setdefault(name, [])
+        if versions and versions[-1]["hash"] == content_hash:
+            self.stats["deduplicated"] += 1
+            return versions[-1]["version"]
+        
+        io_service = get_io_service()
+        if content_hash not in self.references:
+            io_service.write(self._object_path(content_hash), content)
+            self.stats["stored"] += 1
+        else:
+            self.stats["deduplicated"] += 1
+        self.references[content_hash] = self.references.get(content_hash, 0) + 1
+        
+        version = versions[-1]["version"] + 1 if versions else 1
+        versions.append({"version": version, "hash": content_hash, "saved": round(time.time(), 3)})
+        self._apply_retention(name)
+        io_service.write_json(self.index_path, {"version": BACKUP_INDEX_VERSION, "dialogues": self.history})
+        return version
+    
+    def _apply_retention(self, name):
+        """Drop versions over the count or age limit (the newest always stays)"""
+        versions = self.history[name]
+        keep_from = max(0, len(versions) - self.max_versions)
+        if self.max_days > 0:
+            cutoff = time.time() - self.max_days * 86400
+            while keep_from < len(versions) - 1 and versions[keep_from]["saved"] < cutoff:
+                keep_from += 1
+        
+        for entry in versions[:keep_from]:
+            self._release(entry["hash"])
+        del versions[:keep_from]
+        self.stats["pruned"] += keep_from
+    
+    def _release(self, content_hash):
+        """Drop one reference to a content file, deleting it when unused"""
+        count = self.references.get(content_hash, 0) - 1
+        if count > 0:
+            self.references[content_hash] = count
+            return
+        self.references.pop(content_hash, None)
+        get_io_service().remove(self._object_path(content_hash))
+    
+    # === HISTORY ===
+    
+    def get_versions(self, name):
+        """Get a dialogue's versions, oldest first ({"version", "hash", "saved"} dicts)"""
+        return list(self.history.get(name, []))
+    
+    def restore(self, name, version=None):
+        """Load a stored version of a dialogue (newest by default); None if unknown"""
+        versions = self.history.get(name)
+        if not versions:
+            return None
+        
+        if version is None:
+            entry = versions[-1]
+        else:
+            entry = next((entry for entry in versions if entry["version"] == version), None)
+            if entry is None:
+                return None
+        
+        path = self._object_path(entry["hash"])
+        get_io_service().flush(path)
+        with open(path, 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
+    
+    def get_stats(self):
+        """Get backup statistics"""
+        stats = dict(self.stats)
+        stats["dialogues"] = len(self.history)
+        stats["versions"] = sum(len(versions) for versions in self.history.values())
+        stats["objects"] = len(self.references)
+        return stats
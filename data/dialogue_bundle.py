@@ -0,0 +1,328 @@
+"""
+===============================
+PACKED DIALOGUE BUNDLE
+===============================
+Compiles every dialogue file into one memory-mapped bundle
+
+FEATURES:
+- ✅ Build step that packs data/dialogues/*.json into a single file
+- ✅ Interned string table (each unique string stored once)
+- ✅ Binary index of (character, scene) -> payload offset
+- ✅ Lazy decoding: a dialogue set is decoded the first time it is needed
+- ✅ Staleness check from one stat of the source folder (its mtime is stored at build time)
+
+USAGE:
+    python -m data.dialogue_bundle            (build with default paths)
+    python -m data.dialogue_bundle SRC OUT    (build from SRC folder into OUT)
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+
+try:
+    from config import DIALOGUE_BUNDLE_PATH
+except ImportError:
+    DIALOGUE_BUNDLE_PATH = "data/dialogues.bundle"
+
+# === FILE FORMAT ===
+# Header | payloads | index | string table  (all little-endian)
+BUNDLE_MAGIC = b"EVADLGB1"
+BUNDLE_VERSION = 2
+HEADER_FORMAT = "<8sHIQQq"     # magic, version, entry count, index offset, strings offset, source folder mtime_ns
+INDEX_FORMAT = "<IIIQI"        # name id, character id, scene id, payload offset, payload length
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+INDEX_SIZE = struct.calcsize(INDEX_FORMAT)
+
+# === VALUE TAGS ===
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STRING = 5
+TAG_LIST = 6
+TAG_DICT = 7
+
+
+def _source_files(folder):
+    """Dialogue JSON files in folder as {name: path} (same rules as DialogueEditor)"""
+    return {filename[:-5]: os.path.join(folder, filename) for filename in os.listdir(folder)
+            if filename.endswith('.json') and filename != 'TEMPLATE.json'}
+
+
+class DialogueBundleBuilder:
+    """
+    DIALOGUE BUNDLE BUILDER
+    Packs dialogue JSON data into the bundle format
+    """
+    
+    def __init__(self):
+        """Initialize empty bundle builder"""
+        self.strings = []
+        self.string_ids = {}
+        self.entries = []
+        self.payloads = bytearray()
+        self.source_mtime_ns = 0        # Source folder mtime when add_folder listed it
+    
+    def intern(self, text):
+        """Return the string table id for text, adding it if needed"""
+        string_id = self.string_ids.get(text)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(text)
+            self.string_ids[text] = string_id
+        return string_id
+    
+    def add_dialogue(self, name, dialogue_data):
+        """Add one dialogue file's data under its file name"""
+        payload = bytearray()
+        self._encode_value(dialogue_data, payload)
+        
+        self.entries.append((
+            self.intern(name),
+            self.intern(str(dialogue_data.get("character", ""))),
+            self.intern(str(dialogue_data.get("scene", ""))),
+            len(self.payloads),
+            len(payload)
+        ))
+        self.payloads.extend(payload)
+    
+    def add_folder(self, folder):
+        """Add every dialogue file in folder (same rules as DialogueEditor)"""
+        # Taken before reading, so a file saved during the build still marks the bundle stale
+        self.source_mtime_ns = os.stat(folder).st_mtime_ns
+        added = 0
+        for name, path in sorted(_source_files(folder).items()):
+            with open(path, 'r') as f:
+                dialogue_data = json.load(f)
+            if isinstance(dialogue_data, dict):
+                self.add_dialogue(name, dialogue_data)
+                added += 1
+        return added
+    
+    def _encode_value(self, value, out):
+        """Encode a JSON value with interned strings"""
+        if value is None:
+            out.append(TAG_NONE)
+        elif value is True:
+            out.append(TAG_TRUE)
+        elif value is False:
+            out.append(TAG_FALSE)
+        elif isinstance(value, int):
+            out.append(TAG_INT)
+            out.extend(struct.pack("<q", value))
+        elif isinstance(value, float):
+            out.append(TAG_FLOAT)
+            out.extend(struct.pack("<d", value))
+        elif isinstance(value, str):
+            out.append(TAG_STRING)
+            out.extend(struct.pack("<I", self.intern(value)))
+        elif isinstance(value, (list, tuple)):
+            out.append(TAG_LIST)
+            out.extend(struct.pack("<I", len(value)))
+            for item in value:
+                self._encode_value(item, out)
+        elif isinstance(value, dict):
+            out.append(TAG_DICT)
+            out.extend(struct.pack("<I", len(value)))
+            for key, item in value.items():
+                out.extend(struct.pack("<I", self.intern(str(key))))
+                self._encode_value(item, out)
+        else:
+            raise TypeError(f"Cannot pack value of type {type(value).__name__}")
+    
+    def write(self, output_path):
+        """Write the bundle atomically to output_path"""
+        index_offset = HEADER_SIZE + len(self.payloads)
+        strings_offset = index_offset + len(self.entries) * INDEX_SIZE
+        
+        # String table: count, count + 1 offsets into the blob, then the blob
+        encoded_strings = [text.encode('utf-8') for text in self.strings]
+        string_offsets = [0]
+        for data in encoded_strings:
+            string_offsets.append(string_offsets[-1] + len(data))
+        
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        temp_path = output_path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(struct.pack(HEADER_FORMAT, BUNDLE_MAGIC, BUNDLE_VERSION,
+                                len(self.entries), index_offset, strings_offset, self.source_mtime_ns))
+            f.write(self.payloads)
+            for entry in self.entries:
+                f.write(struct.pack(INDEX_FORMAT, *entry))
+            f.write(struct.pack("<I", len(encoded_strings)))
+            f.write(struct.pack(f"<{len(string_offsets)}I", *string_offsets))
+            for data in encoded_strings:
+                f.write(data)
+        os.replace(temp_path, output_path)
+
+
+class DialogueBundle:
+    """
+    DIALOGUE BUNDLE READER
+    Memory-mapped, lazily decoded view of a packed dialogue bundle
+    """
+    
+    def __init__(self, bundle_path=DIALOGUE_BUNDLE_PATH):
+        """Open bundle and read only its header and index"""
+        self.bundle_path = bundle_path
+        self._file = open(bundle_path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Dialogue bundle is empty: {bundle_path}")
+        
+        magic, version = struct.unpack_from("<8sH", self._data, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"Not a v{BUNDLE_VERSION} dialogue bundle: {bundle_path}")
+        _, _, entry_count, index_offset, strings_offset, self.source_mtime_ns = struct.unpack_from(
+            HEADER_FORMAT, self._data, 0)
+        
+        # String table stays in the mapping; strings are decoded on first use
+        self._string_count = struct.unpack_from("<I", self._data, strings_offset)[0]
+        self._string_offsets_at = strings_offset + 4
+        self._string_blob_at = self._string_offsets_at + (self._string_count + 1) * 4
+        self._string_cache = {}
+        
+        # Index: small fixed-size records, one per dialogue file
+        self._entries = {}
+        self._by_character = {}
+        for i in range(entry_count):
+            name_id, character_id, scene_id, payload_offset, payload_length = struct.unpack_from(
+                INDEX_FORMAT, self._data, index_offset + i * INDEX_SIZE)
+            name = self._string(name_id)
+            character = self._string(character_id)
+            scene = self._string(scene_id)
+            
+            self._entries[name] = (character, scene, HEADER_SIZE + payload_offset, payload_length)
+            self._by_character.setdefault(character.lower(), []).append(name)
+        
+        self._decoded = {}
+    
+    def close(self):
+        """Release the memory mapping"""
+        if getattr(self, '_data', None) is not None:
+            self._data.close()
+            self._data = None
+        if getattr(self, '_file', None) is not None:
+            self._file.close()
+            self._file = None
+        self._decoded = {}
+        self._string_cache = {}
+    
+    def __len__(self):
+        """Number of dialogue files in the bundle"""
+        return len(self._entries)
+    
+    def __contains__(self, name):
+        """Check if a dialogue file is in the bundle"""
+        return name in self._entries
+    
+    def get_dialogue_names(self):
+        """Get all dialogue file names without decoding anything"""
+        return list(self._entries.keys())
+    
+    def is_stale(self, source_folder):
+        """Check if source_folder changed since the bundle was built (one stat, independent of file count)"""
+        # Adds, removals and atomic saves (temp file + rename, as the editor does) all touch the
+        # folder; a file rewritten in place without touching the folder needs a manual rebuild
+        try:
+            return os.stat(source_folder).st_mtime_ns != self.source_mtime_ns
+        except FileNotFoundError:
+            return False
+    
+    def get_dialogue(self, name):
+        """Get one dialogue file's data, decoding it on first access"""
+        if name in self._decoded:
+            return self._decoded[name]
+        
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        
+        dialogue_data, _ = self._decode_value(entry[2])
+        self._decoded[name] = dialogue_data
+        return dialogue_data
+    
+    def get_character_dialogues(self, character_name, scene_name=None):
+        """Get dialogue sets for a character, decoding only the matching ones"""
+        matching_dialogues = []
+        for name in self._by_character.get(character_name.lower(), []):
+            if scene_name is None or self._entries[name][1] == scene_name:
+                matching_dialogues.append(self.get_dialogue(name))
+        return matching_dialogues
+    
+    def get_decoded_count(self):
+        """Number of dialogue sets decoded so far"""
+        return len(self._decoded)
+    
+    def _string(self, string_id):
+        """Decode an interned string on first use"""
+        text = self._string_cache.get(string_id)
+        if text is None:
+            start, end = struct.unpack_from("<II", self._data, self._string_offsets_at + string_id * 4)
+            blob = self._string_blob_at
+            text = self._data[blob + start:blob + end].decode('utf-8')
+            self._string_cache[string_id] = text
+        return text
+    
+    def _decode_value(self, offset):
+        """Decode one tagged value, returning (value, next offset)"""
+        data = self._data
+        tag = data[offset]
+        offset += 1
+        
+        if tag == TAG_STRING:
+            return self._string(struct.unpack_from("<I", data, offset)[0]), offset + 4
+        elif tag == TAG_DICT:
+            count = struct.unpack_from("<I", data, offset)[0]
+            offset += 4
+            result = {}
+            for _ in range(count):
+                key = self._string(struct.unpack_from("<I", data, offset)[0])
+                result[key], offset = self._decode_value(offset + 4)
+            return result, offset
+        elif tag == TAG_LIST:
+            count = struct.unpack_from("<I", data, offset)[0]
+            offset += 4
+            result = []
+            for _ in range(count):
+                item, offset = self._decode_value(offset)
+                result.append(item)
+            return result, offset
+        elif tag == TAG_INT:
+            return struct.unpack_from("<q", data, offset)[0], offset + 8
+        elif tag == TAG_FLOAT:
+            return struct.unpack_from("<d", data, offset)[0], offset + 8
+        elif tag == TAG_TRUE:
+            return True, offset
+        elif tag == TAG_FALSE:
+            return False, offset
+        elif tag == TAG_NONE:
+            return None, offset
+        
+        raise ValueError(f"Corrupt dialogue bundle: unknown tag {tag} at {offset - 1}")
+
+
+def build_dialogue_bundle(source_folder="data/dialogues/", output_path=DIALOGUE_BUNDLE_PATH):
+    """Compile all dialogue files in source_folder into one bundle"""
+    builder = DialogueBundleBuilder()
+    added = builder.add_folder(source_folder)
+    builder.write(output_path)
+    print(f"📦 Packed {added} dialogue files ({len(builder.strings)} unique strings) into {output_path}", file=sys.stderr)
+    return output_path
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        build_dialogue_bundle(sys.argv[1], sys.argv[2])
+    else:
+        build_dialogue_bundle()
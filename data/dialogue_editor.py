@@ -7,7 +7,30 @@ Easy system for editing and adding dialogue
 
 import json
 import os
-from datetime import datetime
+from data.dialogue_backups import DialogueBackupStore
+from managers.io_service import get_io_service
+from managers.game_log import get_logger
+
+logger = get_logger("dialogue_editor")
+
+DIALOGUE_FOLDER = "data/dialogues/"
+
+
+def load_dialogue_lines(name, fallback=(), data_folder=DIALOGUE_FOLDER):
+    """Get a dialogue file's lines as {"id", "text"} dicts (fallback if the file is missing or unreadable)"""
+    filepath = os.path.join(data_folder, f"{name}.json")
+    try:
+        get_io_service().flush(filepath)
+        with open(filepath, 'r') as f:
+            dialogues = json.load(f).get("dialogues", [])
+        lines = [{"id": dialogue["id"], "text": dialogue["text"]} for dialogue in dialogues]
+    except FileNotFoundError:
+        return list(fallback)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read dialogue lines from {name}: {e}")
+        return list(fallback)
+    return lines or list(fallback)
+
 
 class DialogueEditor:
     """
@@ -17,17 +40,18 @@ class DialogueEditor:
     
     def __init__(self):
         """Initialize dialogue editor"""
-        self.data_folder = "data/dialogues/"
+        self.data_folder = DIALOGUE_FOLDER
         self.backup_folder = "data/dialogues/backups/"
         
         # Create directories
         os.makedirs(self.data_folder, exist_ok=True)
         os.makedirs(self.backup_folder, exist_ok=True)
+        self.backups = DialogueBackupStore(self.backup_folder)
         
         # Initialize default dialogues
         self._create_default_dialogues()
         
-        print("💬 Dialogue Editor initialized")
+        logger.info("💬 Dialogue Editor initialized")
     
     def _create_default_dialogues(self):
         """Create default dialogue files"""
@@ -112,6 +136,84 @@ class DialogueEditor:
                 ]
             },
             
+            "misato_nerv_arrival": {
+                "character": "Misato Katsuragi",
+                "scene": "nerv_arrival",
+                "mood": "serious",
+                "dialogues": [
+                    {
+                        "id": "nerv_welcome",
+                        "text": "Welcome to NERV, Shinji.",
+                        "conditions": {},
+                        "effects": {}
+                    },
+                    {
+                        "id": "nerv_fight_angels",
+                        "text": "This is where we fight the Angels.",
+                        "conditions": {},
+                        "effects": {}
+                    },
+                    {
+                        "id": "nerv_ready_briefing",
+                        "text": "Are you ready for your first briefing?",
+                        "conditions": {},
+                        "effects": {}
+                    }
+                ]
+            },
+            
+            "maya_nerv_arrival": {
+                "character": "Maya Ibuki",
+                "scene": "nerv_arrival",
+                "mood": "friendly",
+                "dialogues": [
+                    {
+                        "id": "eva_machines",
+                        "text": "The EVA units are incredible machines.",
+                        "conditions": {},
+                        "effects": {}
+                    },
+                    {
+                        "id": "sync_compatibility",
+                        "text": "Your sync rate will determine compatibility.",
+                        "conditions": {},
+                        "effects": {}
+                    },
+                    {
+                        "id": "pilot_good_luck",
+                        "text": "Good luck, pilot!",
+                        "conditions": {},
+                        "effects": {}
+                    }
+                ]
+            },
+            
+            "ritsuko_nerv_arrival": {
+                "character": "Dr. Ritsuko Akagi",
+                "scene": "nerv_arrival",
+                "mood": "analytical",
+                "dialogues": [
+                    {
+                        "id": "eva_science",
+                        "text": "The science behind EVA is complex.",
+                        "conditions": {},
+                        "effects": {}
+                    },
+                    {
+                        "id": "eva_understanding",
+                        "text": "But you don't need to understand it all.",
+                        "conditions": {},
+                        "effects": {}
+                    },
+                    {
+                        "id": "focus_on_sync",
+                        "text": "Just focus on syncing with your unit.",
+                        "conditions": {},
+                        "effects": {}
+                    }
+                ]
+            },
+            
             "ritsuko_hub": {
                 "character": "Dr. Ritsuko Akagi",
                 "scene": "hub",
@@ -206,13 +308,11 @@ class DialogueEditor:
         }
         
         template_path = os.path.join(self.data_folder, "TEMPLATE.json")
-        with open(template_path, 'w') as f:
-            json.dump(template, f, indent=4)
+        get_io_service().write_json(template_path, template)
         
         # Create README
         readme_path = os.path.join(self.data_folder, "README.txt")
-        with open(readme_path, 'w') as f:
-            f.write("""
+        get_io_service().write(readme_path, """
 DIALOGUE EDITING GUIDE
 =====================
 
@@ -260,43 +360,75 @@ EASY EDITING TIPS:
     
     def save_dialogue(self, filename, dialogue_data):
         """Save dialogue data to file"""
-        # Create backup
-        self._create_backup(filename)
-        
-        # Save new version
         filepath = os.path.join(self.data_folder, f"{filename}.json")
         try:
-            with open(filepath, 'w') as f:
-                json.dump(dialogue_data, f, indent=4)
-            print(f"💾 Saved dialogue: {filename}")
+            content = json.dumps(dialogue_data, indent=4).encode('utf-8')
+            
+            # Record the version (unchanged content adds nothing)
+            self._create_backup(filename, content)
+            
+            # Save new version (written in the background)
+            get_io_service().write(filepath, content,
+                                   callback=lambda error: self._on_dialogue_saved(filename, error))
         except Exception as e:
-            print(f"❌ Failed to save dialogue {filename}: {e}")
+            logger.error(f"❌ Failed to save dialogue {filename}: {e}")
+    
+    def _on_dialogue_saved(self, filename, error):
+        """Report a finished dialogue write"""
+        if error:
+            logger.error(f"❌ Failed to save dialogue {filename}: {error}")
+        else:
+            logger.info(f"💾 Saved dialogue: {filename}")
     
     def load_dialogue(self, filename):
         """Load dialogue data from file"""
         filepath = os.path.join(self.data_folder, f"{filename}.json")
         try:
+            get_io_service().flush(filepath)
             with open(filepath, 'r') as f:
                 return json.load(f)
         except Exception as e:
-            print(f"❌ Failed to load dialogue {filename}: {e}")
+            logger.error(f"❌ Failed to load dialogue {filename}: {e}")
             return None
     
-    def _create_backup(self, filename):
-        """Create backup of existing dialogue file"""
-        filepath = os.path.join(self.data_folder, f"{filename}.json")
-        if os.path.exists(filepath):
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = os.path.join(self.backup_folder, f"{filename}_{timestamp}.json")
-            try:
-                import shutil
-                shutil.copy2(filepath, backup_path)
-            except Exception as e:
-                print(f"⚠️ Backup failed for {filename}: {e}")
+    def _create_backup(self, filename, content):
+        """Add content to the dialogue's backup history"""
+        try:
+            if not self.backups.get_versions(filename):
+                # First save with history: keep the file already on disk (hand edits, older saves)
+                filepath = os.path.join(self.data_folder, f"{filename}.json")
+                get_io_service().flush(filepath)
+                if os.path.exists(filepath):
+                    with open(filepath, 'rb') as f:
+                        self.backups.backup(filename, f.read())
+            self.backups.backup(filename, content)
+        except Exception as e:
+            logger.warning(f"⚠️ Backup failed for {filename}: {e}")
+    
+    def get_backup_versions(self, filename):
+        """Get a dialogue's backed-up versions, oldest first"""
+        return self.backups.get_versions(filename)
+    
+    def restore_dialogue(self, filename, version=None):
+        """Save a backed-up version (newest by default) as the current dialogue"""
+        try:
+            dialogue_data = self.backups.restore(filename, version)
+        except Exception as e:
+            logger.error(f"❌ Failed to restore dialogue {filename}: {e}")
+            return False
+        
+        if dialogue_data is None:
+            logger.warning(f"⚠️ No backup version {version} for dialogue {filename}")
+            return False
+        
+        self.save_dialogue(filename, dialogue_data)
+        logger.info(f"⏪ Restored dialogue {filename}")
+        return True
     
     def get_all_dialogues(self):
         """Get all available dialogue files"""
         dialogues = {}
+        get_io_service().flush()
         if os.path.exists(self.data_folder):
             for filename in os.listdir(self.data_folder):
                 if filename.endswith('.json') and filename != 'TEMPLATE.json':
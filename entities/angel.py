@@ -8,6 +8,7 @@ Angel enemies with custom art integration
 import pygame
 import math
 from config import COLORS
+from graphics.transform_cache import get_transform_cache
 
 class Angel:
     """
@@ -49,6 +50,8 @@ class Angel:
         # Animation
         self.animation_timer = 0
         self.pulse_intensity = 0
+        self.pulse_surface = None       # Red tint, built once; its alpha follows the pulse
+        self.transforms = get_transform_cache()
         
         # Attack
         self.last_attack_time = 0
@@ -76,16 +79,17 @@ class Angel:
             
             if angel_sprite:
                 # Scale sprite to Angel size
-                sprite_scaled = pygame.transform.scale(angel_sprite, (self.width, self.height))
+                sprite_scaled = self.transforms.scale(angel_sprite, (self.width, self.height))
                 sprite_rect = sprite_scaled.get_rect(center=(self.x, self.y))
                 screen.blit(sprite_scaled, sprite_rect)
                 
                 # Add pulsing effect overlay
                 if self.pulse_intensity > 0.7:
-                    pulse_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                    pulse_alpha = int((self.pulse_intensity - 0.7) * 200)
-                    pulse_surface.fill((255, 100, 100, pulse_alpha))
-                    screen.blit(pulse_surface, sprite_rect.topleft)
+                    if self.pulse_surface is None:
+                        self.pulse_surface = pygame.Surface((self.width, self.height))
+                        self.pulse_surface.fill((255, 100, 100))
+                    self.pulse_surface.set_alpha(int((self.pulse_intensity - 0.7) * 200))
+                    screen.blit(self.pulse_surface, sprite_rect.topleft)
                 
                 # AT Field effect
                 if self.at_field_active:
@@ -106,7 +110,7 @@ class Angel:
             if at_field_effect:
                 # Scale and position AT Field effect
                 field_size = int(self.width * 1.5)
-                at_field_scaled = pygame.transform.scale(at_field_effect, (field_size, field_size))
+                at_field_scaled = self.transforms.scale(at_field_effect, (field_size, field_size))
                 
                 # Add pulsing alpha
                 alpha = int(100 + 50 * self.pulse_intensity)
@@ -0,0 +1,152 @@
+"""
+===============================
+ANGEL AI
+===============================
+Cooldown-driven Angel behaviour on a fixed AI tick
+
+FEATURES:
+- ✅ Per-Angel state machine: idle -> windup -> attack -> recover
+- ✅ Behaviour profiles for Sachiel, Shamshel, Ramiel and the tutorial Angel
+- ✅ Attacks come from cooldown timers, not per-frame probabilities
+- ✅ Fixed-rate scheduler (AI_TICK_RATE) independent of the render frame rate
+- ✅ Windup state exposed so scenes can telegraph incoming attacks
+"""
+
+import random
+
+try:
+    from config import AI_TICK_RATE
+except ImportError:
+    AI_TICK_RATE = 15
+
+# Angel type -> behaviour tuning (times in seconds)
+ANGEL_PROFILES = {
+    # Quick single strikes that speed up once badly hurt
+    "sachiel": {"cooldown": 2.5, "windup": 0.5, "hits": 1, "hit_interval": 0.0, "damage": (10, 20),
+                "recover": 0.6, "enrage_below": 0.5, "enrage_speed": 1.4},
+    # Whip combos: several light hits in a row
+    "shamshel": {"cooldown": 3.5, "windup": 0.4, "hits": 3, "hit_interval": 0.35, "damage": (4, 8),
+                 "recover": 0.8, "enrage_below": 0.3, "enrage_speed": 1.25},
+    # Long, obvious charge into one devastating beam
+    "ramiel": {"cooldown": 6.0, "windup": 1.5, "hits": 1, "hit_interval": 0.0, "damage": (25, 35),
+               "recover": 1.2, "enrage_below": 0.0, "enrage_speed": 1.0},
+    # Slow and clearly telegraphed so new pilots can practise parrying
+    "tutorial": {"cooldown": 4.0, "windup": 1.0, "hits": 1, "hit_interval": 0.0, "damage": (10, 10),
+                 "recover": 1.0, "enrage_below": 0.0, "enrage_speed": 1.0}
+}
+
+
+def get_angel_profile(angel_name):
+    """Get the behaviour profile for an Angel name (unknown Angels fight like Sachiel)"""
+    name = angel_name.lower()
+    if "tutorial" in name:
+        return ANGEL_PROFILES["tutorial"]
+    return ANGEL_PROFILES.get(name, ANGEL_PROFILES["sachiel"])
+
+
+class AngelBrain:
+    """
+    ANGEL BRAIN
+    State machine for one Angel; calls on_attack(damage) for every hit it lands
+    """
+    
+    def __init__(self, angel_name, on_attack, rng=None):
+        """Initialize brain from the Angel's profile"""
+        self.angel_name = angel_name
+        self.profile = get_angel_profile(angel_name)
+        self.on_attack = on_attack
+        self.rng = rng or random.Random()   # Pass the scene RNG so replays stay in sync
+        
+        # === STATE ===
+        self.active = False
+        self.state = "idle"
+        self.state_time = 0.0
+        self.cooldown_left = self.profile["cooldown"] * 0.5    # First attack comes a little sooner
+        self.hits_left = 0
+        self.next_hit = 0.0
+        self.health_ratio = 1.0
+    
+    def set_health_ratio(self, ratio):
+        """Tell the brain how hurt its Angel is (drives enrage)"""
+        self.health_ratio = max(0.0, min(1.0, ratio))
+    
+    def is_winding_up(self):
+        """Check if an attack is being telegraphed"""
+        return self.active and self.state == "windup"
+    
+    def _enter(self, state):
+        """Switch state"""
+        self.state = state
+        self.state_time = 0.0
+    
+    def tick(self, step):
+        """Advance the state machine by one fixed AI step"""
+        if not self.active:
+            return
+        
+        profile = self.profile
+        if self.health_ratio < profile["enrage_below"]:
+            step *= profile["enrage_speed"]
+        self.state_time += step
+        
+        if self.state == "idle":
+            self.cooldown_left -= step
+            if self.cooldown_left <= 0:
+                self._enter("windup")
+        
+        elif self.state == "windup":
+            if self.state_time >= profile["windup"]:
+                self._enter("attack")
+                self.hits_left = profile["hits"]
+                self.next_hit = 0.0
+        
+        elif self.state == "attack":
+            self.next_hit -= step
+            if self.next_hit <= 0:
+                self.hits_left -= 1
+                self.next_hit = profile["hit_interval"]
+                self.on_attack(self.rng.randint(*profile["damage"]))
+                if self.hits_left <= 0:
+                    self._enter("recover")
+        
+        elif self.state == "recover":
+            if self.state_time >= profile["recover"]:
+                self._enter("idle")
+                # Slight jitter keeps the rhythm from feeling mechanical
+                self.cooldown_left = profile["cooldown"] * self.rng.uniform(0.85, 1.15)
+
+
+class AIScheduler:
+    """
+    AI SCHEDULER
+    Ticks registered brains at a fixed rate, however fast the game renders
+    """
+    
+    def __init__(self, tick_rate=AI_TICK_RATE, max_steps=5):
+        """Initialize fixed-step accumulator"""
+        self.step = 1.0 / tick_rate
+        self.max_steps = max_steps      # Caps catch-up work after a long frame
+        self.accumulator = 0.0
+        self.brains = []
+    
+    def add(self, brain):
+        """Register a brain"""
+        self.brains.append(brain)
+        return brain
+    
+    def remove(self, brain):
+        """Unregister a brain"""
+        if brain in self.brains:
+            self.brains.remove(brain)
+    
+    def update(self, dt):
+        """Run as many fixed AI steps as the elapsed time allows"""
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps:
+            self.accumulator -= self.step
+            steps += 1
+            for brain in self.brains:
+                brain.tick(self.step)
+        if steps == self.max_steps:
+            self.accumulator = min(self.accumulator, self.step)
@@ -0,0 +1,123 @@
+"""
+===============================
+BATTLE CORE
+===============================
+Display-free EVA vs Angel battle rules
+
+FEATURES:
+- ✅ Health, AT field and sync ratio rules shared by the scene and the simulator
+- ✅ Angel attacks from the fixed-tick Angel AI
+- ✅ Seeded RNG only (no pygame), so fights run headless and replay exactly
+- ✅ Events queued for the presentation layer (explosions, hits)
+"""
+
+import random
+
+from entities.angel_ai import AngelBrain, AIScheduler
+
+# Battle tuning
+APPROACH_TIME = 3.0                 # Seconds before combat starts
+ATTACK_DAMAGE = (15, 25)
+SPECIAL_DAMAGE = (30, 40)
+SPECIAL_SYNC_COST = 20
+SPECIAL_SYNC_REQUIRED = 80
+AT_FIELD_SYNC_GAIN = 5
+START_SYNC_RATIO = 75.0
+
+
+class BattleCore:
+    """
+    BATTLE CORE
+    One fight's state and rules; phase is approach, combat, victory or defeat
+    """
+    
+    def __init__(self, angel_name, rng=None):
+        """Initialize fight state and the Angel's AI"""
+        self.angel_name = angel_name
+        self.rng = rng or random.Random()
+        
+        # === BATTLE STATE ===
+        self.phase = "approach"
+        self.elapsed = 0.0
+        self.combat_time = 0.0
+        self.eva_health = 100
+        self.angel_health = 100
+        self.sync_ratio = START_SYNC_RATIO
+        self.at_field_active = False
+        self.events = []                # (event name, value) for the presentation layer
+        
+        # === ANGEL AI ===
+        self.ai_scheduler = AIScheduler()
+        self.angel_brain = self.ai_scheduler.add(AngelBrain(angel_name, self._angel_attack, self.rng))
+    
+    # === PLAYER ACTIONS ===
+    
+    def player_attack(self):
+        """Standard attack (combat only)"""
+        if self.phase != "combat":
+            return False
+        self._damage_angel(self.rng.randint(*ATTACK_DAMAGE), "attack")
+        return True
+    
+    def activate_at_field(self):
+        """Raise the AT field (blocks the next Angel hit, builds sync)"""
+        self.at_field_active = True
+        self.sync_ratio = min(100, self.sync_ratio + AT_FIELD_SYNC_GAIN)
+        return True
+    
+    def special_attack(self):
+        """Heavy attack paid for with sync ratio"""
+        if self.phase != "combat" or self.sync_ratio < SPECIAL_SYNC_REQUIRED:
+            return False
+        self.sync_ratio -= SPECIAL_SYNC_COST
+        self._damage_angel(self.rng.randint(*SPECIAL_DAMAGE), "special")
+        return True
+    
+    def retreat(self):
+        """Emergency exit"""
+        self.phase = "defeat"
+    
+    def _damage_angel(self, damage, source):
+        """Apply player damage to the Angel"""
+        self.angel_health = max(0, self.angel_health - damage)
+        self.angel_brain.set_health_ratio(self.angel_health / 100)
+        self.events.append((source, damage))
+        if self.angel_health <= 0:
+            self.phase = "victory"
+    
+    # === ANGEL ===
+    
+    def _angel_attack(self, damage):
+        """Angel hit from the AI (the AT field absorbs one hit and drops)"""
+        if self.at_field_active:
+            self.at_field_active = False
+            self.events.append(("blocked", damage))
+            return
+        
+        self.eva_health = max(0, self.eva_health - damage)
+        self.events.append(("hit", damage))
+        if self.eva_health <= 0:
+            self.phase = "defeat"
+    
+    # === UPDATE ===
+    
+    def update(self, dt):
+        """Advance phase timers and the Angel AI"""
+        self.elapsed += dt
+        if self.phase == "approach" and self.elapsed > APPROACH_TIME:
+            self.phase = "combat"
+        if self.phase == "combat":
+            self.combat_time += dt
+        
+        self.angel_brain.active = self.phase == "combat"
+        self.ai_scheduler.update(dt)
+    
+    def pop_events(self):
+        """Take the events queued since the last call"""
+        events = self.events
+        self.events = []
+        return events
+    
+    def is_over(self):
+        """Check if the fight has been decided"""
+        return self.phase in ("victory", "defeat")
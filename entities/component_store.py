@@ -0,0 +1,201 @@
+"""
+===============================
+ENTITY COMPONENT STORE
+===============================
+Array-backed components for crowds, projectiles and effects
+
+FEATURES:
+- ✅ Entities are rows in contiguous NumPy component columns
+- ✅ Standard position, velocity, timer and sprite id columns (plus scene-defined ones)
+- ✅ Systems update whole columns at once (no per-entity Python loops)
+- ✅ Expired entities removed in one compaction pass (no list.remove while iterating)
+- ✅ Pure Python fallback when NumPy is not installed
+"""
+
+import math
+from managers.game_log import get_logger
+
+logger = get_logger("component_store")
+
+try:
+    import numpy as np
+except ImportError:
+    logger.warning("⚠️ NumPy not available, entity components use the slower fallback")
+    np = None
+
+# Column name -> (values per entity, integer column, default)
+DEFAULT_COLUMNS = {
+    "position": (2, False, 0.0),
+    "velocity": (2, False, 0.0),
+    "timer": (1, False, math.inf),      # Seconds left; inf never expires
+    "sprite": (1, True, 0)              # Index into the scene's sprite list
+}
+
+
+class ComponentStore:
+    """
+    COMPONENT STORE
+    Parallel component columns; live entities are always the first `count` rows
+    """
+    
+    def __init__(self, columns=None, capacity=64):
+        """Initialize columns (columns maps extra names to a width or (width, integer, default))"""
+        self.capacity = capacity
+        self.count = 0
+        self.specs = dict(DEFAULT_COLUMNS)
+        for name, spec in (columns or {}).items():
+            self.specs[name] = (spec, False, 0.0) if isinstance(spec, int) else spec
+        
+        # === COLUMNS ===
+        self.columns = {name: self._new_column(name, capacity) for name in self.specs}
+        self.payloads = []              # Per-row Python objects (names, dialogue, callbacks)
+        
+        # === ENTITY IDS ===
+        self.entity_ids = []            # Row -> entity id
+        self.next_id = 1
+    
+    def _new_column(self, name, capacity):
+        """Allocate one column filled with its default"""
+        width, integer, default = self.specs[name]
+        if np is None:
+            return []
+        shape = (capacity, width) if width > 1 else (capacity,)
+        return np.full(shape, default, dtype=np.int32 if integer else np.float64)
+    
+    def __len__(self):
+        """Number of live entities"""
+        return self.count
+    
+    # === ENTITIES ===
+    
+    def spawn(self, payload=None, **values):
+        """Add an entity (unset components take their column default) and return its id"""
+        if np is not None and self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        
+        row = self.count
+        for name, column in self.columns.items():
+            width, integer, default = self.specs[name]
+            value = values.get(name, default)
+            if np is None:
+                if width > 1:
+                    value = list(value) if isinstance(value, (list, tuple)) else [value] * width
+                column.append(value)
+            else:
+                column[row] = value
+        
+        entity_id = self.next_id
+        self.next_id += 1
+        self.entity_ids.append(entity_id)
+        self.payloads.append(payload)
+        self.count += 1
+        return entity_id
+    
+    def despawn(self, entity_id):
+        """Remove one entity by id"""
+        if entity_id in self.entity_ids:
+            keep = [other != entity_id for other in self.entity_ids]
+            self.remove_rows(np.array(keep) if np is not None else keep, keep_mask=True)
+    
+    def remove_rows(self, mask, keep_mask=False):
+        """Remove every row where mask is true (or false, with keep_mask), keeping row order"""
+        keep = mask if keep_mask else (~mask if np is not None else [not remove for remove in mask])
+        if np is not None:
+            kept = int(np.count_nonzero(keep))
+            if kept == self.count:
+                return 0
+            for name, column in self.columns.items():
+                column[:kept] = column[:self.count][keep]
+            self._reset_rows(kept, self.count)
+        else:
+            kept = sum(1 for flag in keep if flag)
+            if kept == self.count:
+                return 0
+            for name in self.columns:
+                self.columns[name] = [value for value, flag in zip(self.columns[name], keep) if flag]
+        
+        removed = self.count - kept
+        self.entity_ids = [entity_id for entity_id, flag in zip(self.entity_ids, keep) if flag]
+        self.payloads = [payload for payload, flag in zip(self.payloads, keep) if flag]
+        self.count = kept
+        return removed
+    
+    def clear(self):
+        """Remove every entity"""
+        if np is not None:
+            self._reset_rows(0, self.count)
+        else:
+            self.columns = {name: [] for name in self.columns}
+        self.entity_ids = []
+        self.payloads = []
+        self.count = 0
+    
+    def _reset_rows(self, start, end):
+        """Put freed rows back to their defaults"""
+        for name, column in self.columns.items():
+            column[start:end] = self.specs[name][2]
+    
+    def _grow(self, capacity):
+        """Reallocate every column with room for more rows"""
+        for name, column in self.columns.items():
+            grown = self._new_column(name, capacity)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+        self.capacity = capacity
+    
+    # === ACCESS ===
+    
+    def column(self, name):
+        """Live rows of a column (a NumPy view: writes go straight into the store)"""
+        column = self.columns[name]
+        return column[:self.count] if np is not None else column
+    
+    def row_of(self, entity_id):
+        """Get the current row of an entity (None if it was removed)"""
+        try:
+            return self.entity_ids.index(entity_id)
+        except ValueError:
+            return None
+    
+    def rows(self, *names):
+        """Iterate (payload, values...) per live entity, for rendering"""
+        columns = [self.column(name) for name in names]
+        if np is not None:
+            columns = [column.tolist() for column in columns]
+        return zip(self.payloads, *columns)
+
+
+# === SYSTEMS ===
+
+def integrate(store, value_name, rate_name, dt):
+    """Advance a column by its rate column (position by velocity, size by growth, ...)"""
+    if np is not None:
+        store.column(value_name)[:] += store.column(rate_name) * dt
+        return
+    
+    width = store.specs[value_name][0]
+    values = store.column(value_name)
+    rates = store.column(rate_name)
+    for row in range(store.count):
+        if width > 1:
+            values[row] = [value + rate * dt for value, rate in zip(values[row], rates[row])]
+        else:
+            values[row] += rates[row] * dt
+
+
+def move(store, dt):
+    """Movement system: position += velocity * dt"""
+    integrate(store, "position", "velocity", dt)
+
+
+def expire(store, dt):
+    """Timer system: count timers down and remove entities whose time ran out"""
+    if np is not None:
+        timers = store.column("timer")
+        timers -= dt
+        return store.remove_rows(timers <= 0)
+    
+    timers = store.column("timer")
+    for row in range(store.count):
+        timers[row] -= dt
+    return store.remove_rows([timer <= 0 for timer in timers])
@@ -7,6 +7,9 @@ Advanced player with all enhanced features
 
 import pygame
 import math
+from managers.game_log import get_logger
+
+logger = get_logger("player")
 
 # Add proper imports for screen dimensions
 try:
@@ -47,6 +50,10 @@ class EnhancedPlayer:
         self.facing_direction = "down"
         self.last_move_time = 0
         
+        # === PATH FOLLOWING (click-to-move) ===
+        self.nav_goal = None
+        self.nav_path = None
+        
         # === ANIMATION SYSTEM ===
         self.animation_timer = 0
         self.animation_frame = 0
@@ -76,7 +83,7 @@ class EnhancedPlayer:
         self.interaction_highlight = False
         self.highlight_timer = 0
         
-        print("👤 Enhanced Player initialized")
+        logger.info("👤 Enhanced Player initialized")
     
     def handle_event(self, event):
         """Handle player input events"""
@@ -337,6 +344,12 @@ class EnhancedPlayer:
         """Get current position"""
         return (self.x, self.y)
     
+    def get_movement_bounds(self):
+        """Get the rect the player's position is kept inside"""
+        return pygame.Rect(self.boundary_padding, self.boundary_padding,
+                           self.hud_boundary_x - self.width - 2 * self.boundary_padding + 1,
+                           SCREEN_HEIGHT - self.height - 2 * self.boundary_padding + 1)
+    
     def get_center_position(self):
         """Get center position"""
         return (self.x + self.width // 2, self.y + self.height // 2)
@@ -383,8 +396,28 @@ class EnhancedPlayer:
         self.velocity_y = 0
         self.moving = False
     
-    def move_to_position(self, target_x, target_y, dt):
-        """Move player toward target position (for mouse movement)"""
+    def move_to_position(self, target_x, target_y, dt, navigator=None):
+        """Move player toward target position (for mouse movement), around obstacles if a navigator is given"""
+        if navigator is not None:
+            if self.nav_goal != (target_x, target_y):
+                self.nav_goal = (target_x, target_y)
+                self.nav_path = None
+            
+            if self.nav_path is None:
+                path = navigator.find_path((self.x, self.y), self.nav_goal)
+                if path is None:
+                    return False    # Search continues next frame
+                if not path:
+                    self.nav_goal = None
+                    return True     # Unreachable: stop here
+                self.nav_path = path
+            
+            # Steer toward the next waypoint; only the last one ends the move
+            target_x, target_y = self.nav_path[0]
+            if len(self.nav_path) > 1 and math.hypot(target_x - self.x, target_y - self.y) < 5.0:
+                self.nav_path.pop(0)
+                target_x, target_y = self.nav_path[0]
+        
         # Calculate distance to target
         dx = target_x - self.x
         dy = target_y - self.y
@@ -392,6 +425,8 @@ class EnhancedPlayer:
         
         # Check if we've reached the target
         if distance < 5.0:  # Close enough threshold
+            self.nav_goal = None
+            self.nav_path = None
             return True
         
         # Normalize direction and apply movement
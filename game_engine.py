@@ -14,9 +14,17 @@ Features Managed:
 
 import pygame
 import sys
+import shutil
+import tempfile
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE, DEBUG_MODE
 from managers.game_manager import GameManager
 from managers.scene_manager import SceneManager
+from managers.io_service import get_io_service
+from graphics.render_queue import get_render_queue
+from assets.surface_registry import get_surface_registry
+from managers.game_log import get_logger, set_log_context
+
+logger = get_logger("game_engine")
 
 class GameEngine:
     """
@@ -24,9 +32,14 @@ class GameEngine:
     Manages all core game systems and the main loop
     """
     
-    def __init__(self):
+    def __init__(self, input_recorder=None, input_replay=None):
         """Initialize game engine with all systems"""
-        print("🎮 Initializing Game Engine...")
+        logger.info("🎮 Initializing Game Engine...")
+        
+        # === INPUT RECORDING / REPLAY ===
+        self.input_recorder = input_recorder
+        self.input_replay = input_replay
+        self.frame_dt = 0.0
         
         # === DISPLAY SETUP ===
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -38,25 +51,42 @@ class GameEngine:
         # === TIMING AND PERFORMANCE ===
         self.clock = pygame.time.Clock()
         self.running = True
+        self.frame_number = 0
         self.performance_stats = {
             'fps': 0,
             'frame_time': 0,
             'update_time': 0,
-            'render_time': 0
+            'render_time': 0,
+            'draw_calls': 0,
+            'draw_commands': 0,
+            'culled': 0
         }
+        self.render_queue = get_render_queue()
+        self.io_service = get_io_service()
+        self.surface_registry = get_surface_registry()
         
         # === CORE MANAGERS ===
-        self.game_manager = GameManager()
+        if input_replay:
+            # Replays save into a throwaway folder so real saves and read history stay untouched
+            self.replay_save_directory = tempfile.mkdtemp(prefix="eva_replay_")
+            self.game_manager = GameManager(input_replay.session_seed, self.replay_save_directory)
+            self.game_manager.auto_save_enabled = False
+        else:
+            self.replay_save_directory = None
+            self.game_manager = GameManager()
+        if input_recorder:
+            input_recorder.start(self.game_manager.session_seed)
+        self.game_manager.replay_log = input_recorder or input_replay
         self.scene_manager = SceneManager(self.game_manager)
         
         # Link scene_manager to game_manager
         self.game_manager.scene_manager = self.scene_manager
-        print("🔗 Scene manager linked to game manager")
+        logger.info("🔗 Scene manager linked to game manager")
         
         # === START WITH MAIN MENU ===
         self.scene_manager.change_scene("main_menu")
         
-        print("✅ Game Engine initialized successfully")
+        logger.info("✅ Game Engine initialized successfully")
     
     def _set_game_icon(self):
         """Set game window icon"""
@@ -68,19 +98,23 @@ class GameEngine:
             pygame.draw.circle(icon, (128, 0, 128), (16, 16), 8)
             pygame.display.set_icon(icon)
         except Exception as e:
-            print(f"⚠️ Could not set game icon: {e}")
+            logger.warning(f"⚠️ Could not set game icon: {e}")
     
     def run(self):
         """
         Main game loop with performance monitoring
         """
-        print("🚀 Starting main game loop")
+        logger.info("🚀 Starting main game loop")
         
         while self.running:
             frame_start = pygame.time.get_ticks()
             
             # Calculate delta time
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = self._next_frame_time()
+            if dt is None:
+                break
+            self.frame_number += 1
+            set_log_context(frame=self.frame_number)
             
             # === HANDLE EVENTS ===
             self._handle_events()
@@ -99,11 +133,35 @@ class GameEngine:
             if DEBUG_MODE:
                 self._update_performance_stats(frame_start, update_time, render_time)
         
-        print("🛑 Main game loop ended")
+        logger.info("🛑 Main game loop ended")
+    
+    def _next_frame_time(self):
+        """Get this frame's delta time (recorded and uncapped when replaying)"""
+        if self.input_replay:
+            self.clock.tick()
+            self.frame_dt = self.input_replay.next_frame()
+        else:
+            self.frame_dt = self.clock.tick(FPS) / 1000.0
+        return self.frame_dt
+    
+    def _get_frame_events(self):
+        """Get this frame's input events (live or replayed)"""
+        if not self.input_replay:
+            events = pygame.event.get()
+        else:
+            # Live input is ignored during replay, except closing the window
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+            events = self.input_replay.get_events()
+        
+        if self.input_recorder:
+            self.input_recorder.record_frame(self.frame_dt, events)
+        return events
     
     def _handle_events(self):
         """Handle all pygame events"""
-        for event in pygame.event.get():
+        for event in self._get_frame_events():
             # === SYSTEM EVENTS ===
             if event.type == pygame.QUIT:
                 self.running = False
@@ -121,7 +179,7 @@ class GameEngine:
             try:
                 self.scene_manager.handle_event(event)
             except Exception as e:
-                print(f"⚠️ Event handling error: {e}")
+                logger.exception(f"⚠️ Event handling error: {e}")
     
     def _update(self, dt):
         """Update all game systems"""
@@ -129,7 +187,10 @@ class GameEngine:
             self.game_manager.update(dt)
             self.scene_manager.update(dt)
         except Exception as e:
-            print(f"⚠️ Update error: {e}")
+            logger.exception(f"⚠️ Update error: {e}")
+        
+        # Outside the try so a failing scene update cannot hold back finished I/O callbacks
+        self.io_service.update()
     
     def _render(self):
         """Render everything to screen"""
@@ -140,6 +201,14 @@ class GameEngine:
             # Render current scene
             self.scene_manager.render(self.screen)
             
+            # Draw-call counts from scenes using the render queue
+            frame_stats = self.render_queue.end_frame()
+            self.performance_stats.update({
+                'draw_calls': frame_stats['draw_calls'],
+                'draw_commands': frame_stats['commands'],
+                'culled': frame_stats['culled']
+            })
+            
             # Debug overlay
             if DEBUG_MODE:
                 self._render_debug_overlay()
@@ -148,7 +217,7 @@ class GameEngine:
             pygame.display.flip()
             
         except Exception as e:
-            print(f"⚠️ Render error: {e}")
+            logger.exception(f"⚠️ Render error: {e}")
             # Emergency fallback rendering
             self.screen.fill((20, 20, 40))
             font = pygame.font.Font(None, 48)
@@ -162,12 +231,12 @@ class GameEngine:
         try:
             if self.screen.get_flags() & pygame.FULLSCREEN:
                 self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                print("🖥️ Switched to windowed mode")
+                logger.info("🖥️ Switched to windowed mode")
             else:
                 self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-                print("🖥️ Switched to fullscreen mode")
+                logger.info("🖥️ Switched to fullscreen mode")
         except Exception as e:
-            print(f"⚠️ Fullscreen toggle error: {e}")
+            logger.warning(f"⚠️ Fullscreen toggle error: {e}")
     
     def _update_performance_stats(self, frame_start, update_time, render_time):
         """Update performance statistics"""
@@ -193,7 +262,10 @@ class GameEngine:
             f"Frame: {self.performance_stats['frame_time']}ms",
             f"Update: {self.performance_stats['update_time']}ms",
             f"Render: {self.performance_stats['render_time']}ms",
-            f"Scene: {self.scene_manager.get_current_scene_name()}"
+            f"Draw calls: {self.performance_stats['draw_calls']} "
+            f"({self.performance_stats['draw_commands']} cmds, {self.performance_stats['culled']} culled)",
+            f"Scene: {self.scene_manager.get_current_scene_name()}",
+            self._format_surface_memory()
         ]
         
         for info in debug_info:
@@ -201,20 +273,37 @@ class GameEngine:
             self.screen.blit(text, (10, y_offset))
             y_offset += 18
     
+    def _format_surface_memory(self):
+        """One overlay line: registered surface and cache memory and the largest owners"""
+        stats = self.surface_registry.get_stats()
+        owners = list(self.surface_registry.get_report().items())[:3]
+        top = ", ".join(f"{owner} {report['bytes'] / (1024 * 1024):.1f}" for owner, report in owners)
+        return (f"Surfaces: {stats['resident_mb']}/{stats['budget_mb']} MB + {stats['cache_mb']} MB cached "
+                f"({top or 'none'}), {stats['evicted']} evicted")
+    
     def _show_debug_info(self):
         """Show detailed debug information"""
-        print("🔍 DEBUG INFO:")
-        print(f"   FPS: {self.performance_stats['fps']:.1f}")
-        print(f"   Scene: {self.scene_manager.get_current_scene_name()}")
-        print(f"   Player Data: Level {self.game_manager.get_player_data().level}")
+        logger.info("🔍 DEBUG INFO", extra={"fields": {
+            "fps": round(self.performance_stats['fps'], 1),
+            "level": self.game_manager.get_player_data().level,
+            "io_pending": self.io_service.get_stats()["pending"],
+            "surface_mb": self.surface_registry.get_stats()["resident_mb"]
+        }})
     
     def shutdown(self):
         """Clean shutdown of all systems"""
         try:
             self.scene_manager.cleanup()
             self.game_manager.cleanup()
-            print("🧹 Game systems cleaned up successfully")
+            self.io_service.flush()
+            if self.input_recorder:
+                self.input_recorder.close()
+            if self.input_replay:
+                self.input_replay.close()
+            if self.replay_save_directory:
+                shutil.rmtree(self.replay_save_directory, ignore_errors=True)
+            logger.info("🧹 Game systems cleaned up successfully")
         except Exception as e:
-            print(f"⚠️ Shutdown error: {e}")
+            logger.warning(f"⚠️ Shutdown error: {e}")
         
         self.running = False
\ No newline at end of file
@@ -7,6 +7,9 @@ Enhanced graphics rendering system
 
 import pygame
 from config import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.game_log import get_logger
+
+logger = get_logger("enhanced_renderer")
 
 class EnhancedRenderer:
     """
@@ -17,7 +20,7 @@ class EnhancedRenderer:
     def __init__(self):
         """Initialize enhanced renderer"""
         self.animation_time = 0
-        print("🎨 Enhanced Renderer initialized")
+        logger.info("🎨 Enhanced Renderer initialized")
     
     def update(self, dt):
         """Update renderer"""
@@ -10,12 +10,26 @@ FEATURES:
 - ⚡ Animated energy fields
 - 🏢 NERV logo integration
 - 🌙 Dynamic lighting effects
+- 🌀 Spinning shapes drawn once and rotated through the transform cache
 """
 
 import pygame
 import math
 import random
 from config import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from graphics.procedural_textures import get_procedural_textures
+from graphics.transform_cache import get_transform_cache
+from assets.surface_registry import get_surface_registry
+from managers.game_log import get_logger
+
+logger = get_logger("main_menu_background")
+
+# Shape type -> (corner count, radius factor, fill color key)
+SHAPE_STYLES = {
+    "octahedron": (8, 0.7, 'EVA_PURPLE'),
+    "hexagon": (6, 0.8, 'HANGAR_BLUE'),
+    "triangle": (3, 1.0, 'NERV_RED')
+}
 
 class MainMenuBackground:
     """
@@ -23,19 +37,22 @@ class MainMenuBackground:
     Animated background with EVA visual elements
     """
     
-    def __init__(self):
+    def __init__(self, rng=None):
         """Initialize animated background"""
         self.time = 0
+        self.rng = rng or random.Random()   # Pass game_manager.get_scene_rng(...) for replays
+        self.transforms = get_transform_cache()
         
         # === ANIMATION PARTICLES ===
         self.particles = []
         self.geometric_shapes = []
         self.energy_fields = []
         
-        # === BACKGROUND LAYERS ===
-        self.background_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.midground_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self.foreground_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        # === BACKGROUND LAYER ===
+        # Everything else is drawn straight to the screen, so one static layer is enough
+        self.surfaces = get_surface_registry()
+        self.background_surface = self.surfaces.register("main_menu", "background",
+                                                         pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
         
         # === INITIALIZE ELEMENTS ===
         self._create_background_layer()
@@ -44,29 +61,14 @@ class MainMenuBackground:
         self._create_energy_fields()
         self._create_floating_particles()
         
-        print("🎨 EVA Main Menu Background initialized")
+        logger.info("🎨 EVA Main Menu Background initialized")
     
     def _create_background_layer(self):
         """Create static background gradient"""
-        # Deep space gradient (night sky over Tokyo-3)
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            
-            # Color transition from dark purple to deep blue
-            r = int(20 + (40 - 20) * ratio)
-            g = int(20 + (30 - 20) * ratio)
-            b = int(50 + (80 - 50) * ratio)
-            
-            color = (r, g, b)
-            pygame.draw.line(self.background_surface, color, (0, y), (SCREEN_WIDTH, y))
-        
-        # Add subtle texture/noise
-        for _ in range(200):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            brightness = random.randint(60, 100)
-            star_color = (brightness, brightness, brightness + 20)
-            pygame.draw.circle(self.background_surface, star_color, (x, y), 1)
+        # Deep space gradient (night sky over Tokyo-3), dark purple to deep blue, with stars
+        sky = get_procedural_textures().starfield((SCREEN_WIDTH, SCREEN_HEIGHT), (20, 20, 50), (40, 30, 80), count=200)
+        # Skyline is drawn on top, so copy the shared texture instead of drawing on it
+        self.background_surface.blit(sky, (0, 0))
     
     def _create_tokyo3_skyline(self):
         """Create Tokyo-3 city silhouette"""
@@ -96,8 +98,8 @@ class MainMenuBackground:
             # Building windows (some lit up)
             for window_y in range(building_rect.top + 10, building_rect.bottom - 10, 15):
                 for window_x in range(building_rect.left + 5, building_rect.right - 5, 12):
-                    if random.random() < 0.3:  # 30% chance of lit window
-                        window_color = random.choice([
+                    if self.rng.random() < 0.3:  # 30% chance of lit window
+                        window_color = self.rng.choice([
                             (100, 150, 200),  # Cool blue
                             (150, 100, 200),  # Purple (NERV color)
                             (200, 150, 100)   # Warm yellow
@@ -128,30 +130,46 @@ class MainMenuBackground:
     
     def _create_geometric_shapes(self):
         """Create floating Angel-inspired geometric shapes"""
-        for _ in range(5):
+        for shape_index in range(5):
             shape = {
-                "type": random.choice(["octahedron", "hexagon", "triangle"]),
-                "x": random.randint(100, SCREEN_WIDTH - 100),
-                "y": random.randint(50, SCREEN_HEIGHT - 200),
-                "size": random.randint(30, 80),
-                "rotation": random.uniform(0, 2 * math.pi),
-                "rotation_speed": random.uniform(-0.5, 0.5),
-                "float_offset": random.uniform(0, 2 * math.pi),
-                "float_amplitude": random.randint(20, 50),
-                "alpha": random.randint(30, 80)
+                "type": self.rng.choice(["octahedron", "hexagon", "triangle"]),
+                "x": self.rng.randint(100, SCREEN_WIDTH - 100),
+                "y": self.rng.randint(50, SCREEN_HEIGHT - 200),
+                "size": self.rng.randint(30, 80),
+                "rotation": self.rng.uniform(0, 2 * math.pi),
+                "rotation_speed": self.rng.uniform(-0.5, 0.5),
+                "float_offset": self.rng.uniform(0, 2 * math.pi),
+                "float_amplitude": self.rng.randint(20, 50),
+                "alpha": self.rng.randint(30, 80)
             }
+            # Kept by the shape (its identity is the transform cache key), so only counted here
+            shape["surface"] = self.surfaces.register("main_menu", f"shape_{shape_index}",
+                                                      self._build_shape_surface(shape["type"], shape["size"]))
             self.geometric_shapes.append(shape)
     
+    def _build_shape_surface(self, shape_type, size):
+        """Draw a shape once, unrotated (rendering rotates it through the transform cache)"""
+        corners, radius_factor, color_key = SHAPE_STYLES[shape_type]
+        shape_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        points = []
+        for i in range(corners):
+            angle = i * 2 * math.pi / corners
+            points.append((size + size * radius_factor * math.cos(angle), size + size * radius_factor * math.sin(angle)))
+        
+        pygame.draw.polygon(shape_surface, COLORS[color_key], points)
+        pygame.draw.polygon(shape_surface, COLORS['TEXT_WHITE'], points, 2)
+        return shape_surface
+    
     def _create_energy_fields(self):
         """Create animated energy field effects"""
         for _ in range(3):
             field = {
-                "x": random.randint(0, SCREEN_WIDTH),
-                "y": random.randint(0, SCREEN_HEIGHT),
-                "radius": random.randint(80, 150),
-                "pulse_phase": random.uniform(0, 2 * math.pi),
-                "pulse_speed": random.uniform(1.0, 3.0),
-                "color": random.choice([
+                "x": self.rng.randint(0, SCREEN_WIDTH),
+                "y": self.rng.randint(0, SCREEN_HEIGHT),
+                "radius": self.rng.randint(80, 150),
+                "pulse_phase": self.rng.uniform(0, 2 * math.pi),
+                "pulse_speed": self.rng.uniform(1.0, 3.0),
+                "color": self.rng.choice([
                     COLORS['EVA_PURPLE'],
                     COLORS['HANGAR_BLUE'],
                     COLORS['NERV_RED']
@@ -163,17 +181,17 @@ class MainMenuBackground:
         """Create floating particle effects"""
         for _ in range(50):
             particle = {
-                "x": random.randint(0, SCREEN_WIDTH),
-                "y": random.randint(0, SCREEN_HEIGHT),
-                "vx": random.uniform(-20, 20),
-                "vy": random.uniform(-30, -10),
-                "size": random.randint(1, 3),
-                "color": random.choice([
+                "x": self.rng.randint(0, SCREEN_WIDTH),
+                "y": self.rng.randint(0, SCREEN_HEIGHT),
+                "vx": self.rng.uniform(-20, 20),
+                "vy": self.rng.uniform(-30, -10),
+                "size": self.rng.randint(1, 3),
+                "color": self.rng.choice([
                     COLORS['TEXT_WHITE'],
                     COLORS['TERMINAL_GREEN'],
                     COLORS['EVA_PURPLE']
                 ]),
-                "life": random.uniform(5, 15),
+                "life": self.rng.uniform(5, 15),
                 "max_life": 0
             }
             particle["max_life"] = particle["life"]
@@ -218,17 +236,17 @@ class MainMenuBackground:
     def _add_new_particle(self):
         """Add a new particle to the system"""
         particle = {
-            "x": random.randint(0, SCREEN_WIDTH),
+            "x": self.rng.randint(0, SCREEN_WIDTH),
             "y": SCREEN_HEIGHT + 10,
-            "vx": random.uniform(-20, 20),
-            "vy": random.uniform(-30, -10),
-            "size": random.randint(1, 3),
-            "color": random.choice([
+            "vx": self.rng.uniform(-20, 20),
+            "vy": self.rng.uniform(-30, -10),
+            "size": self.rng.randint(1, 3),
+            "color": self.rng.choice([
                 COLORS['TEXT_WHITE'],
                 COLORS['TERMINAL_GREEN'],
                 COLORS['EVA_PURPLE']
             ]),
-            "life": random.uniform(5, 15),
+            "life": self.rng.uniform(5, 15),
             "max_life": 0
         }
         particle["max_life"] = particle["life"]
@@ -278,44 +296,10 @@ class MainMenuBackground:
     def _render_geometric_shapes(self, screen):
         """Render floating geometric shapes"""
         for shape in self.geometric_shapes:
-            shape_surface = pygame.Surface((shape["size"] * 2, shape["size"] * 2), pygame.SRCALPHA)
-            center = (shape["size"], shape["size"])
-            
-            if shape["type"] == "octahedron":
-                # Draw diamond/octahedron
-                points = []
-                for i in range(8):
-                    angle = i * math.pi / 4 + shape["rotation"]
-                    x = center[0] + shape["size"] * 0.7 * math.cos(angle)
-                    y = center[1] + shape["size"] * 0.7 * math.sin(angle)
-                    points.append((x, y))
-                
-                pygame.draw.polygon(shape_surface, COLORS['EVA_PURPLE'], points)
-                pygame.draw.polygon(shape_surface, COLORS['TEXT_WHITE'], points, 2)
-            
-            elif shape["type"] == "hexagon":
-                # Draw hexagon
-                points = []
-                for i in range(6):
-                    angle = i * math.pi / 3 + shape["rotation"]
-                    x = center[0] + shape["size"] * 0.8 * math.cos(angle)
-                    y = center[1] + shape["size"] * 0.8 * math.sin(angle)
-                    points.append((x, y))
-                
-                pygame.draw.polygon(shape_surface, COLORS['HANGAR_BLUE'], points)
-                pygame.draw.polygon(shape_surface, COLORS['TEXT_WHITE'], points, 2)
-            
-            elif shape["type"] == "triangle":
-                # Draw triangle
-                points = []
-                for i in range(3):
-                    angle = i * 2 * math.pi / 3 + shape["rotation"]
-                    x = center[0] + shape["size"] * math.cos(angle)
-                    y = center[1] + shape["size"] * math.sin(angle)
-                    points.append((x, y))
-                
-                pygame.draw.polygon(shape_surface, COLORS['NERV_RED'], points)
-                pygame.draw.polygon(shape_surface, COLORS['TEXT_WHITE'], points, 2)
+            # Regular polygons repeat every 360/corners degrees; screen y points down, so negate
+            corners = SHAPE_STYLES[shape["type"]][0]
+            shape_surface = self.transforms.rotozoom(shape["surface"], -math.degrees(shape["rotation"]),
+                                                     symmetry=360 / corners)
             
             # Apply floating position
             float_y = shape["y"] + math.sin(self.time + shape["float_offset"]) * shape["float_amplitude"]
@@ -344,18 +328,8 @@ class MainMenuBackground:
     
     def _render_atmospheric_effects(self, screen):
         """Render atmospheric lighting and effects"""
-        # Subtle vignette effect
-        vignette_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        for i in range(100):
-            alpha = i * 2
-            if alpha > 255:
-                alpha = 255
-            
-            color = (20, 20, 40, alpha)
-            pygame.draw.rect(vignette_surface, color, (i, i, SCREEN_WIDTH - i * 2, SCREEN_HEIGHT - i * 2), 1)
-        
-        vignette_surface.set_alpha(30)
+        # Subtle vignette effect (cached radial falloff instead of 100 rects per frame)
+        vignette_surface = get_procedural_textures().radial_falloff((SCREEN_WIDTH, SCREEN_HEIGHT), (20, 20, 40), 0, 24, 2.0)
         screen.blit(vignette_surface, (0, 0))
         
         # Subtle scan lines effect
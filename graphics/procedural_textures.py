@@ -0,0 +1,226 @@
+"""
+===============================
+PROCEDURAL TEXTURES
+===============================
+Bulk generation of gradients, noise, starfields and radial falloffs
+
+FEATURES:
+- ✅ Whole surfaces built with pygame.surfarray + NumPy (no per-row draw calls)
+- ✅ Pure pygame fallback when NumPy is not installed
+- ✅ Results cached by parameters (built once, blitted every frame)
+- ✅ Seeded noise and starfields so cached textures are reproducible
+"""
+
+import pygame
+import random
+from collections import OrderedDict
+from assets.surface_registry import get_surface_registry, surface_bytes
+from managers.game_log import get_logger
+
+logger = get_logger("procedural_textures")
+
+try:
+    import numpy as np
+except ImportError:
+    logger.warning("⚠️ NumPy not available, procedural textures use the slower fallback")
+    np = None
+
+
+class ProceduralTextures:
+    """
+    PROCEDURAL TEXTURES
+    Parameter-keyed cache of generated background surfaces
+    """
+    
+    def __init__(self, max_entries=48):
+        """Initialize texture cache"""
+        self.max_entries = max_entries
+        self.cache = OrderedDict()      # (kind, params...) -> Surface
+        self.stats = {"hits": 0, "misses": 0}
+        
+        logger.info(f"🌌 Procedural textures ready ({'NumPy' if np is not None else 'fallback'})")
+    
+    # === PUBLIC TEXTURES ===
+    # Returned surfaces are shared: copy() before drawing on them
+    
+    def vertical_gradient(self, size, top_color, bottom_color):
+        """Get a top-to-bottom gradient (RGBA colors give a per-pixel alpha surface)"""
+        key = ("gradient", tuple(size), tuple(top_color), tuple(bottom_color))
+        surface = self._lookup(key)
+        if surface is None:
+            surface = self._build_gradient(size, top_color, bottom_color)
+            surface = self._store(key, surface)
+        return surface
+    
+    def starfield(self, size, top_color, bottom_color, count=200, seed=0, brightness=(60, 100)):
+        """Get a gradient sky sprinkled with seeded stars"""
+        key = ("starfield", tuple(size), tuple(top_color), tuple(bottom_color), count, seed, tuple(brightness))
+        surface = self._lookup(key)
+        if surface is None:
+            surface = self._build_gradient(size, top_color, bottom_color)
+            self._add_stars(surface, count, seed, brightness)
+            surface = self._store(key, surface)
+        return surface
+    
+    def noise(self, size, dark_color, light_color, cell_size=8, seed=0):
+        """Get smooth value noise blending between two colors"""
+        key = ("noise", tuple(size), tuple(dark_color), tuple(light_color), cell_size, seed)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = self._build_noise(size, dark_color, light_color, cell_size, seed)
+            surface = self._store(key, surface)
+        return surface
+    
+    def radial_falloff(self, size, color, inner_alpha, outer_alpha, power=1.0):
+        """Get an alpha falloff from the centre (inner_alpha) to the edges (outer_alpha)"""
+        key = ("radial", tuple(size), tuple(color), inner_alpha, outer_alpha, power)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = self._build_radial(size, color, inner_alpha, outer_alpha, power)
+            surface = self._store(key, surface)
+        return surface
+    
+    # === GENERATORS ===
+    
+    def _build_gradient(self, size, top_color, bottom_color):
+        """Build a gradient column once and stretch it to full width"""
+        width, height = size
+        has_alpha = len(top_color) == 4
+        column = pygame.Surface((1, height), pygame.SRCALPHA if has_alpha else 0)
+        
+        if np is not None:
+            ratio = np.arange(height, dtype=np.float32)[:, None] / height
+            top = np.array(top_color, dtype=np.float32)
+            bottom = np.array(bottom_color, dtype=np.float32)
+            colors = np.clip(top + (bottom - top) * ratio, 0, 255).astype(np.uint8)
+            pygame.surfarray.pixels3d(column)[0] = colors[:, :3]
+            if has_alpha:
+                pygame.surfarray.pixels_alpha(column)[0] = colors[:, 3]
+        else:
+            for y in range(height):
+                ratio = y / height
+                column.set_at((0, y), tuple(int(a + (b - a) * ratio) for a, b in zip(top_color, bottom_color)))
+        
+        # Scaling a 1px column is a single C-level fill per row
+        return pygame.transform.scale(column, (width, height))
+    
+    def _add_stars(self, surface, count, seed, brightness):
+        """Scatter seeded stars over a surface"""
+        width, height = surface.get_size()
+        
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            xs = rng.integers(0, width, count)
+            ys = rng.integers(0, height, count)
+            levels = rng.integers(brightness[0], brightness[1] + 1, count)
+            stars = np.stack([levels, levels, np.minimum(levels + 20, 255)], axis=1).astype(np.uint8)
+            
+            pixels = pygame.surfarray.pixels3d(surface)
+            # Centre pixel plus a small cross, matching a radius-1 circle
+            for dx, dy in ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)):
+                pixels[np.clip(xs + dx, 0, width - 1), np.clip(ys + dy, 0, height - 1)] = stars
+            del pixels
+        else:
+            rng = random.Random(seed)
+            for _ in range(count):
+                x = rng.randrange(width)
+                y = rng.randrange(height)
+                level = rng.randint(brightness[0], brightness[1])
+                pygame.draw.circle(surface, (level, level, min(255, level + 20)), (x, y), 1)
+    
+    def _build_noise(self, size, dark_color, light_color, cell_size, seed):
+        """Build value noise on a coarse grid and smooth-scale it up"""
+        width, height = size
+        grid_size = (max(2, width // cell_size + 1), max(2, height // cell_size + 1))
+        grid = pygame.Surface(grid_size)
+        dark = tuple(dark_color[:3])
+        light = tuple(light_color[:3])
+        
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            values = rng.random(grid_size, dtype=np.float32)[:, :, None]
+            dark_array = np.array(dark, dtype=np.float32)
+            light_array = np.array(light, dtype=np.float32)
+            pygame.surfarray.blit_array(grid, (dark_array + (light_array - dark_array) * values).astype(np.uint8))
+        else:
+            rng = random.Random(seed)
+            for x in range(grid_size[0]):
+                for y in range(grid_size[1]):
+                    value = rng.random()
+                    grid.set_at((x, y), tuple(int(a + (b - a) * value) for a, b in zip(dark, light)))
+        
+        return pygame.transform.smoothscale(grid, (width, height))
+    
+    def _build_radial(self, size, color, inner_alpha, outer_alpha, power):
+        """Build an elliptical alpha falloff"""
+        width, height = size
+        
+        if np is not None:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            surface.fill((*color[:3], 0))
+            xs = np.linspace(-1.0, 1.0, width, dtype=np.float32)[:, None]
+            ys = np.linspace(-1.0, 1.0, height, dtype=np.float32)[None, :]
+            distance = np.minimum(np.sqrt(xs * xs + ys * ys), 1.0) ** power
+            alpha = inner_alpha + (outer_alpha - inner_alpha) * distance
+            pygame.surfarray.pixels_alpha(surface)[:] = np.clip(alpha, 0, 255).astype(np.uint8)
+            return surface
+        
+        # Fallback: compute a small map per pixel, then smooth-scale it up
+        small_size = (max(2, width // 8), max(2, height // 8))
+        small = pygame.Surface(small_size, pygame.SRCALPHA)
+        for x in range(small_size[0]):
+            for y in range(small_size[1]):
+                nx = x / (small_size[0] - 1) * 2 - 1
+                ny = y / (small_size[1] - 1) * 2 - 1
+                distance = min(1.0, (nx * nx + ny * ny) ** 0.5) ** power
+                alpha = int(inner_alpha + (outer_alpha - inner_alpha) * distance)
+                small.set_at((x, y), (*color[:3], max(0, min(255, alpha))))
+        return pygame.transform.smoothscale(small, (width, height))
+    
+    # === CACHE ===
+    
+    def _lookup(self, key):
+        """Look up a cached texture"""
+        surface = self.cache.get(key)
+        if surface is None:
+            self.stats["misses"] += 1
+        else:
+            self.cache.move_to_end(key)
+            self.stats["hits"] += 1
+        return surface
+    
+    def _store(self, key, surface):
+        """Store a texture (converted for fast blitting when a display exists)"""
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+        
+        self.cache[key] = surface
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Drop all cached textures"""
+        self.cache.clear()
+    
+    def get_memory_usage(self):
+        """Get (bytes, surfaces) held by the cache"""
+        return sum(surface_bytes(surface) for surface in self.cache.values()), len(self.cache)
+    
+    def get_stats(self):
+        """Get cache statistics"""
+        stats = dict(self.stats)
+        stats["textures"] = len(self.cache)
+        return stats
+
+
+_shared_textures = None
+
+
+def get_procedural_textures():
+    """Get the shared procedural texture cache"""
+    global _shared_textures
+    if _shared_textures is None:
+        _shared_textures = ProceduralTextures()
+        get_surface_registry().register_cache("procedural_textures", _shared_textures.get_memory_usage)
+    return _shared_textures
@@ -0,0 +1,180 @@
+"""
+===============================
+RENDER QUEUE
+===============================
+Draw-command front-end between scenes and the screen
+
+FEATURES:
+- ✅ Scenes and entities submit sprites, rects, lines, text and custom draws
+- ✅ Commands sorted by layer, then z (y-sorting), then submission order
+- ✅ Off-screen commands culled against the screen clip before drawing
+- ✅ Consecutive sprite blits flushed through one Surface.blits call
+- ✅ Per-frame draw-call counts reported to the engine debug overlay
+"""
+
+import pygame
+from collections import OrderedDict
+from managers.game_log import get_logger
+
+logger = get_logger("render_queue")
+
+# === LAYERS ===
+LAYER_BACKGROUND = 0
+LAYER_WORLD = 10
+LAYER_ENTITIES = 20
+LAYER_EFFECTS = 30
+LAYER_UI = 40
+LAYER_OVERLAY = 50
+
+# Command kinds
+SPRITE = 0
+RECT = 1
+LINE = 2
+CUSTOM = 3
+
+
+class RenderQueue:
+    """
+    RENDER QUEUE
+    Collects one frame's draw commands, then culls, sorts and batches them
+    """
+    
+    def __init__(self, max_text_entries=256):
+        """Initialize command list and text cache"""
+        self.commands = []          # (layer, z, order, kind, bounds, payload)
+        self.order = 0
+        
+        # === TEXT CACHE ===
+        self.max_text_entries = max_text_entries
+        self.text_cache = OrderedDict()     # (font, text, color) -> Surface
+        
+        # === STATISTICS ===
+        self.frame_stats = self._empty_stats()
+        self.last_frame_stats = self._empty_stats()
+        
+        logger.info("🧾 Render queue initialized")
+    
+    def _empty_stats(self):
+        """Get zeroed per-frame counters"""
+        return {"commands": 0, "culled": 0, "draw_calls": 0, "batched_sprites": 0}
+    
+    # === SUBMISSION ===
+    
+    def _submit(self, layer, z, kind, bounds, payload):
+        """Queue one command"""
+        self.commands.append((layer, z, self.order, kind, bounds, payload))
+        self.order += 1
+    
+    def sprite(self, surface, pos, layer=LAYER_WORLD, z=0, special_flags=0):
+        """Queue a surface blit at a top-left position (or Rect)"""
+        bounds = surface.get_rect(topleft=(pos[0], pos[1]))
+        self._submit(layer, z, SPRITE, bounds, (surface, bounds.topleft, special_flags))
+    
+    def rect(self, color, rect, layer=LAYER_WORLD, z=0, width=0):
+        """Queue a filled (width 0) or outlined rectangle"""
+        rect = pygame.Rect(rect)
+        self._submit(layer, z, RECT, rect, (color, rect, width))
+    
+    def line(self, color, start, end, layer=LAYER_WORLD, z=0, width=1):
+        """Queue a straight line"""
+        left = min(start[0], end[0]) - width
+        top = min(start[1], end[1]) - width
+        bounds = pygame.Rect(left, top, abs(end[0] - start[0]) + width * 2 + 1, abs(end[1] - start[1]) + width * 2 + 1)
+        self._submit(layer, z, LINE, bounds, (color, start, end, width))
+    
+    def text(self, text, font, color, pos, layer=LAYER_UI, z=0, anchor="topleft"):
+        """Queue a line of text (rendered surfaces are cached by font, text and color)"""
+        surface = self.render_text(text, font, color)
+        rect = surface.get_rect(**{anchor: (pos[0], pos[1])})
+        self.sprite(surface, rect.topleft, layer, z)
+        return rect
+    
+    def custom(self, draw_function, layer=LAYER_WORLD, z=0, bounds=None):
+        """Queue a draw_function(screen) call (culled only when bounds are given)"""
+        self._submit(layer, z, CUSTOM, pygame.Rect(bounds) if bounds is not None else None, draw_function)
+    
+    def render_text(self, text, font, color):
+        """Get a cached text surface"""
+        key = (font, text, tuple(color))
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            return surface
+        
+        surface = font.render(text, True, color)
+        self.text_cache[key] = surface
+        if len(self.text_cache) > self.max_text_entries:
+            self.text_cache.popitem(last=False)
+        return surface
+    
+    # === FLUSH ===
+    
+    def flush(self, screen):
+        """Cull, sort and draw every queued command, then empty the queue"""
+        stats = self.frame_stats
+        stats["commands"] += len(self.commands)
+        
+        # Cull against the current clip area
+        clip = screen.get_clip()
+        visible = [command for command in self.commands if command[4] is None or clip.colliderect(command[4])]
+        stats["culled"] += len(self.commands) - len(visible)
+        self.commands = []
+        self.order = 0
+        
+        # Stable sort: layer, then z, then submission order
+        visible.sort(key=lambda command: command[:3])
+        
+        batch = []
+        for layer, z, order, kind, bounds, payload in visible:
+            if kind == SPRITE:
+                surface, dest, special_flags = payload
+                batch.append((surface, dest, None, special_flags) if special_flags else (surface, dest))
+                continue
+            
+            if batch:
+                self._flush_batch(screen, batch)
+                batch = []
+            
+            if kind == RECT:
+                color, rect, width = payload
+                pygame.draw.rect(screen, color, rect, width)
+            elif kind == LINE:
+                color, start, end, width = payload
+                pygame.draw.line(screen, color, start, end, width)
+            else:
+                payload(screen)
+            stats["draw_calls"] += 1
+        
+        if batch:
+            self._flush_batch(screen, batch)
+    
+    def _flush_batch(self, screen, batch):
+        """Blit a run of consecutive sprites in one call"""
+        screen.blits(batch, doreturn=False)
+        self.frame_stats["draw_calls"] += 1
+        self.frame_stats["batched_sprites"] += len(batch)
+    
+    def end_frame(self):
+        """Close the frame's statistics (called by the engine after rendering)"""
+        self.commands = []
+        self.order = 0
+        self.last_frame_stats = self.frame_stats
+        self.frame_stats = self._empty_stats()
+        return self.last_frame_stats
+    
+    def get_stats(self):
+        """Get the last completed frame's statistics"""
+        stats = dict(self.last_frame_stats)
+        stats["cached_text"] = len(self.text_cache)
+        return stats
+
+
+_shared_queue = None
+
+
+def get_render_queue():
+    """Get the shared render queue"""
+    global _shared_queue
+    if _shared_queue is None:
+        _shared_queue = RenderQueue()
+    return _shared_queue
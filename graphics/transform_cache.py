@@ -0,0 +1,138 @@
+"""
+===============================
+TRANSFORM CACHE
+===============================
+Memoized rotozoom/smoothscale results for animated sprites and titles
+
+FEATURES:
+- ✅ Rotation and scale snapped to a bounded number of steps
+- ✅ Rotational symmetry folds equivalent angles onto one entry
+- ✅ Results keyed per source surface, LRU-evicted by a byte budget
+- ✅ Pulsing, spinning and resized sprites become cache lookups
+"""
+
+import pygame
+from collections import OrderedDict
+
+from assets.surface_registry import get_surface_registry, surface_bytes
+from managers.game_log import get_logger
+
+logger = get_logger("transform_cache")
+
+try:
+    from config import TRANSFORM_ANGLE_STEP, TRANSFORM_SCALE_STEP, TRANSFORM_CACHE_BUDGET
+except ImportError:
+    TRANSFORM_ANGLE_STEP = 3.0
+    TRANSFORM_SCALE_STEP = 0.01
+    TRANSFORM_CACHE_BUDGET = 32 * 1024 * 1024
+
+
+class TransformCache:
+    """
+    TRANSFORM CACHE
+    Quantized transforms of source surfaces (sources must be long-lived, not rebuilt per frame)
+    """
+    
+    def __init__(self, angle_step=TRANSFORM_ANGLE_STEP, scale_step=TRANSFORM_SCALE_STEP, budget=TRANSFORM_CACHE_BUDGET):
+        """Initialize transform cache"""
+        self.angle_step = angle_step
+        self.scale_step = scale_step
+        self.budget = budget
+        self.cache = OrderedDict()      # (source, kind, params...) -> Surface
+        self.cache_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evicted": 0}
+        
+        logger.info(f"🌀 Transform cache ready ({angle_step:g}° / x{scale_step:g} steps)")
+    
+    # === PUBLIC TRANSFORMS ===
+    # Returned surfaces are shared: do not draw on them (set_alpha before each blit is fine)
+    
+    def rotozoom(self, surface, angle, scale=1.0, symmetry=360.0):
+        """Get surface rotated by angle degrees (counterclockwise) and scaled (symmetry folds repeating angles)"""
+        angle_index = int(round((angle % symmetry) / self.angle_step))
+        if angle_index * self.angle_step >= symmetry:
+            angle_index = 0
+        scale_index = max(1, int(round(scale / self.scale_step)))
+        if angle_index == 0 and scale_index == round(1.0 / self.scale_step):
+            return surface
+        
+        key = (surface, "rotozoom", angle_index, scale_index)
+        result = self._lookup(key)
+        if result is None:
+            result = pygame.transform.rotozoom(surface, angle_index * self.angle_step, scale_index * self.scale_step)
+            result = self._store(key, result)
+        return result
+    
+    def scale_by(self, surface, factor):
+        """Get surface smoothly scaled by a snapped factor"""
+        scale_index = max(1, int(round(factor / self.scale_step)))
+        width, height = surface.get_size()
+        factor = scale_index * self.scale_step
+        return self.scale(surface, (max(1, int(width * factor)), max(1, int(height * factor))), smooth=True)
+    
+    def scale(self, surface, size, smooth=False):
+        """Get surface scaled to an exact size"""
+        size = (int(size[0]), int(size[1]))
+        if size == surface.get_size():
+            return surface
+        
+        key = (surface, "scale", size, smooth)
+        result = self._lookup(key)
+        if result is None:
+            if smooth and surface.get_bytesize() in (3, 4):
+                result = pygame.transform.smoothscale(surface, size)
+            else:
+                # smoothscale needs 24/32-bit surfaces
+                result = pygame.transform.scale(surface, size)
+            result = self._store(key, result)
+        return result
+    
+    # === CACHE ===
+    
+    def _lookup(self, key):
+        """Look up a cached transform"""
+        result = self.cache.get(key)
+        if result is None:
+            self.stats["misses"] += 1
+        else:
+            self.cache.move_to_end(key)
+            self.stats["hits"] += 1
+        return result
+    
+    def _store(self, key, result):
+        """Store a transform, evicting least recently used ones over budget"""
+        self.cache[key] = result
+        self.cache_bytes += surface_bytes(result)
+        while self.cache_bytes > self.budget and len(self.cache) > 1:
+            _, evicted = self.cache.popitem(last=False)
+            self.cache_bytes -= surface_bytes(evicted)
+            self.stats["evicted"] += 1
+        return result
+    
+    def clear(self):
+        """Drop all cached transforms"""
+        self.cache.clear()
+        self.cache_bytes = 0
+    
+    def get_memory_usage(self):
+        """Get (bytes, surfaces) held by the cache"""
+        return self.cache_bytes, len(self.cache)
+    
+    def get_stats(self):
+        """Get cache statistics"""
+        stats = dict(self.stats)
+        stats["transforms"] = len(self.cache)
+        stats["cache_mb"] = round(self.cache_bytes / (1024 * 1024), 1)
+        return stats
+
+
+_shared_transforms = None
+
+
+def get_transform_cache():
+    """Get the shared transform cache"""
+    global _shared_transforms
+    if _shared_transforms is None:
+        _shared_transforms = TransformCache()
+        get_surface_registry().register_cache("transform_cache", _shared_transforms.get_memory_usage)
+    return _shared_transforms
@@ -16,6 +16,9 @@ FEATURES:
 import pygame
 import math
 from config import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.game_log import get_logger
+
+logger = get_logger("mouse_controller")
 
 class MouseController:
     """
@@ -35,6 +38,7 @@ class MouseController:
         # Movement
         self.target_position = None
         self.moving_to_target = False
+        self.navigator = None   # Scene navigator, picked up on click
         
         # Combat mode
         self.combat_mode = False
@@ -63,12 +67,12 @@ class MouseController:
         self.cursor_animation_timer = 0
         self.last_interaction_time = 0
         
-        print("🖱️ Enhanced Mouse Controller with all features restored")
+        logger.info("🖱️ Enhanced Mouse Controller with all features restored")
     
     def set_combat_mode(self, combat_mode):
         """Set combat mode for mouse controller"""
         self.combat_mode = combat_mode
-        print(f"🖱️ Combat mode: {'ON' if combat_mode else 'OFF'}")
+        logger.info(f"🖱️ Combat mode: {'ON' if combat_mode else 'OFF'}")
     
     def handle_event(self, event, scene):
         """Handle mouse events with full feature set"""
@@ -81,7 +85,7 @@ class MouseController:
                 self.left_clicked = True
                 # Check if clicking in HUD area
                 if event.pos[0] > self.playable_right:
-                    print("🖱️ Click in HUD area ignored")
+                    logger.debug("🖱️ Click in HUD area ignored")
                     return
                 self._handle_left_click(event.pos, scene)
             elif event.button == 3:  # Right click
@@ -110,6 +114,7 @@ class MouseController:
             # Movement or interaction
             interacted = self._try_interact_at_position(clamped_pos, scene)
             if not interacted:
+                self.navigator = getattr(scene, 'navigator', None)
                 self._move_to_position(clamped_pos)
                 self._add_interaction_highlight(clamped_pos, "move")
     
@@ -381,8 +386,8 @@ class MouseController:
         if not self.moving_to_target or not self.target_position:
             return
         
-        # Use player's boundary-aware movement
-        reached_target = player.move_to_position(self.target_position[0], self.target_position[1], dt)
+        # Use player's boundary-aware movement (pathfinding around furniture when the scene has a navigator)
+        reached_target = player.move_to_position(self.target_position[0], self.target_position[1], dt, self.navigator)
         
         if reached_target:
             self.moving_to_target = False
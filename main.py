@@ -12,51 +12,78 @@ Features:
 """
 
 import pygame
+import argparse
+import os
 import sys
 from game_engine import GameEngine
-from config import GAME_TITLE, VERSION
+from managers.input_replay import InputRecorder, InputReplay
+from managers.io_service import get_io_service
+from config import GAME_TITLE, VERSION, AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS, AUDIO_BUFFER
+from managers.game_log import get_logger, shutdown_logging
+
+logger = get_logger("main")
+
+def parse_arguments():
+    """Parse recording / replay options"""
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument("--record", metavar="FILE", help="record input and RNG seeds to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="replay a recorded session from FILE")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window or audio device (for replays and benchmarks)")
+    return parser.parse_args()
+
+def _on_crash_log_saved(error):
+    """Confirm the crash log write"""
+    if not error:
+        logger.info("💾 Crash log saved to crash_log.txt")
 
 def main():
     """
     Main game entry point
     Handles initialization, execution, and cleanup
     """
-    print("=" * 60)
-    print(f"🎮 {GAME_TITLE}")
-    print(f"📦 Version {VERSION}")
-    print("=" * 60)
+    args = parse_arguments()
+    if args.headless:
+        # Must be set before pygame.init()
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    
+    logger.info(f"🎮 {GAME_TITLE}")
+    logger.info(f"📦 Version {VERSION}")
     
     game_engine = None
     
     try:
-        # Initialize Pygame
+        # Initialize Pygame (mixer format must be set before init)
+        pygame.mixer.pre_init(AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS, AUDIO_BUFFER)
         pygame.init()
-        print("✅ Pygame initialized successfully")
+        logger.info("✅ Pygame initialized successfully")
         
         # Create and run game engine
-        game_engine = GameEngine()
-        print("✅ Game engine created successfully")
+        input_recorder = InputRecorder(args.record) if args.record else None
+        input_replay = InputReplay(args.replay) if args.replay else None
+        game_engine = GameEngine(input_recorder, input_replay)
+        logger.info("✅ Game engine created successfully")
         
         # Start main game loop
-        print("🚀 Starting game...")
+        logger.info("🚀 Starting game...")
         game_engine.run()
         
     except KeyboardInterrupt:
-        print("\n⏹️ Game interrupted by user")
+        logger.info("⏹️ Game interrupted by user")
         
     except Exception as e:
-        print(f"\n❌ Game crashed with error: {e}")
+        logger.exception(f"❌ Game crashed with error: {e}")
         import traceback
-        traceback.print_exc()
         
-        # Save crash log
+        # Save crash log (written before exit by the I/O service shutdown below)
         try:
-            with open("crash_log.txt", "w") as f:
-                f.write(f"Game Crash Report\n")
-                f.write(f"Version: {VERSION}\n")
-                f.write(f"Error: {str(e)}\n")
-                f.write(f"Traceback:\n{traceback.format_exc()}")
-            print("💾 Crash log saved to crash_log.txt")
+            report = (f"Game Crash Report\n"
+                      f"Version: {VERSION}\n"
+                      f"Error: {str(e)}\n"
+                      f"Traceback:\n{traceback.format_exc()}")
+            get_io_service().write("crash_log.txt", report,
+                                   callback=_on_crash_log_saved)
         except:
             pass
     
@@ -65,12 +92,16 @@ def main():
         if game_engine:
             try:
                 game_engine.shutdown()
-                print("🧹 Game engine cleaned up")
+                logger.info("🧹 Game engine cleaned up")
             except:
                 pass
         
+        # Finish queued saves and logs before the process exits
+        get_io_service().shutdown()
+        
         pygame.quit()
-        print("👋 Game shutdown complete")
+        logger.info("👋 Game shutdown complete")
+        shutdown_logging()
         sys.exit()
 
 if __name__ == "__main__":
@@ -0,0 +1,288 @@
+"""
+===============================
+AUDIO MANAGER
+===============================
+Sound effects, voice pooling and streamed music
+
+FEATURES:
+- ✅ Sound bank decoded once (optionally on a background thread)
+- ✅ Fixed voice pool with priority-based voice stealing
+- ✅ Music streamed from disk with fade-out / fade-in crossfades
+- ✅ Rate limiting for repeated UI sounds (hover, cursor moves)
+- ✅ Runs silently when no audio device or sound files are available
+"""
+
+import pygame
+import os
+import threading
+from managers.game_log import get_logger
+
+logger = get_logger("audio_manager")
+
+try:
+    from config import (AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS, AUDIO_BUFFER, AUDIO_VOICES,
+                        AUDIO_SOUND_PATH, AUDIO_MUSIC_PATH, AUDIO_CROSSFADE_MS, AUDIO_REPEAT_INTERVAL_MS)
+except ImportError:
+    AUDIO_FREQUENCY = 44100
+    AUDIO_SIZE = -16
+    AUDIO_CHANNELS = 2
+    AUDIO_BUFFER = 512
+    AUDIO_VOICES = 16
+    AUDIO_SOUND_PATH = "assets/sounds"
+    AUDIO_MUSIC_PATH = "assets/music"
+    AUDIO_CROSSFADE_MS = 1200
+    AUDIO_REPEAT_INTERVAL_MS = 60
+
+SOUND_EXTENSIONS = ('.ogg', '.wav')
+MUSIC_EXTENSIONS = ('.ogg', '.mp3', '.wav')
+
+
+class AudioManager:
+    """
+    AUDIO MANAGER
+    Sound bank, voice pool and music streaming behind one interface
+    """
+    
+    def __init__(self, game_settings=None):
+        """Initialize mixer, voice pool and sound bank"""
+        # === MIXER ===
+        self.enabled = self._init_mixer()
+        
+        # === SOUND BANK ===
+        self.sounds = {}                # name -> pygame.mixer.Sound
+        self.missing = set()            # Names with no file (reported once)
+        self.bank_lock = threading.Lock()
+        self.preload_thread = None
+        
+        # === VOICE POOL ===
+        self.voice_count = AUDIO_VOICES
+        self.voices = [None] * self.voice_count     # channel -> (priority, start ticks, name)
+        self.last_played = {}                       # name -> ticks, for rate limiting
+        if self.enabled:
+            pygame.mixer.set_num_channels(self.voice_count)
+        
+        # === MUSIC ===
+        self.current_music = None
+        self.next_music = None          # (name, path, loops, fade-in ms) waiting for the fade-out
+        self.music_switch_timer = 0.0
+        self.crossfade_ms = AUDIO_CROSSFADE_MS
+        
+        # === VOLUME ===
+        self.master_volume = 1.0
+        self.music_volume = 0.8
+        self.sfx_volume = 0.9
+        if game_settings:
+            self.apply_settings(game_settings)
+        
+        # === STATISTICS ===
+        self.stats = {"played": 0, "stolen": 0, "dropped": 0, "rate_limited": 0}
+        
+        logger.info(f"🔊 Audio Manager initialized ({self.voice_count} voices{'' if self.enabled else ', muted'})")
+    
+    def _init_mixer(self):
+        """Start the mixer with the configured format if it is not running"""
+        if pygame.mixer.get_init():
+            return True
+        try:
+            pygame.mixer.init(AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS, AUDIO_BUFFER)
+            return True
+        except pygame.error as e:
+            logger.warning(f"⚠️ Audio unavailable, continuing without sound: {e}")
+            return False
+    
+    def apply_settings(self, game_settings):
+        """Read volumes (0-100) from game settings"""
+        self.master_volume = game_settings.get("master_volume", self.master_volume * 100) / 100
+        self.music_volume = game_settings.get("music_volume", self.music_volume * 100) / 100
+        self.sfx_volume = game_settings.get("sfx_volume", self.sfx_volume * 100) / 100
+        if self.enabled:
+            pygame.mixer.music.set_volume(self.master_volume * self.music_volume)
+    
+    # === SOUND BANK ===
+    
+    def _find_file(self, folder, name, extensions):
+        """Find the file for a sound or track name"""
+        for extension in extensions:
+            path = os.path.join(folder, name + extension)
+            if os.path.exists(path):
+                return path
+        return None
+    
+    def preload(self, names=None, background=True):
+        """Decode sounds into the bank (all files in the sound folder by default)"""
+        if not self.enabled:
+            return
+        
+        if names is None:
+            if not os.path.isdir(AUDIO_SOUND_PATH):
+                return
+            names = [os.path.splitext(filename)[0] for filename in sorted(os.listdir(AUDIO_SOUND_PATH))
+                     if filename.lower().endswith(SOUND_EXTENSIONS)]
+        
+        if background:
+            self.preload_thread = threading.Thread(target=self._decode_sounds, args=(list(names),),
+                                                   name="sound-bank", daemon=True)
+            self.preload_thread.start()
+        else:
+            self._decode_sounds(names)
+    
+    def _decode_sounds(self, names):
+        """Decode each named sound once"""
+        for name in names:
+            self._get_sound(name)
+    
+    def _get_sound(self, name):
+        """Get a sound from the bank, decoding it on first use"""
+        sound = self.sounds.get(name)
+        if sound is not None or name in self.missing:
+            return sound
+        
+        with self.bank_lock:
+            # Another thread may have decoded it while we waited
+            if name in self.sounds or name in self.missing:
+                return self.sounds.get(name)
+            
+            path = self._find_file(AUDIO_SOUND_PATH, name, SOUND_EXTENSIONS)
+            if path is None:
+                self.missing.add(name)
+                logger.warning(f"⚠️ Sound not found: {name}")
+                return None
+            
+            try:
+                sound = pygame.mixer.Sound(path)
+            except pygame.error as e:
+                self.missing.add(name)
+                logger.warning(f"⚠️ Could not decode sound {name}: {e}")
+                return None
+            
+            self.sounds[name] = sound
+            return sound
+    
+    # === SOUND EFFECTS ===
+    
+    def play_sfx(self, name, priority=0, volume=1.0):
+        """Play a sound effect on a pooled voice (returns False if dropped)"""
+        if not self.enabled:
+            return False
+        
+        # Rate limit repeats of the same sound (menu hover, cursor moves)
+        now = pygame.time.get_ticks()
+        last = self.last_played.get(name)
+        if last is not None and now - last < AUDIO_REPEAT_INTERVAL_MS:
+            self.stats["rate_limited"] += 1
+            return False
+        
+        sound = self._get_sound(name)
+        if sound is None:
+            return False
+        
+        voice = self._acquire_voice(priority)
+        if voice is None:
+            self.stats["dropped"] += 1
+            return False
+        
+        channel = pygame.mixer.Channel(voice)
+        channel.set_volume(max(0.0, min(1.0, volume * self.sfx_volume * self.master_volume)))
+        channel.play(sound)
+        self.voices[voice] = (priority, now, name)
+        self.last_played[name] = now
+        self.stats["played"] += 1
+        return True
+    
+    def _acquire_voice(self, priority):
+        """Get a free voice, or steal the oldest voice of lower or equal priority"""
+        victim = None
+        for index in range(self.voice_count):
+            if not pygame.mixer.Channel(index).get_busy():
+                return index
+            voice = self.voices[index]
+            if voice is None:
+                continue
+            if voice[0] <= priority and (victim is None or voice[:2] < self.voices[victim][:2]):
+                victim = index
+        
+        if victim is not None:
+            pygame.mixer.Channel(victim).stop()
+            self.stats["stolen"] += 1
+        return victim
+    
+    def stop_all_sfx(self):
+        """Stop every sound effect voice"""
+        if self.enabled:
+            for index in range(self.voice_count):
+                pygame.mixer.Channel(index).stop()
+        self.voices = [None] * self.voice_count
+    
+    # === MUSIC ===
+    
+    def play_music(self, name, loops=-1, fade_ms=None):
+        """Stream a music track, crossfading from the current one"""
+        if not self.enabled or name == self.current_music:
+            return False
+        
+        path = self._find_file(AUDIO_MUSIC_PATH, name, MUSIC_EXTENSIONS)
+        if path is None:
+            if name not in self.missing:
+                self.missing.add(name)
+                logger.warning(f"⚠️ Music not found: {name}")
+            return False
+        
+        fade_ms = self.crossfade_ms if fade_ms is None else fade_ms
+        self.current_music = name
+        
+        # pygame streams one track at a time: fade out, then fade the next one in
+        if pygame.mixer.music.get_busy() and fade_ms > 0:
+            pygame.mixer.music.fadeout(fade_ms // 2)
+            self.next_music = (name, path, loops, fade_ms // 2)
+            self.music_switch_timer = fade_ms / 2000
+        else:
+            self._start_music(path, loops, fade_ms // 2)
+        return True
+    
+    def _start_music(self, path, loops, fade_in_ms):
+        """Load and start streaming a track"""
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(self.master_volume * self.music_volume)
+            pygame.mixer.music.play(loops, fade_ms=fade_in_ms)
+        except pygame.error as e:
+            logger.warning(f"⚠️ Could not play music {path}: {e}")
+            self.current_music = None
+    
+    def stop_music(self, fade_ms=None):
+        """Fade out and stop the current track"""
+        self.next_music = None
+        self.current_music = None
+        if self.enabled:
+            pygame.mixer.music.fadeout(self.crossfade_ms // 2 if fade_ms is None else fade_ms)
+    
+    # === FRAME UPDATE ===
+    
+    def update(self, dt):
+        """Start queued music once the previous track has faded out"""
+        if self.next_music is None:
+            return
+        
+        self.music_switch_timer -= dt
+        if self.music_switch_timer <= 0:
+            name, path, loops, fade_in_ms = self.next_music
+            self.next_music = None
+            self._start_music(path, loops, fade_in_ms)
+    
+    def get_stats(self):
+        """Get audio statistics"""
+        stats = dict(self.stats)
+        stats["sounds"] = len(self.sounds)
+        stats["busy_voices"] = sum(1 for index in range(self.voice_count)
+                                   if self.enabled and pygame.mixer.Channel(index).get_busy())
+        stats["music"] = self.current_music
+        return stats
+    
+    def cleanup(self):
+        """Stop all audio"""
+        self.stop_all_sfx()
+        self.next_music = None
+        self.current_music = None
+        if self.enabled:
+            pygame.mixer.music.stop()
+        logger.info("🔇 Audio Manager cleaned up")
@@ -6,7 +6,20 @@ Manages dialogue loading and processing
 """
 
 from data.dialogue_editor import DialogueEditor
+from data.dialogue_bundle import DialogueBundle
+from managers.io_service import get_io_service
+import os
 import random
+from managers.game_log import get_logger
+
+logger = get_logger("dialogue_manager")
+
+try:
+    from config import DIALOGUE_BUNDLE_PATH
+except ImportError:
+    DIALOGUE_BUNDLE_PATH = "data/dialogues.bundle"
+
+DIALOGUE_SOURCE_FOLDER = "data/dialogues/"
 
 class DialogueManager:
     """
@@ -17,19 +30,59 @@ class DialogueManager:
     def __init__(self, game_manager):
         """Initialize dialogue manager"""
         self.game_manager = game_manager
-        self.dialogue_editor = DialogueEditor()
+        self.dialogue_bundle = None
+        self.dialogue_editor = None
         self.loaded_dialogues = {}
-        self.reload_dialogues()
         
-        print("💬 Dialogue Manager initialized")
+        # Packed bundle (shipping builds) avoids reading every JSON file at startup
+        self.dialogue_bundle = self._open_dialogue_bundle()
+        self._index_dialogues()
+        
+        logger.info("💬 Dialogue Manager initialized")
+    
+    def _open_dialogue_bundle(self):
+        """Open packed dialogue bundle if one has been built and is newer than the JSON files"""
+        if not os.path.exists(DIALOGUE_BUNDLE_PATH):
+            return None
+        
+        try:
+            bundle = DialogueBundle(DIALOGUE_BUNDLE_PATH)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not open dialogue bundle, using JSON files: {e}")
+            return None
+        
+        # Editor saves and hand edits must not be hidden by an old bundle
+        get_io_service().flush()
+        if bundle.is_stale(DIALOGUE_SOURCE_FOLDER):
+            bundle.close()
+            logger.warning("⚠️ Dialogue bundle is older than data/dialogues/, using JSON files "
+                           "(rebuild with: python -m data.dialogue_bundle)")
+            return None
+        return bundle
     
     def reload_dialogues(self):
         """Reload all dialogues from files"""
+        if self.dialogue_bundle is not None:
+            self.dialogue_bundle.close()
+            self.dialogue_bundle = self._open_dialogue_bundle()
+        self._index_dialogues()
+    
+    def _index_dialogues(self):
+        """Index the open bundle, or load the JSON files when there is none"""
+        if self.dialogue_bundle is not None:
+            logger.info(f"📦 Indexed {len(self.dialogue_bundle)} packed dialogue files")
+            return
+        
+        if self.dialogue_editor is None:
+            self.dialogue_editor = DialogueEditor()
         self.loaded_dialogues = self.dialogue_editor.get_all_dialogues()
-        print(f"🔄 Loaded {len(self.loaded_dialogues)} dialogue files")
+        logger.info(f"🔄 Loaded {len(self.loaded_dialogues)} dialogue files")
     
     def get_character_dialogues(self, character_name, scene_name=None):
         """Get dialogues for a specific character"""
+        if self.dialogue_bundle is not None:
+            return self.dialogue_bundle.get_character_dialogues(character_name, scene_name)
+        
         matching_dialogues = []
         
         for dialogue_key, dialogue_data in self.loaded_dialogues.items():
@@ -90,9 +143,9 @@ class DialogueManager:
                         return False
                 
                 elif condition_key == "story_flag":
-                    # Check story flags from scene manager
+                    # One flag name or a list of flags that must all be set
                     story_flags = self.game_manager.scene_manager.get_story_progress()
-                    if not story_flags.get(condition_value, False):
+                    if not story_flags.has_all(story_flags.mask(condition_value)):
                         return False
                 
                 elif condition_key == "time_of_day":
@@ -103,7 +156,7 @@ class DialogueManager:
                         return False
         
         except Exception as e:
-            print(f"⚠️ Condition check error: {e}")
+            logger.warning(f"⚠️ Condition check error: {e}")
             return False
         
         return True
@@ -157,14 +210,14 @@ class DialogueManager:
                 elif effect_key == "advance_story":
                     if effect_value:
                         # Handle story advancement
-                        print("📖 Story advanced through dialogue")
+                        logger.info("📖 Story advanced through dialogue")
                 
                 elif effect_key == "relationship":
                     # Handle relationship changes
-                    print(f"💝 Relationship changed by {effect_value}")
+                    logger.info(f"💝 Relationship changed by {effect_value}")
         
         except Exception as e:
-            print(f"⚠️ Effect application error: {e}")
+            logger.warning(f"⚠️ Effect application error: {e}")
     
     def get_random_dialogue(self, character_name, scene_name=None):
         """Get a random dialogue line for a character"""
@@ -0,0 +1,208 @@
+"""
+===============================
+GAME LOG
+===============================
+Leveled, rate-limited logging for every game system
+
+FEATURES:
+- ✅ Standard logging levels, threshold from config.LOG_LEVEL
+- ✅ Records queued on the calling thread, written by a background listener
+- ✅ Per-line rate limiting (call site + message): a line logged every frame collapses into "repeated N×"
+- ✅ Structured fields (scene, frame and per-call extras) on every line
+- ✅ Muted counts reported on shutdown so nothing disappears silently
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+
+try:
+    from config import LOG_LEVEL, LOG_RATE_BURST, LOG_RATE_WINDOW
+except ImportError:
+    LOG_LEVEL = "INFO"
+    LOG_RATE_BURST = 5
+    LOG_RATE_WINDOW = 5.0
+
+ROOT_LOGGER = "eva"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s | %(message)s"
+LOG_TIME_FORMAT = "%H:%M:%S"
+
+# Fields added to every record (updated by the engine and scene manager)
+_log_context = {"scene": None, "frame": None}
+
+
+def set_log_context(**fields):
+    """Update the structured fields attached to every record"""
+    _log_context.update(fields)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    RATE LIMIT FILTER
+    Lets each distinct line (call site + message) log `burst` times per window and counts the rest
+    """
+    
+    def __init__(self, burst=LOG_RATE_BURST, window=LOG_RATE_WINDOW):
+        """Initialize per-line counters"""
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.sites = {}                 # (path, line, message) -> [window start, logged, muted, last record]
+        self.next_prune = time.monotonic() + window
+        self.lock = threading.Lock()
+    
+    def filter(self, record):
+        """Pass or mute a record (a passing record carries its own line's muted count from the last window)"""
+        key = (record.pathname, record.lineno, record.getMessage())
+        now = time.monotonic()
+        with self.lock:
+            if now >= self.next_prune:
+                self._prune(now)
+            site = self.sites.get(key)
+            if site is None or now - site[0] >= self.window:
+                if site is not None and site[2]:
+                    record.repeated = site[2]
+                self.sites[key] = [now, 1, 0, record]
+                return True
+            if site[1] < self.burst:
+                site[1] += 1
+                site[3] = record
+                return True
+            site[2] += 1
+            site[3] = record
+            return False
+    
+    def _prune(self, now):
+        """Forget expired lines with nothing muted (lines with muted counts wait for a repeat or shutdown)"""
+        self.sites = {key: site for key, site in self.sites.items()
+                      if site[2] or now - site[0] < self.window}
+        self.next_prune = now + self.window
+    
+    def take_muted(self):
+        """Get (last record, muted count) for every line with muted repeats, and reset them"""
+        with self.lock:
+            muted = [(site[3], site[2]) for site in self.sites.values() if site[2]]
+            for site in self.sites.values():
+                site[2] = 0
+        return muted
+
+
+class ContextFilter(logging.Filter):
+    """
+    CONTEXT FILTER
+    Merges the global log context with a record's own `fields` extra
+    """
+    
+    def filter(self, record):
+        """Attach structured fields"""
+        fields = {name: value for name, value in _log_context.items() if value is not None}
+        fields.update(getattr(record, "fields", None) or {})
+        record.fields = fields
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    STRUCTURED FORMATTER
+    Standard log line followed by key=value fields and any repeat count
+    """
+    
+    def format(self, record):
+        """Format one record"""
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += "  [" + " ".join(f"{name}={value}" for name, value in fields.items()) + "]"
+        repeated = getattr(record, "repeated", 0)
+        if repeated:
+            line += f"  (repeated {repeated}×)"
+        return line
+
+
+class GameLog:
+    """
+    GAME LOG
+    Owns the queue handler on the root game logger and its background listener
+    """
+    
+    def __init__(self, level=LOG_LEVEL, stream=None):
+        """Attach a queue handler and start the writer thread"""
+        self.logger = logging.getLogger(ROOT_LOGGER)
+        self.logger.setLevel(getattr(logging, str(level).upper(), logging.INFO))
+        self.logger.propagate = False
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        
+        self.output = logging.StreamHandler(stream or sys.stdout)
+        self.output.setFormatter(StructuredFormatter(LOG_FORMAT, LOG_TIME_FORMAT))
+        
+        # Filters run on the calling thread; muted records are dropped before formatting
+        self.rate_limit = RateLimitFilter()
+        self.handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        self.handler.addFilter(ContextFilter())
+        self.handler.addFilter(self.rate_limit)
+        self.logger.addHandler(self.handler)
+        
+        self.listener = logging.handlers.QueueListener(self.handler.queue, self.output)
+        self.listener.start()
+        self.running = True
+    
+    def shutdown(self):
+        """Write everything queued, report muted lines and log directly from now on"""
+        if not self.running:
+            return
+        self.running = False
+        self.listener.stop()
+        self.logger.removeHandler(self.handler)
+        self.output.addFilter(ContextFilter())
+        self.logger.addHandler(self.output)
+        
+        # Each flooding line once more, with how often it was muted
+        for record, muted in self.rate_limit.take_muted():
+            summary = logging.makeLogRecord(record.__dict__)
+            summary.repeated = muted
+            self.output.handle(summary)
+
+
+_shared_log = None
+
+
+def get_logger(name):
+    """Get a game logger (the first call sets up the shared log)"""
+    global _shared_log
+    if _shared_log is None:
+        _shared_log = GameLog()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def set_log_stream(stream):
+    """Send log lines to another stream (tools that write results to stdout use stderr)"""
+    global _shared_log
+    if _shared_log is None:
+        _shared_log = GameLog()
+    _shared_log.output.setStream(stream)
+
+
+def shutdown_logging():
+    """Flush the shared log (safe to call more than once)"""
+    if _shared_log is not None:
+        _shared_log.shutdown()
+
+
+def _restart_after_fork():
+    """Forked worker processes do not inherit the listener thread, so start a new one"""
+    global _shared_log
+    if _shared_log is not None:
+        _shared_log = GameLog()
+
+
+# Queued lines still get written if a tool exits without calling shutdown_logging()
+atexit.register(shutdown_logging)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
@@ -8,12 +8,21 @@ Enhanced game manager with all required functionality
 import pygame
 import json
 import os
+import random
 from datetime import datetime
+from managers.read_line_tracker import ReadLineTracker
+from managers.audio_manager import AudioManager
+from managers.story_flags import StoryFlags
+from managers.io_service import get_io_service
+from managers.settings_manager import SettingsManager
 
 # Add proper imports for screen dimensions and config
 from config import (COLORS, SCREEN_WIDTH, SCREEN_HEIGHT, 
                     PLAYER_START_HEALTH, PLAYER_START_SYNC_RATIO, 
                     PLAYER_START_STRESS, PLAYER_START_RELATIONSHIPS)
+from managers.game_log import get_logger
+
+logger = get_logger("game_manager")
 
 class GameManager:
     """
@@ -21,13 +30,18 @@ class GameManager:
     All methods required by enhanced systems
     """
     
-    def __init__(self):
+    def __init__(self, session_seed=None, save_directory="saves"):
         """Initialize enhanced game manager"""
         # === CORE GAME STATE ===
         self.game_running = True
         self.paused = False
         self.scene_manager = None  # Will be set by game engine
         
+        # === DETERMINISM (scene RNGs derive from the session seed) ===
+        self.session_seed = random.getrandbits(32) if session_seed is None else session_seed
+        self.rng_count = 0
+        self.replay_log = None     # InputRecorder or InputReplay, set by game engine
+        
         # === PLAYER STATS ===
         self.player_stats = {
             "health": PLAYER_START_HEALTH,
@@ -42,18 +56,19 @@ class GameManager:
         self.relationships = PLAYER_START_RELATIONSHIPS.copy()
         
         # === GAME PROGRESS ===
-        self.story_flags = {
-            "tutorial_complete": False,
-            "first_angel_defeated": False,
-            "bedroom_complete": False,
-            "nerv_briefing_complete": False,
-            "asuka_met": False,
-            "rei_met": False,
-            "gendo_confronted": False
-        }
+        # Single flag store; SceneManager and DialogueManager read this same object
+        self.story_flags = StoryFlags([
+            "tutorial_complete",
+            "first_angel_defeated",
+            "bedroom_complete",
+            "nerv_briefing_complete",
+            "asuka_met",
+            "rei_met",
+            "gendo_confronted"
+        ])
         
         # === SAVE SYSTEM ===
-        self.save_directory = "saves"
+        self.save_directory = save_directory
         self.current_save_slot = 1
         self.auto_save_enabled = True
         
@@ -67,6 +82,10 @@ class GameManager:
             "sfx_volume": 90
         }
         
+        # Menu settings (settings.json) override the defaults, mapped the same way the settings menu applies them
+        self.settings_manager = SettingsManager()
+        self.settings_manager.apply_to(self.game_settings)
+        
         # === INVENTORY SYSTEM ===
         self.inventory = {
             "items": [],
@@ -92,7 +111,14 @@ class GameManager:
         # Ensure save directory exists
         self._ensure_save_directory()
         
-        print("🎮 Enhanced Game Manager initialized with all methods")
+        # === READ HISTORY (shared by all save slots) ===
+        self.read_lines = ReadLineTracker(self.save_directory)
+        
+        # === AUDIO ===
+        self.audio_manager = AudioManager(self.game_settings)
+        self.audio_manager.preload()
+        
+        logger.info("🎮 Enhanced Game Manager initialized with all methods")
     
     def _ensure_save_directory(self):
         """Ensure save directory exists"""
@@ -163,7 +189,7 @@ class GameManager:
         # Increase health and sync ratio
         self.modify_player_health(10)
         self.modify_sync_ratio(5)
-        print(f"🆙 Level up! Now level {self.player_stats['level']}")
+        logger.info(f"🆙 Level up! Now level {self.player_stats['level']}")
     
     # === RELATIONSHIP METHODS ===
     
@@ -198,7 +224,7 @@ class GameManager:
     
     def set_story_flag(self, flag_name, value):
         """Set story flag"""
-        self.story_flags[flag_name] = value
+        self.story_flags.set(flag_name, value)
         
         # Trigger related events
         if flag_name == "first_angel_defeated" and value:
@@ -287,7 +313,7 @@ class GameManager:
         
         if not self.achievements[achievement_name]:
             self.achievements[achievement_name] = True
-            print(f"🏆 Achievement unlocked: {achievement_name}")
+            logger.info(f"🏆 Achievement unlocked: {achievement_name}")
     
     def check_achievement(self, achievement_name):
         """Check if achievement is unlocked"""
@@ -303,7 +329,7 @@ class GameManager:
         save_data = {
             "player_stats": self.player_stats,
             "relationships": self.relationships,
-            "story_flags": self.story_flags,
+            "story_flags": self.story_flags.to_save(),
             "inventory": self.inventory,
             "game_time": self.game_time,
             "achievements": self.achievements,
@@ -315,14 +341,21 @@ class GameManager:
         save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
         
         try:
-            with open(save_file, 'w') as f:
-                json.dump(save_data, f, indent=4)
-            print(f"💾 Game saved to slot {slot}")
+            get_io_service().write_json(save_file, save_data,
+                                        callback=lambda error: self._on_game_saved(slot, error))
+            self.read_lines.save()
             return True
         except Exception as e:
-            print(f"❌ Error saving game: {e}")
+            logger.error(f"❌ Error saving game: {e}")
             return False
     
+    def _on_game_saved(self, slot, error):
+        """Report a finished save write"""
+        if error:
+            logger.error(f"❌ Error saving game: {error}")
+        else:
+            logger.info(f"💾 Game saved to slot {slot}")
+    
     def load_game(self, slot=None):
         """Load game from file"""
         if slot is None:
@@ -331,6 +364,8 @@ class GameManager:
         save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
         
         try:
+            # A save to this slot may still be queued
+            get_io_service().flush(save_file)
             if os.path.exists(save_file):
                 with open(save_file, 'r') as f:
                     save_data = json.load(f)
@@ -338,13 +373,16 @@ class GameManager:
                 # Load all data
                 self.player_stats = save_data.get("player_stats", self.player_stats)
                 self.relationships = save_data.get("relationships", self.relationships)
-                self.story_flags = save_data.get("story_flags", self.story_flags)
+                self.story_flags.load(save_data.get("story_flags"))
                 self.inventory = save_data.get("inventory", self.inventory)
                 self.game_time = save_data.get("game_time", self.game_time)
                 self.achievements = save_data.get("achievements", self.achievements)
                 self.game_settings = save_data.get("game_settings", self.game_settings)
+                # Menu settings are global, not per save
+                self.settings_manager.apply_to(self.game_settings)
+                self.audio_manager.apply_settings(self.game_settings)
                 
-                print(f"📁 Game loaded from slot {slot}")
+                logger.info(f"📁 Game loaded from slot {slot}")
                 
                 # Change to saved scene if scene manager exists
                 saved_scene = save_data.get("current_scene", "main_menu")
@@ -353,10 +391,10 @@ class GameManager:
                 
                 return True
             else:
-                print(f"❌ No save file found in slot {slot}")
+                logger.error(f"❌ No save file found in slot {slot}")
                 return False
         except Exception as e:
-            print(f"❌ Error loading game: {e}")
+            logger.error(f"❌ Error loading game: {e}")
             return False
     
     def has_save_files(self):
@@ -409,7 +447,7 @@ class GameManager:
             "mood": "neutral"
         }
         self.relationships = PLAYER_START_RELATIONSHIPS.copy()
-        self.story_flags = {flag: False for flag in self.story_flags}
+        self.story_flags.clear()
         self.inventory = {"items": [], "key_items": [], "max_items": 50}
         self.game_time = {"day": 1, "hour": 8, "period": "morning"}
         self.achievements = {achievement: False for achievement in self.achievements}
@@ -424,7 +462,7 @@ class GameManager:
             "day": self.game_time["day"],
             "relationships_count": len([r for r in self.relationships.values() if r > 50]),
             "achievements_count": len([a for a in self.achievements.values() if a]),
-            "story_progress": len([f for f in self.story_flags.values() if f])
+            "story_progress": self.story_flags.count()
         }
     
     # === GAME FLOW METHODS ===
@@ -455,14 +493,14 @@ class GameManager:
     
     def debug_print_stats(self):
         """Print debug information"""
-        print("=== GAME MANAGER DEBUG ===")
-        print(f"Health: {self.player_stats['health']}")
-        print(f"Sync Ratio: {self.player_stats['sync_ratio']}")
-        print(f"Stress: {self.player_stats['stress_level']}")
-        print(f"Level: {self.player_stats['level']}")
-        print(f"Relationships: {self.relationships}")
-        print(f"Story Flags: {self.story_flags}")
-        print("========================")
+        logger.info("=== GAME MANAGER DEBUG ===")
+        logger.info(f"Health: {self.player_stats['health']}")
+        logger.info(f"Sync Ratio: {self.player_stats['sync_ratio']}")
+        logger.info(f"Stress: {self.player_stats['stress_level']}")
+        logger.info(f"Level: {self.player_stats['level']}")
+        logger.info(f"Relationships: {self.relationships}")
+        logger.info(f"Story Flags: {self.story_flags.to_dict()}")
+        logger.info("========================")
     
     def get_player_data(self):
         """Get comprehensive player data object for save/load operations"""
@@ -476,7 +514,7 @@ class GameManager:
                 self.current_mood = game_manager.player_stats['mood']
                 self.relationships = game_manager.relationships.copy()
                 self.inventory = game_manager.inventory['items'].copy()
-                self.story_flags = game_manager.story_flags.copy()
+                self.story_flags = game_manager.story_flags
                 self.position = [400, 300]  # Default position
                 self.battles_won = 0  # Could be tracked separately
                 self.missions_completed = 0  # Could be tracked separately
@@ -487,11 +525,24 @@ class GameManager:
         
         return PlayerData(self)
     
+    # === RANDOMNESS ===
+    
+    def get_scene_rng(self, scene_name):
+        """Create a seeded RNG for a scene (reproducible from the session seed)"""
+        seed = random.Random(f"{self.session_seed}:{self.rng_count}:{scene_name}").getrandbits(32)
+        self.rng_count += 1
+        if self.replay_log:
+            self.replay_log.log_seed(scene_name, seed)
+        return random.Random(seed)
+    
     def update(self, dt):
         """Update game manager (called every frame)"""
         # Update time tracking
         self.advance_time(0)  # Just update internal time without advancing game time
         
+        # Music crossfades
+        self.audio_manager.update(dt)
+        
         # Could add other periodic updates here like:
         # - Auto-save timer
         # - Achievement checks
@@ -505,8 +556,10 @@ class GameManager:
             try:
                 self.auto_save()
             except Exception as e:
-                print(f"⚠️ Auto-save during cleanup failed: {e}")
+                logger.warning(f"⚠️ Auto-save during cleanup failed: {e}")
+        self.read_lines.save()
+        self.audio_manager.cleanup()
         
         # Reset state
         self.game_running = False
-        print("🧹 Game Manager cleaned up")
\ No newline at end of file
+        logger.info("🧹 Game Manager cleaned up")
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""
+===============================
+INPUT RECORDING AND REPLAY
+===============================
+Deterministic session capture for benchmarks and bug reproduction
+
+FEATURES:
+- ✅ Per-frame input events and frame times written to a compact gzip stream
+- ✅ KEYDOWN text (unicode) recorded so typed input replays exactly
+- ✅ Scene RNG seeds recorded alongside input
+- ✅ Replay feeds events back through GameEngine._handle_events
+- ✅ Seed mismatches reported as desyncs
+- ✅ Replays run uncapped (headless when the dummy video driver is used)
+"""
+
+import pygame
+import gzip
+import struct
+import time
+from managers.game_log import get_logger
+
+logger = get_logger("input_replay")
+
+REPLAY_MAGIC = b"EVAREC2\x00"
+REPLAY_MAGIC_V1 = b"EVAREC1\x00"     # No KEYDOWN text; still replayable
+REPLAY_HEADER = "<8sQ"          # magic, session seed
+FRAME_HEADER = "<dH"            # dt, event count
+SEED_HEADER = "<QH"             # seed, scene name length
+FRAME_TAG = b"F"
+SEED_TAG = b"S"
+
+# Event type -> (struct format, [(attribute, value count)])
+RECORDED_EVENTS = {
+    pygame.QUIT: ("", []),
+    pygame.KEYDOWN: ("<iHi", [("key", 1), ("mod", 1), ("scancode", 1)]),
+    pygame.KEYUP: ("<iHi", [("key", 1), ("mod", 1), ("scancode", 1)]),
+    pygame.MOUSEMOTION: ("<hhhhBBB", [("pos", 2), ("rel", 2), ("buttons", 3)]),
+    pygame.MOUSEBUTTONDOWN: ("<hhB", [("pos", 2), ("button", 1)]),
+    pygame.MOUSEBUTTONUP: ("<hhB", [("pos", 2), ("button", 1)]),
+    pygame.MOUSEWHEEL: ("<hh", [("x", 1), ("y", 1)]),
+}
+
+# Event type -> text attribute, stored after the fixed fields as a length-prefixed UTF-8 string
+RECORDED_TEXT = {
+    pygame.KEYDOWN: "unicode",
+}
+
+
+class InputRecorder:
+    """
+    INPUT RECORDER
+    Streams input events, frame times and RNG seeds to a replay file
+    """
+    
+    def __init__(self, file_path):
+        """Initialize recorder (the file is opened by start)"""
+        self.file_path = file_path
+        self.file = None
+        self.frame_count = 0
+        self.event_count = 0
+    
+    def start(self, session_seed):
+        """Open the replay file and write its header"""
+        self.file = gzip.open(self.file_path, 'wb')
+        self.file.write(struct.pack(REPLAY_HEADER, REPLAY_MAGIC, session_seed))
+        logger.info(f"⏺️ Recording input to {self.file_path} (seed {session_seed})")
+    
+    def record_frame(self, dt, events):
+        """Write one frame's time step and input events"""
+        if self.file is None:
+            return
+        
+        recorded = [event for event in events if event.type in RECORDED_EVENTS]
+        chunks = [FRAME_TAG, struct.pack(FRAME_HEADER, dt, len(recorded))]
+        for event in recorded:
+            event_format, fields = RECORDED_EVENTS[event.type]
+            values = []
+            for attribute, count in fields:
+                value = getattr(event, attribute, 0)
+                values.extend(value[:count] if count > 1 else (value,))
+            chunks.append(struct.pack("<H", event.type))
+            if event_format:
+                chunks.append(struct.pack(event_format, *values))
+            if event.type in RECORDED_TEXT:
+                text = getattr(event, RECORDED_TEXT[event.type], "").encode('utf-8')[:255]
+                chunks.append(struct.pack("<B", len(text)) + text)
+        
+        self.file.write(b"".join(chunks))
+        self.frame_count += 1
+        self.event_count += len(recorded)
+    
+    def log_seed(self, scene_name, seed):
+        """Record a scene RNG seed"""
+        if self.file is None:
+            return
+        name = scene_name.encode('utf-8')
+        self.file.write(SEED_TAG + struct.pack(SEED_HEADER, seed, len(name)) + name)
+    
+    def close(self):
+        """Finish the replay file"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            logger.info(f"⏹️ Recorded {self.frame_count} frames, {self.event_count} events")
+
+
+class InputReplay:
+    """
+    INPUT REPLAY
+    Plays back a recorded session frame by frame
+    """
+    
+    def __init__(self, file_path):
+        """Load a replay file into memory"""
+        self.file_path = file_path
+        self.frames = []            # [(dt, [Event, ...]), ...]
+        self.seeds = []             # [(scene name, seed), ...]
+        self.session_seed = 0
+        self.has_text = True        # Version 1 recordings carry no KEYDOWN text
+        
+        # === PLAYBACK STATE ===
+        self.frame_index = 0
+        self.seed_index = 0
+        self.current_events = []
+        self.desynced = False
+        self.start_time = None
+        
+        self._load()
+        logger.info(f"▶️ Replay loaded: {len(self.frames)} frames (seed {self.session_seed})")
+    
+    def _load(self):
+        """Decode every frame and seed record"""
+        with gzip.open(self.file_path, 'rb') as f:
+            data = f.read()
+        
+        magic, self.session_seed = struct.unpack_from(REPLAY_HEADER, data, 0)
+        if magic not in (REPLAY_MAGIC, REPLAY_MAGIC_V1):
+            raise ValueError(f"Not a replay file: {self.file_path}")
+        self.has_text = magic == REPLAY_MAGIC
+        
+        offset = struct.calcsize(REPLAY_HEADER)
+        frame_header_size = struct.calcsize(FRAME_HEADER)
+        seed_header_size = struct.calcsize(SEED_HEADER)
+        while offset < len(data):
+            tag = data[offset:offset + 1]
+            offset += 1
+            
+            if tag == FRAME_TAG:
+                dt, count = struct.unpack_from(FRAME_HEADER, data, offset)
+                offset += frame_header_size
+                events = []
+                for _ in range(count):
+                    event, offset = self._decode_event(data, offset)
+                    events.append(event)
+                self.frames.append((dt, events))
+            
+            elif tag == SEED_TAG:
+                seed, length = struct.unpack_from(SEED_HEADER, data, offset)
+                offset += seed_header_size
+                self.seeds.append((data[offset:offset + length].decode('utf-8'), seed))
+                offset += length
+            
+            else:
+                raise ValueError(f"Corrupt replay record at byte {offset - 1}")
+    
+    def _decode_event(self, data, offset):
+        """Rebuild one pygame event"""
+        event_type = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        event_format, fields = RECORDED_EVENTS[event_type]
+        
+        attributes = {}
+        if event_format:
+            values = struct.unpack_from(event_format, data, offset)
+            offset += struct.calcsize(event_format)
+            index = 0
+            for attribute, count in fields:
+                attributes[attribute] = values[index] if count == 1 else tuple(values[index:index + count])
+                index += count
+        
+        text_attribute = RECORDED_TEXT.get(event_type)
+        if text_attribute:
+            if self.has_text:
+                length = data[offset]
+                attributes[text_attribute] = data[offset + 1:offset + 1 + length].decode('utf-8', errors='ignore')
+                offset += 1 + length
+            else:
+                attributes[text_attribute] = ""
+        
+        return pygame.event.Event(event_type, attributes), offset
+    
+    def next_frame(self):
+        """Advance to the next frame, returning its dt (None when finished)"""
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        
+        if self.frame_index >= len(self.frames):
+            self.current_events = []
+            return None
+        
+        dt, self.current_events = self.frames[self.frame_index]
+        self.frame_index += 1
+        return dt
+    
+    def get_events(self):
+        """Events recorded for the current frame"""
+        return self.current_events
+    
+    def log_seed(self, scene_name, seed):
+        """Compare a scene RNG seed with the recording"""
+        expected = self.seeds[self.seed_index] if self.seed_index < len(self.seeds) else None
+        self.seed_index += 1
+        if expected != (scene_name, seed) and not self.desynced:
+            self.desynced = True
+            logger.warning(f"⚠️ Replay desync at frame {self.frame_index}: expected seed {expected}, got {(scene_name, seed)}")
+    
+    def is_finished(self):
+        """Check if every frame has been played"""
+        return self.frame_index >= len(self.frames)
+    
+    def close(self):
+        """Report replay timing"""
+        if self.start_time is None:
+            return
+        elapsed = time.perf_counter() - self.start_time
+        fps = self.frame_index / elapsed if elapsed > 0 else 0
+        logger.info(f"⏹️ Replayed {self.frame_index} frames in {elapsed:.2f}s ({fps:.0f} fps)"
+                    f"{' - DESYNCED' if self.desynced else ''}")
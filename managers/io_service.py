@@ -0,0 +1,201 @@
+"""
+===============================
+BACKGROUND I/O SERVICE
+===============================
+One worker thread for every game file write
+
+FEATURES:
+- ✅ Saves, settings, dialogue files and crash logs written off the game thread
+- ✅ Bounded queue (writers wait only if IO_QUEUE_SIZE files are already queued)
+- ✅ Per-path coalescing: the latest write to a file wins
+- ✅ Atomic replace (temp file + os.replace), so a crash never leaves half a save
+- ✅ Completion callbacks delivered on the main thread by update()
+- ✅ flush() before reading a file back and on shutdown
+- ✅ Deletions share the same queue as writes
+"""
+
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict
+from managers.game_log import get_logger
+
+logger = get_logger("io_service")
+
+try:
+    from config import IO_QUEUE_SIZE
+except ImportError:
+    IO_QUEUE_SIZE = 64
+
+
+def _write_file(path, data, atomic):
+    """Write bytes to path (through a temp file when atomic)"""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    
+    target = path + ".tmp" if atomic else path
+    with open(target, 'wb') as f:
+        f.write(data)
+    if atomic:
+        os.replace(target, path)
+
+
+def _remove_file(path):
+    """Delete a file if it exists"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class IOService:
+    """
+    I/O SERVICE
+    Coalescing write queue drained by a single worker thread
+    """
+    
+    def __init__(self, queue_size=IO_QUEUE_SIZE):
+        """Initialize queue and start the worker"""
+        self.queue_size = queue_size
+        self.changed = threading.Condition()
+        self.pending = OrderedDict()        # path -> [job, callbacks]
+        self.running_path = None
+        self.completed = queue.Queue()      # (callbacks, error), drained on the main thread
+        self.stopped = False
+        self.owner_pid = os.getpid()
+        
+        # === STATISTICS ===
+        self.stats = {"queued": 0, "coalesced": 0, "completed": 0, "failed": 0}
+        
+        self.worker = threading.Thread(target=self._run, name="io-service", daemon=True)
+        self.worker.start()
+    
+    # === REQUESTS ===
+    
+    def write(self, path, data, callback=None, atomic=True):
+        """Queue a file write (str is saved as UTF-8); callback(error) runs on the main thread"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self.submit(path, lambda: _write_file(path, data, atomic), callback)
+    
+    def write_json(self, path, data, callback=None, indent=4):
+        """Queue a JSON file write (serialized now, so later changes to data are not saved)"""
+        self.write(path, json.dumps(data, indent=indent), callback)
+    
+    def remove(self, path, callback=None):
+        """Queue a file deletion (a missing file is not an error)"""
+        self.submit(path, lambda: _remove_file(path), callback)
+    
+    def submit(self, path, job, callback=None):
+        """Queue a job for path, replacing any job still waiting for the same path"""
+        path = os.path.normpath(path)
+        with self.changed:
+            if not self.stopped:
+                entry = self.pending.get(path)
+                if entry is not None:
+                    # Latest write wins and keeps the queue position of the job it replaces
+                    entry[0] = job
+                    self.stats["coalesced"] += 1
+                else:
+                    while len(self.pending) >= self.queue_size:
+                        self.changed.wait()
+                    entry = self.pending[path] = [job, []]
+                if callback:
+                    entry[1].append(callback)
+                self.stats["queued"] += 1
+                self.changed.notify_all()
+                return
+        
+        # Service already shut down: write on the calling thread
+        error = self._run_job(job)
+        if callback:
+            callback(error)
+    
+    # === WORKER ===
+    
+    def _run(self):
+        """Worker loop: run queued jobs oldest first"""
+        while True:
+            with self.changed:
+                while not self.pending and not self.stopped:
+                    self.changed.wait()
+                if not self.pending:
+                    return
+                path, (job, callbacks) = self.pending.popitem(last=False)
+                self.running_path = path
+                self.changed.notify_all()
+            
+            error = self._run_job(job)
+            
+            with self.changed:
+                # Queue callbacks before releasing flush() waiters so flush delivers them
+                if callbacks:
+                    self.completed.put((callbacks, error))
+                self.running_path = None
+                self.stats["failed" if error else "completed"] += 1
+                self.changed.notify_all()
+    
+    def _run_job(self, job):
+        """Run one job and return its error (None on success)"""
+        try:
+            job()
+            return None
+        except Exception as e:
+            return e
+    
+    # === MAIN THREAD ===
+    
+    def update(self):
+        """Deliver finished jobs' callbacks (call once per frame)"""
+        while True:
+            try:
+                callbacks, error = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            for callback in callbacks:
+                try:
+                    callback(error)
+                except Exception as e:
+                    logger.warning(f"⚠️ I/O callback error: {e}")
+    
+    def flush(self, path=None):
+        """Wait until path (or every queued file) is written, then deliver callbacks"""
+        if path is not None:
+            path = os.path.normpath(path)
+        with self.changed:
+            if path is None:
+                while self.pending or self.running_path is not None:
+                    self.changed.wait()
+            else:
+                while path in self.pending or self.running_path == path:
+                    self.changed.wait()
+        self.update()
+    
+    def shutdown(self):
+        """Write everything still queued and stop the worker"""
+        self.flush()
+        with self.changed:
+            self.stopped = True
+            self.changed.notify_all()
+        self.worker.join()
+        self.update()
+    
+    def get_stats(self):
+        """Get queue statistics"""
+        with self.changed:
+            stats = dict(self.stats)
+            stats["pending"] = len(self.pending)
+        return stats
+
+
+_shared_service = None
+
+
+def get_io_service():
+    """Get the shared I/O service (a new one in forked worker processes)"""
+    global _shared_service
+    if _shared_service is None or _shared_service.owner_pid != os.getpid():
+        _shared_service = IOService()
+    return _shared_service
@@ -0,0 +1,141 @@
+"""
+===============================
+READ LINE TRACKER
+===============================
+Persistent record of every dialogue line the player has seen
+
+FEATURES:
+- ✅ Line ids interned to stable bit positions
+- ✅ Compact bitset of seen lines (one bit per line)
+- ✅ Shared across all save slots (saves/read_lines.dat)
+- ✅ Fast lookup of the first unseen line for skip mode
+"""
+
+import os
+import struct
+from managers.io_service import get_io_service
+from managers.game_log import get_logger
+
+logger = get_logger("read_line_tracker")
+
+READ_LINES_MAGIC = b"EVARL1\x00\x00"
+READ_LINES_HEADER = "<8sII"     # magic, id count, id blob length
+
+
+class ReadLineTracker:
+    """
+    READ LINE TRACKER
+    Bitset of seen dialogue line ids, persisted independently of save slots
+    """
+    
+    def __init__(self, save_directory="saves", filename="read_lines.dat"):
+        """Initialize tracker and load existing read history"""
+        self.file_path = os.path.join(save_directory, filename)
+        self.line_ids = []          # bit position -> line id
+        self.bit_positions = {}     # line id -> bit position
+        self.seen_bits = bytearray()
+        self.dirty = False
+        
+        self.load()
+    
+    def register(self, line_id):
+        """Get the bit position for a line id, assigning one if new"""
+        position = self.bit_positions.get(line_id)
+        if position is None:
+            position = len(self.line_ids)
+            self.line_ids.append(line_id)
+            self.bit_positions[line_id] = position
+            if position // 8 >= len(self.seen_bits):
+                self.seen_bits.append(0)
+            self.dirty = True
+        return position
+    
+    def mark_seen(self, line_id):
+        """Record a line as seen"""
+        position = self.register(line_id)
+        mask = 1 << (position & 7)
+        if not self.seen_bits[position >> 3] & mask:
+            self.seen_bits[position >> 3] |= mask
+            self.dirty = True
+    
+    def is_seen(self, line_id):
+        """Check if a line has been seen (unknown ids are unseen)"""
+        position = self.bit_positions.get(line_id)
+        if position is None:
+            return False
+        return bool(self.seen_bits[position >> 3] & (1 << (position & 7)))
+    
+    def first_unseen(self, line_ids, start=0):
+        """Get index of the first unseen line at or after start (len if all seen)"""
+        for index in range(start, len(line_ids)):
+            if not self.is_seen(line_ids[index]):
+                return index
+        return len(line_ids)
+    
+    def get_seen_count(self):
+        """Number of lines marked as seen"""
+        return sum(bin(byte).count("1") for byte in self.seen_bits)
+    
+    def get_known_count(self):
+        """Number of line ids with a bit position"""
+        return len(self.line_ids)
+    
+    def clear(self):
+        """Forget all read history"""
+        self.line_ids = []
+        self.bit_positions = {}
+        self.seen_bits = bytearray()
+        self.dirty = True
+    
+    def load(self):
+        """Load read history from disk"""
+        if not os.path.exists(self.file_path):
+            return False
+        
+        try:
+            with open(self.file_path, 'rb') as f:
+                data = f.read()
+            
+            magic, id_count, blob_length = struct.unpack_from(READ_LINES_HEADER, data, 0)
+            if magic != READ_LINES_MAGIC:
+                logger.warning(f"⚠️ Ignoring unrecognized read history file: {self.file_path}")
+                return False
+            
+            offset = struct.calcsize(READ_LINES_HEADER)
+            blob = data[offset:offset + blob_length].decode('utf-8')
+            self.line_ids = blob.split("\n") if id_count else []
+            self.bit_positions = {line_id: i for i, line_id in enumerate(self.line_ids)}
+            byte_count = (id_count + 7) // 8
+            self.seen_bits = bytearray(data[offset + blob_length:offset + blob_length + byte_count])
+            if len(self.seen_bits) < byte_count:
+                # Truncated file: lines whose bits are missing count as unseen
+                self.seen_bits.extend(bytes(byte_count - len(self.seen_bits)))
+            self.dirty = False
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load read history: {e}")
+            self.clear()
+            self.dirty = False
+            return False
+    
+    def save(self):
+        """Save read history if it changed"""
+        if not self.dirty:
+            return True
+        
+        try:
+            blob = "\n".join(self.line_ids).encode('utf-8')
+            header = struct.pack(READ_LINES_HEADER, READ_LINES_MAGIC, len(self.line_ids), len(blob))
+            get_io_service().write(self.file_path, header + blob + bytes(self.seen_bits),
+                                   callback=self._on_saved)
+            self.dirty = False
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error saving read history: {e}")
+            return False
+    
+    def _on_saved(self, error):
+        """Mark history dirty again if the write failed"""
+        if error:
+            logger.error(f"❌ Error saving read history: {error}")
+            self.dirty = True
@@ -13,24 +13,27 @@ from scenes.nerv_arrival_scene import NervArrivalScene
 from scenes.hub_scene import HubScene
 from scenes.town_scene import TownScene
 from scenes.action_battle_scene import ActionBattleScene
+from managers.game_log import get_logger, set_log_context
+
+logger = get_logger("scene_manager")
 
 # Import enhanced scenes with error handling
 try:
     from scenes.pause_menu import PauseMenu
 except ImportError as e:
-    print(f"⚠️ Could not import PauseMenu: {e}")
+    logger.warning(f"⚠️ Could not import PauseMenu: {e}")
     PauseMenu = None
 
 try:
     from scenes.settings_menu import SettingsMenu
 except ImportError as e:
-    print(f"⚠️ Could not import SettingsMenu: {e}")
+    logger.warning(f"⚠️ Could not import SettingsMenu: {e}")
     SettingsMenu = None
 
 try:
     from scenes.art_gallery import ArtGallery
 except ImportError as e:
-    print(f"⚠️ Could not import ArtGallery: {e}")
+    logger.warning(f"⚠️ Could not import ArtGallery: {e}")
     ArtGallery = None
 
 class SceneManager:
@@ -42,7 +45,7 @@ class SceneManager:
         self.current_scene = None
         self.scene_stack = []
         
-        print(f"🎬 Scene Manager initializing with game_manager: {game_manager is not None}")
+        logger.info(f"🎬 Scene Manager initializing with game_manager: {game_manager is not None}")
         
         # === SCENE REGISTRY ===
         self.scene_classes = {
@@ -63,19 +66,11 @@ class SceneManager:
         if ArtGallery:
             self.scene_classes["art_gallery"] = ArtGallery
         
-        # === STORY PROGRESS ===
-        self.story_flags = {
-            "tutorial_complete": False,
-            "first_angel_defeated": False,
-            "bedroom_complete": False,
-            "nerv_briefing_complete": False
-        }
-        
         # === PAUSE MENU INTEGRATION ===
         self.pause_menu_previous_scene = None
         self.pause_menu_instance = None
         
-        print(f"🎬 Scene Manager initialized with {len(self.scene_classes)} scenes")
+        logger.info(f"🎬 Scene Manager initialized with {len(self.scene_classes)} scenes")
     
     def change_scene(self, scene_name, **kwargs):
         """Change to new scene with enhanced handling"""
@@ -84,11 +79,11 @@ class SceneManager:
             kwargs['angel_name'] = "Tutorial Angel"
         
         if scene_name not in self.scene_classes:
-            print(f"❌ Unknown scene: {scene_name}")
+            logger.error(f"❌ Unknown scene: {scene_name}")
             return
         
         try:
-            print(f"🎬 Changing to scene: {scene_name}")
+            logger.info(f"🎬 Changing to scene: {scene_name}")
             
             scene_class = self.scene_classes[scene_name]
             
@@ -105,12 +100,11 @@ class SceneManager:
                 # Standard scenes
                 self.current_scene = scene_class(self.game_manager, self)
             
-            print(f"✅ Scene changed to: {scene_name}")
+            set_log_context(scene=scene_name)
+            logger.info(f"✅ Scene changed to: {scene_name}")
             
         except Exception as e:
-            print(f"❌ Scene change error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ Scene change error: {e}")
     
     def handle_event(self, event):
         """Handle events with pause menu integration"""
@@ -131,7 +125,7 @@ class SceneManager:
             try:
                 self.current_scene.handle_event(event)
             except Exception as e:
-                print(f"❌ Scene event error: {e}")
+                logger.exception(f"❌ Scene event error: {e}")
     
     def update(self, dt):
         """Update current scene"""
@@ -139,7 +133,7 @@ class SceneManager:
             try:
                 self.current_scene.update(dt)
             except Exception as e:
-                print(f"❌ Scene update error: {e}")
+                logger.exception(f"❌ Scene update error: {e}")
     
     def render(self, screen):
         """Render current scene"""
@@ -147,7 +141,7 @@ class SceneManager:
             try:
                 self.current_scene.render(screen)
             except Exception as e:
-                print(f"❌ Scene render error: {e}")
+                logger.exception(f"❌ Scene render error: {e}")
                 # Emergency fallback
                 screen.fill((20, 20, 40))
                 font = pygame.font.Font(None, 48)
@@ -165,16 +159,25 @@ class SceneManager:
     # Rest of the methods remain the same...
     def complete_tutorial(self):
         """Mark tutorial as complete"""
-        self.story_flags["tutorial_complete"] = True
-        print("🎓 Tutorial completed")
+        self.game_manager.set_story_flag("tutorial_complete", True)
+        logger.info("🎓 Tutorial completed")
     
     def start_angel_battle(self, angel_name="Sachiel"):
         """Start Angel battle"""
         self.change_scene("action_battle", angel_name=angel_name)
     
+    @property
+    def story_flags(self):
+        """Story flags (the game manager's store, never a copy)"""
+        return self.game_manager.story_flags
+    
     def get_story_progress(self):
         """Get story progress"""
-        return self.story_flags.copy()
+        return self.game_manager.story_flags
+    
+    def set_story_flag(self, flag_name, value):
+        """Set story flag"""
+        self.game_manager.set_story_flag(flag_name, value)
     
     def get_current_scene_name(self):
         """Get current scene name"""
@@ -182,7 +185,7 @@ class SceneManager:
             try:
                 return self.current_scene.__class__.__name__
             except AttributeError:
-                print("⚠️ Current scene has no __class__ attribute")
+                logger.warning("⚠️ Current scene has no __class__ attribute")
                 return "Unknown"
         return "None"
     
@@ -190,4 +193,4 @@ class SceneManager:
         """Clean up scene manager"""
         self.current_scene = None
         self.scene_stack.clear()
-        print("🧹 Scene Manager cleaned up")
\ No newline at end of file
+        logger.info("🧹 Scene Manager cleaned up")
\ No newline at end of file
@@ -8,9 +8,29 @@ Professional settings management system
 import pygame
 import json
 import os
+from managers.io_service import get_io_service
 
 # Add proper imports for screen dimensions
 from config import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.game_log import get_logger
+
+logger = get_logger("settings_manager")
+
+# Text speed slider level (1-5) -> typewriter characters per second (level 3 is the default 50)
+TEXT_SPEED_CPS = (20, 35, 50, 80, 120)
+
+
+def to_game_setting(category, key, value):
+    """Map a menu setting onto the game_settings entry the game reads: (key, value), or None"""
+    if category == "audio":
+        return key, value
+    if (category, key) == ("gameplay", "text_speed"):
+        level = min(max(int(round(value)), 1), len(TEXT_SPEED_CPS))
+        return "text_speed", TEXT_SPEED_CPS[level - 1]
+    if (category, key) == ("gameplay", "skip_read"):
+        return "skip_read_text", bool(value)
+    return None
+
 
 class SettingsManager:
     """Complete settings management system"""
@@ -49,7 +69,7 @@ class SettingsManager:
         self._ensure_directories()
         self.load_settings()
         
-        print("⚙️ Settings Manager initialized")
+        logger.info("⚙️ Settings Manager initialized")
     
     def _ensure_directories(self):
         """Ensure settings directory exists"""
@@ -64,19 +84,23 @@ class SettingsManager:
                     # Merge with defaults to handle new settings
                     self._merge_settings(loaded_settings)
         except Exception as e:
-            print(f"⚠️ Error loading settings: {e}")
+            logger.warning(f"⚠️ Error loading settings: {e}")
             self.current_settings = self.default_settings.copy()
     
     def save_settings(self):
-        """Save settings to file"""
+        """Queue settings for writing (repeated saves coalesce into one write)"""
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.current_settings, f, indent=4)
+            get_io_service().write_json(self.settings_file, self.current_settings, callback=self._on_settings_saved)
             return True
         except Exception as e:
-            print(f"⚠️ Error saving settings: {e}")
+            logger.warning(f"⚠️ Error saving settings: {e}")
             return False
     
+    def _on_settings_saved(self, error):
+        """Report a failed settings write"""
+        if error:
+            logger.warning(f"⚠️ Error saving settings: {error}")
+    
     def get_setting(self, category, key):
         """Get specific setting value"""
         return self.current_settings.get(category, {}).get(key)
@@ -87,6 +111,14 @@ class SettingsManager:
             self.current_settings[category] = {}
         self.current_settings[category][key] = value
     
+    def apply_to(self, game_settings):
+        """Copy every setting the game reads into game_settings"""
+        for category, settings in self.current_settings.items():
+            for key, value in settings.items():
+                mapped = to_game_setting(category, key, value)
+                if mapped:
+                    game_settings[mapped[0]] = mapped[1]
+    
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
         self.current_settings = self.default_settings.copy()
@@ -0,0 +1,135 @@
+"""
+===============================
+STORY FLAGS
+===============================
+Single store for every story flag in the game
+
+FEATURES:
+- ✅ Flag names interned to bit positions
+- ✅ All flags held in one integer bitset (no per-flag dicts to copy)
+- ✅ Multi-flag conditions checked as one mask test
+- ✅ Saves as the bitset plus its name table (old dict saves still load)
+- ✅ Dict-style reads for older scene code
+"""
+
+
+class StoryFlags:
+    """
+    STORY FLAGS
+    Bitset of story flags shared by GameManager, SceneManager and DialogueManager
+    """
+    
+    def __init__(self, flag_names=()):
+        """Initialize store with known flags (all unset)"""
+        self.flag_names = []        # bit position -> flag name
+        self.bit_positions = {}     # flag name -> bit position
+        self.masks = {}             # condition value -> cached mask
+        self.bits = 0
+        
+        for flag_name in flag_names:
+            self.register(flag_name)
+    
+    def register(self, flag_name):
+        """Get the bit position for a flag, assigning one if new"""
+        position = self.bit_positions.get(flag_name)
+        if position is None:
+            position = len(self.flag_names)
+            self.flag_names.append(flag_name)
+            self.bit_positions[flag_name] = position
+        return position
+    
+    def mask(self, flag_names):
+        """Get the mask for one flag name or a list of them (cached per condition)"""
+        key = flag_names if isinstance(flag_names, str) else tuple(flag_names)
+        mask = self.masks.get(key)
+        if mask is None:
+            names = (key,) if isinstance(key, str) else key
+            mask = 0
+            for flag_name in names:
+                mask |= 1 << self.register(flag_name)
+            self.masks[key] = mask
+        return mask
+    
+    # === FLAGS ===
+    
+    def get(self, flag_name, default=False):
+        """Check one flag (unknown flags are unset)"""
+        position = self.bit_positions.get(flag_name)
+        if position is None:
+            return default
+        return bool(self.bits >> position & 1)
+    
+    def set(self, flag_name, value=True):
+        """Set or clear one flag"""
+        bit = 1 << self.register(flag_name)
+        if value:
+            self.bits |= bit
+        else:
+            self.bits &= ~bit
+    
+    def has_all(self, mask):
+        """Check that every flag in a mask is set"""
+        return self.bits & mask == mask
+    
+    def has_any(self, mask):
+        """Check that at least one flag in a mask is set"""
+        return bool(self.bits & mask)
+    
+    def count(self):
+        """Number of flags set"""
+        return bin(self.bits).count("1")
+    
+    def clear(self):
+        """Unset every flag (names keep their bit positions)"""
+        self.bits = 0
+    
+    # === DICT-STYLE ACCESS ===
+    
+    def __getitem__(self, flag_name):
+        """Check one flag"""
+        return self.get(flag_name)
+    
+    def __setitem__(self, flag_name, value):
+        """Set or clear one flag"""
+        self.set(flag_name, value)
+    
+    def __contains__(self, flag_name):
+        """Check if a flag name is known"""
+        return flag_name in self.bit_positions
+    
+    def __iter__(self):
+        """Iterate known flag names"""
+        return iter(self.flag_names)
+    
+    def __len__(self):
+        """Number of known flags"""
+        return len(self.flag_names)
+    
+    def items(self):
+        """Iterate (flag name, value) for every known flag"""
+        bits = self.bits
+        return [(flag_name, bool(bits >> position & 1)) for position, flag_name in enumerate(self.flag_names)]
+    
+    def to_dict(self):
+        """Get flags as a plain name -> bool dict (debug output, old save formats)"""
+        return dict(self.items())
+    
+    # === SAVE/LOAD ===
+    
+    def to_save(self):
+        """Get JSON-ready save data"""
+        return {"names": list(self.flag_names), "bits": self.bits}
+    
+    def load(self, data):
+        """Replace flags from save data (bitset save or an older name -> bool dict)"""
+        self.bits = 0
+        if not data:
+            return
+        
+        if "bits" in data and "names" in data:
+            saved_bits = int(data["bits"])
+            for position, flag_name in enumerate(data["names"]):
+                self.set(flag_name, saved_bits >> position & 1)
+        else:
+            for flag_name, value in data.items():
+                self.set(flag_name, value)
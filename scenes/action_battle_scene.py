@@ -7,7 +7,11 @@ Enhanced battle scene with Angel combat
 
 import pygame
 import math
-import random
+from entities.component_store import ComponentStore, integrate, expire
+from entities.battle_core import BattleCore
+from managers.game_log import get_logger
+
+logger = get_logger("action_battle_scene")
 
 # Add proper imports for screen dimensions
 try:
@@ -26,16 +30,18 @@ class ActionBattleScene:
         self.scene_manager = scene_manager
         self.angel_name = angel_name
         
-        # Battle state
-        self.battle_phase = "approach"  # approach, combat, victory, defeat
-        self.eva_health = 100
-        self.angel_health = 100
-        self.sync_ratio = 75.0
-        self.at_field_active = False
+        # Seeded per scene so recorded sessions replay identically
+        self.rng = game_manager.get_scene_rng("action_battle")
+        
+        # Battle rules (shared with the headless battle simulator)
+        self.battle = BattleCore(angel_name, self.rng)
         
         # Animation
         self.animation_timer = 0
-        self.explosion_effects = []
+        self.explosion_effects = ComponentStore({"size": 1, "growth": 1})
+        
+        # City skyline is rolled once (rolling it per frame made it flicker and broke replays)
+        self.city_heights = [self.rng.randint(100, 200) for _ in range(0, SCREEN_WIDTH, 60)]
         
         # UI
         self.fonts = {
@@ -52,7 +58,7 @@ class ActionBattleScene:
             "ESC: Emergency Exit"
         ]
         
-        print(f"⚔️ Battle Scene initialized - Angel: {angel_name}")
+        logger.info(f"⚔️ Battle Scene initialized - Angel: {angel_name}")
     
     def handle_event(self, event):
         """Handle battle events"""
@@ -68,71 +74,47 @@ class ActionBattleScene:
     
     def _player_attack(self):
         """Execute player attack"""
-        if self.battle_phase == "combat":
-            damage = random.randint(15, 25)
-            self.angel_health = max(0, self.angel_health - damage)
-            self._add_explosion_effect(SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2)
-            
-            if self.angel_health <= 0:
-                self.battle_phase = "victory"
+        self.battle.player_attack()
     
     def _activate_at_field(self):
         """Activate AT Field defense"""
-        self.at_field_active = True
-        self.sync_ratio = min(100, self.sync_ratio + 5)
+        self.battle.activate_at_field()
     
     def _special_attack(self):
         """Execute special attack"""
-        if self.sync_ratio >= 80:
-            damage = random.randint(30, 40)
-            self.angel_health = max(0, self.angel_health - damage)
-            self.sync_ratio -= 20
-            self._add_explosion_effect(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.battle.special_attack()
     
     def _emergency_exit(self):
         """Emergency retreat"""
-        self.battle_phase = "defeat"
+        self.battle.retreat()
         self.scene_manager.change_scene("hub")
     
     def _add_explosion_effect(self, x, y):
         """Add explosion visual effect"""
-        self.explosion_effects.append({
-            "x": x, "y": y, "timer": 0.5, "size": 20
-        })
+        self.explosion_effects.spawn(position=(x, y), timer=0.5, size=20, growth=50)
     
     def update(self, dt):
         """Update battle scene"""
         self.animation_timer += dt
         
-        # Update explosion effects
-        for effect in self.explosion_effects[:]:
-            effect["timer"] -= dt
-            effect["size"] += dt * 50
-            if effect["timer"] <= 0:
-                self.explosion_effects.remove(effect)
+        # Battle rules and Angel AI
+        self.battle.update(dt)
+        for event, _ in self.battle.pop_events():
+            if event == "attack":
+                self._add_explosion_effect(SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2)
+            elif event == "special":
+                self._add_explosion_effect(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         
-        # Angel AI
-        if self.battle_phase == "combat" and random.random() < 0.02:
-            self._angel_attack()
+        # Update explosion effects
+        integrate(self.explosion_effects, "size", "growth", dt)
+        expire(self.explosion_effects, dt)
         
-        # Battle phase transitions
-        if self.battle_phase == "approach" and self.animation_timer > 3:
-            self.battle_phase = "combat"
-        elif self.battle_phase == "victory" and self.animation_timer > 10:
+        # Scene transitions
+        if self.battle.phase == "victory" and self.animation_timer > 10:
             self._victory_sequence()
-        elif self.battle_phase == "defeat":
+        elif self.battle.phase == "defeat":
             self.scene_manager.change_scene("hub")
     
-    def _angel_attack(self):
-        """Angel attacks player"""
-        if not self.at_field_active:
-            damage = random.randint(10, 20)
-            self.eva_health = max(0, self.eva_health - damage)
-            if self.eva_health <= 0:
-                self.battle_phase = "defeat"
-        else:
-            self.at_field_active = False
-    
     def _victory_sequence(self):
         """Handle victory"""
         self.game_manager.modify_relationship("Misato", 5)
@@ -159,16 +141,15 @@ class ActionBattleScene:
         self._render_battle_ui(screen)
         
         # Phase-specific rendering
-        if self.battle_phase == "approach":
+        if self.battle.phase == "approach":
             self._render_approach_sequence(screen)
-        elif self.battle_phase == "victory":
+        elif self.battle.phase == "victory":
             self._render_victory_sequence(screen)
     
     def _render_city_background(self, screen):
         """Render city background"""
         # Simple city silhouette
-        for i in range(0, SCREEN_WIDTH, 60):
-            height = random.randint(100, 200)
+        for i, height in zip(range(0, SCREEN_WIDTH, 60), self.city_heights):
             building_rect = pygame.Rect(i, SCREEN_HEIGHT - height, 50, height)
             pygame.draw.rect(screen, (30, 30, 40), building_rect)
             pygame.draw.rect(screen, (50, 50, 60), building_rect, 1)
@@ -184,7 +165,7 @@ class ActionBattleScene:
         pygame.draw.rect(screen, COLORS['TEXT_WHITE'], eva_rect, 2)
         
         # AT Field effect
-        if self.at_field_active:
+        if self.battle.at_field_active:
             at_field_radius = 80 + 10 * math.sin(self.animation_timer * 10)
             pygame.draw.circle(screen, (*COLORS['TERMINAL_GREEN'], 100), 
                              (eva_x, eva_y), int(at_field_radius), 3)
@@ -200,24 +181,28 @@ class ActionBattleScene:
                                 angel_size, angel_size)
         pygame.draw.rect(screen, COLORS['NERV_RED'], angel_rect)
         pygame.draw.rect(screen, COLORS['WARNING_ORANGE'], angel_rect, 3)
+        
+        # Telegraph an incoming attack
+        if self.battle.angel_brain.is_winding_up():
+            pygame.draw.rect(screen, COLORS['TEXT_WHITE'], angel_rect.inflate(16, 16), 2)
     
     def _render_effects(self, screen):
         """Render visual effects"""
-        for effect in self.explosion_effects:
-            alpha = int(255 * (effect["timer"] / 0.5))
-            explosion_surface = pygame.Surface((effect["size"] * 2, effect["size"] * 2), pygame.SRCALPHA)
+        for _, (x, y), timer, size in self.explosion_effects.rows("position", "timer", "size"):
+            alpha = int(255 * (timer / 0.5))
+            explosion_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
             pygame.draw.circle(explosion_surface, (*COLORS['WARNING_ORANGE'], alpha), 
-                             (effect["size"], effect["size"]), effect["size"])
-            screen.blit(explosion_surface, (effect["x"] - effect["size"], effect["y"] - effect["size"]))
+                             (size, size), size)
+            screen.blit(explosion_surface, (x - size, y - size))
     
     def _render_battle_ui(self, screen):
         """Render battle UI"""
         # Health bars
-        self._render_health_bar(screen, "EVA", self.eva_health, 50, 50, COLORS['SUCCESS_GREEN'])
-        self._render_health_bar(screen, "ANGEL", self.angel_health, 50, 90, COLORS['NERV_RED'])
+        self._render_health_bar(screen, "EVA", self.battle.eva_health, 50, 50, COLORS['SUCCESS_GREEN'])
+        self._render_health_bar(screen, "ANGEL", self.battle.angel_health, 50, 90, COLORS['NERV_RED'])
         
         # Sync ratio
-        sync_text = f"Sync Ratio: {self.sync_ratio:.1f}%"
+        sync_text = f"Sync Ratio: {self.battle.sync_ratio:.1f}%"
         sync_surface = self.fonts["ui"].render(sync_text, True, COLORS['EVA_PURPLE'])
         screen.blit(sync_surface, (50, 130))
         
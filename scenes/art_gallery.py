@@ -2,11 +2,21 @@
 ===============================
 ART GALLERY - WORKING VERSION
 ===============================
-Simplified but functional art gallery
+Thumbnail grid gallery backed by a background loading pipeline
+
+FEATURES:
+- ✅ Scans assets/art/<category>/ without decoding any images
+- ✅ Only visible grid cells plus a prefetch window are loaded
+- ✅ Thumbnails decoded on worker threads and cached on disk
+- ✅ Full-resolution view with a memory-budgeted LRU
+- ✅ Sample artwork when a category folder has no images
 """
 
 import pygame
 import os
+from managers.game_log import get_logger
+
+logger = get_logger("art_gallery")
 
 # Import screen dimensions
 try:
@@ -16,8 +26,54 @@ except ImportError:
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
 
+from assets.thumbnail_pipeline import get_thumbnail_pipeline, IMAGE_EXTENSIONS
+from ui.text_layout import get_text_layout
+from graphics.procedural_textures import get_procedural_textures
+from assets.surface_registry import get_surface_registry
+
+# === SAMPLE ART ===
+# Module level so registry loaders hold only the sample key, not a gallery instance
+
+def _create_sample_surface(category_name, index):
+    """Create a sample art surface"""
+    # Background gradient (copied so the border and title do not touch the cached texture)
+    surface = get_procedural_textures().vertical_gradient((300, 200), (50, 50, 70), (150, 150, 170)).copy()
+    
+    # Border
+    pygame.draw.rect(surface, COLORS['NERV_RED'], surface.get_rect(), 3)
+    
+    # Title
+    font = get_text_layout().get_font(24)
+    title_text = f"{category_name} {index}"
+    title_surface = font.render(title_text, True, COLORS['TEXT_WHITE'])
+    title_rect = title_surface.get_rect(center=(150, 100))
+    surface.blit(title_surface, title_rect)
+    
+    return surface
+
+
+def _get_sample_surface(surfaces, sample):
+    """Get a sample item's surface (built on first use and again after eviction)"""
+    name = "{}_{}".format(*sample)
+    surface = surfaces.get("art_gallery", name)
+    if surface is None:
+        loader = lambda: _create_sample_surface(*sample)
+        surface = surfaces.register("art_gallery", name, loader(), loader)
+    return surface
+
+
+def _get_sample_thumbnail(surfaces, sample):
+    """Get a sample item's grid thumbnail (built on first use and again after eviction)"""
+    name = "{}_{}_thumbnail".format(*sample)
+    thumbnail = surfaces.get("art_gallery", name)
+    if thumbnail is None:
+        loader = lambda: pygame.transform.smoothscale(_get_sample_surface(surfaces, sample), (140, 93))
+        thumbnail = surfaces.register("art_gallery", name, loader(), loader)
+    return thumbnail
+
+
 class ArtGallery:
-    """Simplified working Art Gallery"""
+    """Thumbnail grid Art Gallery"""
     
     def __init__(self, game_manager, scene_manager):
         """Initialize art gallery"""
@@ -32,6 +88,17 @@ class ArtGallery:
         # Layout
         self.sidebar_width = 200
         self.mouse_pos = (0, 0)
+        self.content_rect = pygame.Rect(self.sidebar_width + 20, 80,
+                                        SCREEN_WIDTH - self.sidebar_width - 40,
+                                        SCREEN_HEIGHT - 120)
+        
+        # === GRID LAYOUT ===
+        self.cell_width = 170
+        self.cell_height = 135
+        self.columns = max(1, (self.content_rect.width - 10) // self.cell_width)
+        self.visible_rows = max(1, (self.content_rect.height - 10) // self.cell_height)
+        self.prefetch_rows = 2
+        self.scroll_row = 0
         
         # Categories
         self.categories = [
@@ -42,53 +109,60 @@ class ArtGallery:
         ]
         
         # Fonts
-        self.title_font = pygame.font.Font(None, 36)
-        self.category_font = pygame.font.Font(None, 22)
-        self.info_font = pygame.font.Font(None, 18)
+        self.text_layout = get_text_layout()
+        self.title_font = self.text_layout.get_font(36)
+        self.category_font = self.text_layout.get_font(22)
+        self.info_font = self.text_layout.get_font(18)
+        self.small_font = self.text_layout.get_font(14)
+        self.controls_font = self.text_layout.get_font(16)
         
-        # Sample art
+        # Art collections are listed lazily; nothing is decoded here
+        self.thumbnails = get_thumbnail_pipeline()
+        self.surfaces = get_surface_registry()  # Sample art lives here, so it can be evicted and redrawn
         self.art_collections = {}
-        self._create_sample_collections()
+        self.detail_cache = None  # (full image, scaled surface) for the full view
         
-        print("🎨 Art Gallery initialized (simplified version)")
+        logger.info("🎨 Art Gallery initialized (thumbnail grid)")
     
-    def _create_sample_collections(self):
-        """Create sample art collections"""
-        for category in self.categories:
-            self.art_collections[category["id"]] = [
-                {
-                    "title": f"Sample {category['name']} 1",
-                    "description": f"Sample artwork for {category['name']} category",
-                    "surface": self._create_sample_surface(category["name"], 1)
-                },
-                {
-                    "title": f"Sample {category['name']} 2", 
-                    "description": f"Another sample artwork for {category['name']}",
-                    "surface": self._create_sample_surface(category["name"], 2)
-                }
-            ]
-    
-    def _create_sample_surface(self, category_name, index):
-        """Create a sample art surface"""
-        surface = pygame.Surface((300, 200))
-        
-        # Background gradient
-        for y in range(200):
-            color_value = int(50 + (y / 200) * 100)
-            color = (color_value, color_value, color_value + 20)
-            pygame.draw.line(surface, color, (0, y), (300, y))
-        
-        # Border
-        pygame.draw.rect(surface, COLORS['NERV_RED'], surface.get_rect(), 3)
+    def _get_collection(self, category_id):
+        """List a category's images (file names only), with samples as fallback"""
+        collection = self.art_collections.get(category_id)
+        if collection is not None:
+            return collection
         
-        # Title
-        font = pygame.font.Font(None, 24)
-        title_text = f"{category_name} {index}"
-        title_surface = font.render(title_text, True, COLORS['TEXT_WHITE'])
-        title_rect = title_surface.get_rect(center=(150, 100))
-        surface.blit(title_surface, title_rect)
+        collection = []
+        folder = os.path.join("assets", "art", category_id)
+        if os.path.isdir(folder):
+            with os.scandir(folder) as entries:
+                for entry in sorted(entries, key=lambda e: e.name.lower()):
+                    if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                        collection.append({
+                            "title": os.path.splitext(entry.name)[0].replace("_", " ").title(),
+                            "description": entry.path,
+                            "path": entry.path
+                        })
+        
+        if not collection:
+            collection = self._create_sample_collection(category_id)
         
-        return surface
+        self.art_collections[category_id] = collection
+        return collection
+    
+    def _create_sample_collection(self, category_id):
+        """Create sample entries (surfaces are built when first shown)"""
+        category_name = next(cat["name"] for cat in self.categories if cat["id"] == category_id)
+        return [
+            {
+                "title": f"Sample {category_name} 1",
+                "description": f"Sample artwork for {category_name} category",
+                "path": None, "sample": (category_name, 1)
+            },
+            {
+                "title": f"Sample {category_name} 2",
+                "description": f"Another sample artwork for {category_name}",
+                "path": None, "sample": (category_name, 2)
+            }
+        ]
     
     def handle_event(self, event):
         """Handle art gallery events"""
@@ -99,13 +173,26 @@ class ArtGallery:
             if event.button == 1:  # Left click
                 self._handle_left_click(event.pos)
         
+        elif event.type == pygame.MOUSEWHEEL and self.viewing_mode == "gallery":
+            self._scroll(-event.y)
+        
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
-                self.scene_manager.change_scene("main_menu")
+                if self.viewing_mode == "detail":
+                    self.viewing_mode = "gallery"
+                else:
+                    self.thumbnails.cancel_pending()
+                    self.scene_manager.change_scene("main_menu")
             elif event.key == pygame.K_LEFT:
                 self._navigate_art(-1)
             elif event.key == pygame.K_RIGHT:
                 self._navigate_art(1)
+            elif event.key == pygame.K_UP:
+                self._navigate_art(-self.columns)
+            elif event.key == pygame.K_DOWN:
+                self._navigate_art(self.columns)
+            elif event.key == pygame.K_RETURN:
+                self.viewing_mode = "detail" if self.viewing_mode == "gallery" else "gallery"
             elif event.key == pygame.K_TAB:
                 self._next_category()
     
@@ -114,6 +201,23 @@ class ArtGallery:
         # Check category sidebar
         if pos[0] <= self.sidebar_width:
             self._handle_sidebar_click(pos)
+        elif self.viewing_mode == "gallery":
+            self._handle_grid_click(pos)
+        else:
+            self.viewing_mode = "gallery"
+    
+    def _handle_grid_click(self, pos):
+        """Select a grid cell; clicking the selected cell opens it"""
+        column = (pos[0] - self.content_rect.left - 5) // self.cell_width
+        row = (pos[1] - self.content_rect.top - 5) // self.cell_height
+        if not (0 <= column < self.columns and 0 <= row < self.visible_rows):
+            return
+        
+        index = (self.scroll_row + row) * self.columns + column
+        if index < len(self._get_collection(self.current_category)):
+            if index == self.selected_art_index:
+                self.viewing_mode = "detail"
+            self.selected_art_index = index
     
     def _handle_sidebar_click(self, pos):
         """Handle clicks on category sidebar"""
@@ -121,28 +225,64 @@ class ArtGallery:
         for category in self.categories:
             category_rect = pygame.Rect(10, y_offset, self.sidebar_width - 20, 40)
             if category_rect.collidepoint(pos):
-                self.current_category = category["id"]
-                self.selected_art_index = 0
+                self._select_category(category["id"])
                 break
             y_offset += 50
     
     def _navigate_art(self, direction):
         """Navigate between artworks"""
-        current_collection = self.art_collections.get(self.current_category, [])
+        current_collection = self._get_collection(self.current_category)
         if current_collection:
             new_index = self.selected_art_index + direction
             self.selected_art_index = max(0, min(len(current_collection) - 1, new_index))
+            
+            # Keep selection inside the visible rows
+            selected_row = self.selected_art_index // self.columns
+            if selected_row < self.scroll_row:
+                self.scroll_row = selected_row
+            elif selected_row >= self.scroll_row + self.visible_rows:
+                self.scroll_row = selected_row - self.visible_rows + 1
+    
+    def _scroll(self, rows):
+        """Scroll the grid by rows"""
+        total_rows = (len(self._get_collection(self.current_category)) + self.columns - 1) // self.columns
+        max_scroll = max(0, total_rows - self.visible_rows)
+        self.scroll_row = max(0, min(max_scroll, self.scroll_row + rows))
     
     def _next_category(self):
         """Switch to next category"""
         current_index = next(i for i, cat in enumerate(self.categories) if cat["id"] == self.current_category)
         next_index = (current_index + 1) % len(self.categories)
-        self.current_category = self.categories[next_index]["id"]
+        self._select_category(self.categories[next_index]["id"])
+    
+    def _select_category(self, category_id):
+        """Switch category and reset the grid"""
+        self.current_category = category_id
         self.selected_art_index = 0
+        self.scroll_row = 0
+        self.viewing_mode = "gallery"
+    
+    def _get_window(self, collection):
+        """Get visible index range and prefetch range"""
+        first_visible = self.scroll_row * self.columns
+        last_visible = min(len(collection), (self.scroll_row + self.visible_rows) * self.columns)
+        first_prefetch = max(0, first_visible - self.prefetch_rows * self.columns)
+        last_prefetch = min(len(collection), last_visible + self.prefetch_rows * self.columns)
+        return (first_visible, last_visible), (first_prefetch, last_prefetch)
     
     def update(self, dt):
         """Update art gallery"""
-        pass
+        self.thumbnails.update()
+        
+        collection = self._get_collection(self.current_category)
+        (first_visible, last_visible), (first_prefetch, last_prefetch) = self._get_window(collection)
+        
+        # Visible cells first, then the prefetch window; everything else is dropped
+        visible_paths = [art["path"] for art in collection[first_visible:last_visible] if art["path"]]
+        window_paths = [art["path"] for art in collection[first_prefetch:last_prefetch] if art["path"]]
+        self.thumbnails.prefetch(visible_paths)
+        self.thumbnails.prefetch(window_paths)
+        self.thumbnails.retain(window_paths)
     
     def render(self, screen):
         """Render art gallery"""
@@ -161,8 +301,8 @@ class ArtGallery:
         self._render_main_content(screen)
         
         # Controls
-        controls_text = "ESC: Back | ←→: Navigate | TAB: Next Category"
-        controls_surface = pygame.font.Font(None, 16).render(controls_text, True, COLORS['UI_GRAY'])
+        controls_text = "ESC: Back | Arrows: Navigate | ENTER: View | TAB: Next Category"
+        controls_surface = self.controls_font.render(controls_text, True, COLORS['UI_GRAY'])
         screen.blit(controls_surface, (20, SCREEN_HEIGHT - 30))
     
     def _render_sidebar(self, screen):
@@ -197,14 +337,12 @@ class ArtGallery:
     
     def _render_main_content(self, screen):
         """Render main content area"""
-        content_rect = pygame.Rect(self.sidebar_width + 20, 80, 
-                                  SCREEN_WIDTH - self.sidebar_width - 40, 
-                                  SCREEN_HEIGHT - 120)
+        content_rect = self.content_rect
         pygame.draw.rect(screen, (25, 25, 35), content_rect)
         pygame.draw.rect(screen, COLORS['UI_GRAY'], content_rect, 1)
         
         # Get current collection
-        current_collection = self.art_collections.get(self.current_category, [])
+        current_collection = self._get_collection(self.current_category)
         
         if not current_collection:
             # Empty message
@@ -214,28 +352,102 @@ class ArtGallery:
             screen.blit(empty_surface, empty_rect)
             return
         
-        # Show selected artwork
-        if 0 <= self.selected_art_index < len(current_collection):
-            selected_art = current_collection[self.selected_art_index]
+        if self.viewing_mode == "detail" and 0 <= self.selected_art_index < len(current_collection):
+            self._render_detail(screen, current_collection[self.selected_art_index], len(current_collection))
+        else:
+            self._render_grid(screen, current_collection)
+    
+    def _render_grid(self, screen, collection):
+        """Render only the visible thumbnail cells"""
+        (first_visible, last_visible), _ = self._get_window(collection)
+        
+        for index in range(first_visible, last_visible):
+            art = collection[index]
+            row = index // self.columns - self.scroll_row
+            column = index % self.columns
+            cell_rect = pygame.Rect(self.content_rect.left + 5 + column * self.cell_width,
+                                    self.content_rect.top + 5 + row * self.cell_height,
+                                    self.cell_width - 10, self.cell_height - 10)
             
-            # Art surface
-            art_surface = selected_art["surface"]
-            art_rect = art_surface.get_rect(center=(content_rect.centerx, content_rect.centery - 40))
-            screen.blit(art_surface, art_rect)
+            selected = index == self.selected_art_index
+            pygame.draw.rect(screen, (40, 40, 55) if selected else (30, 30, 42), cell_rect)
+            pygame.draw.rect(screen, COLORS['NERV_RED'] if selected else (60, 60, 80), cell_rect, 2 if selected else 1)
             
-            # Art info
-            title_text = selected_art["title"]
-            title_surface = self.info_font.render(title_text, True, COLORS['SCHOOL_YELLOW'])
-            title_rect = title_surface.get_rect(center=(content_rect.centerx, art_rect.bottom + 20))
-            screen.blit(title_surface, title_rect)
+            # Thumbnail (placeholder while its worker job is running)
+            if art["path"]:
+                thumbnail = self.thumbnails.get_thumbnail(art["path"])
+            else:
+                thumbnail = _get_sample_thumbnail(self.surfaces, art["sample"])
             
-            desc_text = selected_art["description"]
-            desc_surface = pygame.font.Font(None, 14).render(desc_text, True, COLORS['UI_GRAY'])
-            desc_rect = desc_surface.get_rect(center=(content_rect.centerx, title_rect.bottom + 15))
-            screen.blit(desc_surface, desc_rect)
+            image_area = pygame.Rect(cell_rect.left + 5, cell_rect.top + 5, cell_rect.width - 10, 100)
+            if thumbnail is not None:
+                screen.blit(thumbnail, thumbnail.get_rect(center=image_area.center))
+            else:
+                failed = art["path"] and self.thumbnails.is_failed(art["path"])
+                placeholder = self.small_font.render("unreadable" if failed else "loading...", True, COLORS['UI_GRAY'])
+                screen.blit(placeholder, placeholder.get_rect(center=image_area.center))
             
-            # Navigation info
-            nav_text = f"{self.selected_art_index + 1} / {len(current_collection)}"
-            nav_surface = pygame.font.Font(None, 16).render(nav_text, True, COLORS['UI_GRAY'])
-            nav_rect = nav_surface.get_rect(center=(content_rect.centerx, desc_rect.bottom + 20))
-            screen.blit(nav_surface, nav_rect)
\ No newline at end of file
+            # Caption
+            caption = self.text_layout.render_block(art["title"], self.small_font, COLORS['TEXT_WHITE'],
+                                                    cell_rect.width - 10, align="center")
+            screen.blit(caption, (cell_rect.left + 5, image_area.bottom + 5),
+                        pygame.Rect(0, 0, cell_rect.width - 10, self.small_font.get_linesize()))
+        
+        # Navigation info
+        nav_text = f"{self.selected_art_index + 1} / {len(collection)}"
+        nav_surface = self.controls_font.render(nav_text, True, COLORS['UI_GRAY'])
+        nav_rect = nav_surface.get_rect(right=self.content_rect.right - 10, top=self.content_rect.bottom + 5)
+        screen.blit(nav_surface, nav_rect)
+    
+    def _render_detail(self, screen, selected_art, collection_size):
+        """Render the selected artwork at full resolution (scaled to fit)"""
+        content_rect = self.content_rect
+        max_size = (content_rect.width - 40, content_rect.height - 120)
+        
+        if selected_art["path"]:
+            art_surface = self._get_detail_surface(selected_art["path"], max_size)
+        else:
+            art_surface = _get_sample_surface(self.surfaces, selected_art["sample"])
+        
+        if art_surface is not None:
+            art_rect = art_surface.get_rect(center=(content_rect.centerx, content_rect.centery - 40))
+            screen.blit(art_surface, art_rect)
+        else:
+            art_rect = pygame.Rect(0, 0, 300, 200)
+            art_rect.center = (content_rect.centerx, content_rect.centery - 40)
+            loading_surface = self.info_font.render("Loading...", True, COLORS['UI_GRAY'])
+            screen.blit(loading_surface, loading_surface.get_rect(center=art_rect.center))
+        
+        # Art info
+        title_text = selected_art["title"]
+        title_surface = self.info_font.render(title_text, True, COLORS['SCHOOL_YELLOW'])
+        title_rect = title_surface.get_rect(center=(content_rect.centerx, art_rect.bottom + 20))
+        screen.blit(title_surface, title_rect)
+        
+        desc_text = selected_art["description"]
+        desc_surface = self.small_font.render(desc_text, True, COLORS['UI_GRAY'])
+        desc_rect = desc_surface.get_rect(center=(content_rect.centerx, title_rect.bottom + 15))
+        screen.blit(desc_surface, desc_rect)
+        
+        # Navigation info
+        nav_text = f"{self.selected_art_index + 1} / {collection_size}"
+        nav_surface = self.controls_font.render(nav_text, True, COLORS['UI_GRAY'])
+        nav_rect = nav_surface.get_rect(center=(content_rect.centerx, desc_rect.bottom + 20))
+        screen.blit(nav_surface, nav_rect)
+    
+    def _get_detail_surface(self, path, max_size):
+        """Get the full image scaled to fit, rescaling only when the image changes"""
+        full_image = self.thumbnails.get_full_image(path)
+        if full_image is None:
+            return None
+        if self.detail_cache is not None and self.detail_cache[0] is full_image:
+            return self.detail_cache[1]
+        
+        width, height = full_image.get_size()
+        scale = min(max_size[0] / max(1, width), max_size[1] / max(1, height), 1.0)
+        if scale < 1.0:
+            scaled = pygame.transform.smoothscale(full_image, (max(1, int(width * scale)), max(1, int(height * scale))))
+        else:
+            scaled = full_image
+        self.detail_cache = (full_image, scaled)
+        return scaled
@@ -3,6 +3,9 @@ BEDROOM SCENE - SIMPLIFIED WORKING VERSION
 """
 
 import pygame
+from managers.game_log import get_logger
+
+logger = get_logger("bedroom_scene")
 
 # Add proper imports for screen dimensions
 try:
@@ -12,31 +15,46 @@ except ImportError:
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
 
+from ui.text_layout import get_text_layout
+from ui.typewriter import TypewriterText
+from data.dialogue_editor import load_dialogue_lines
+from entities.navigation import NavigationGrid, Navigator
+from graphics.render_queue import (get_render_queue, LAYER_BACKGROUND, LAYER_WORLD, LAYER_ENTITIES,
+                                   LAYER_EFFECTS, LAYER_UI, LAYER_OVERLAY)
+
 # Import enhanced systems with fallbacks
 try:
     from ui.hud import EnhancedHUD
 except ImportError:
-    print("⚠️ EnhancedHUD not available, using fallback")
+    logger.warning("⚠️ EnhancedHUD not available, using fallback")
     EnhancedHUD = None
 
 try:
     from entities.player import EnhancedPlayer
 except ImportError:
-    print("⚠️ EnhancedPlayer not available, using fallback")
+    logger.warning("⚠️ EnhancedPlayer not available, using fallback")
     EnhancedPlayer = None
 
 try:
-    from ui.status_system import StatusSystem
+    from ui.status_popup import StatusManager
 except ImportError:
-    print("⚠️ StatusSystem not available, using fallback")
-    StatusSystem = None
+    logger.warning("⚠️ StatusManager not available, using fallback")
+    StatusManager = None
 
 try:
     from input.mouse_controller import MouseController
 except ImportError:
-    print("⚠️ MouseController not available, using fallback")
+    logger.warning("⚠️ MouseController not available, using fallback")
     MouseController = None
 
+# Used only if data/dialogues/asuka_bedroom.json is missing
+ASUKA_FALLBACK_LINES = [
+    {"id": "wake_up_1", "text": "Hey! Third Child! Wake up already!"},
+    {"id": "wake_up_2", "text": "We're supposed to be at NERV in 30 minutes!"},
+    {"id": "wake_up_3", "text": "Misato's waiting and you know how she gets..."},
+    {"id": "wake_up_4", "text": "Come ON! Get out of bed!"}
+]
+
 class BedroomScene:
     def __init__(self, game_manager, scene_manager):
         self.game_manager = game_manager
@@ -45,7 +63,7 @@ class BedroomScene:
         # Enhanced systems (with fallbacks)
         self.enhanced_hud = EnhancedHUD(game_manager) if EnhancedHUD else None
         self.enhanced_player = EnhancedPlayer(400, 300, game_manager) if EnhancedPlayer else None
-        self.status_system = StatusSystem() if StatusSystem else None
+        self.status_system = StatusManager() if StatusManager else None
         
         # Mouse Controller
         self.mouse_controller = MouseController(game_manager) if MouseController else None
@@ -70,22 +88,30 @@ class BedroomScene:
             {"name": "Bed", "pos": (300, 350), "size": (120, 80), "interacted": False}
         ]
         
+        # Click-to-move navigation around the furniture (baked once per visit)
+        self.navigator = None
+        if self.enhanced_player:
+            furniture = [(obj["pos"], obj["size"]) for obj in self.interactive_objects]
+            player = self.enhanced_player
+            self.navigator = Navigator(NavigationGrid(player.get_movement_bounds(), furniture,
+                                                      agent_rect=(0, 0, player.width, player.height)))
+        
         # Fonts
         self.title_font = pygame.font.Font(None, 36)
         self.text_font = pygame.font.Font(None, 24)
+        self.text_layout = get_text_layout()
+        self.dialogue_font = self.text_layout.get_font(20)
+        self.render_queue = get_render_queue()
         
         # Conversation system
         self.in_conversation = False
         self.conversation_partner = None
         self.dialogue_index = 0
+        self.typewriter = TypewriterText(self.text_layout)
         
-        # Asuka conversation - Enhanced from dialogue editor
-        self.asuka_dialogues = [
-            "Asuka: Hey! Third Child! Wake up already!",
-            "Asuka: We're supposed to be at NERV in 30 minutes!",
-            "Asuka: Misato's waiting and you know how she gets...",
-            "Asuka: Come ON! Get out of bed!"
-        ]
+        # Asuka conversation - lines and read-tracking ids from asuka_bedroom.json
+        self.asuka_lines = load_dialogue_lines("asuka_bedroom", ASUKA_FALLBACK_LINES)
+        self.asuka_line_ids = [line["id"] for line in self.asuka_lines]
         
         # Asuka visual representation
         self.asuka_present = False
@@ -94,13 +120,17 @@ class BedroomScene:
         self.asuka_width = 25
         self.asuka_height = 35
         
-        print("🏠 Bedroom Scene initialized")
+        logger.info("🏠 Bedroom Scene initialized")
         
         # Start Asuka conversation automatically on scene initialization
         self._start_asuka_conversation()
     
     def handle_event(self, event):
         """Handle bedroom events"""
+        # Clicks on HUD sections toggle them instead of moving the player
+        if self.enhanced_hud and self.enhanced_hud.handle_event(event):
+            return
+        
         # Always pass mouse events to mouse controller (even during conversation for movement)
         if self.mouse_controller:
             self.mouse_controller.handle_event(event, self)
@@ -108,7 +138,11 @@ class BedroomScene:
         if self.in_conversation:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                    self._advance_dialogue()
+                    # First press completes the reveal, second advances
+                    if self.typewriter.is_complete():
+                        self._advance_dialogue()
+                    else:
+                        self.typewriter.finish()
                 elif event.key == pygame.K_ESCAPE:
                     self._end_conversation()
         else:
@@ -177,11 +211,29 @@ class BedroomScene:
         self.asuka_present = True  # Make Asuka visible
         if self.status_system:
             self.status_system.add_message("Asuka appears in the doorway", "info")
+        self._start_dialogue_line()
+    
+    def _start_dialogue_line(self):
+        """Begin typewriter reveal of the current dialogue line"""
+        # Skip mode: fast-forward through read lines without laying them out
+        if self.game_manager.game_settings.get("skip_read_text", False):
+            self.dialogue_index = self.game_manager.read_lines.first_unseen(self.asuka_line_ids,
+                                                                            self.dialogue_index)
+            if self.dialogue_index >= len(self.asuka_line_ids):
+                self._end_conversation()
+                return
+        
+        hud_start_x = SCREEN_WIDTH - 220 - 10
+        conv_width = hud_start_x - 50 - 20
+        self.typewriter.apply_settings(self.game_manager.game_settings)
+        self.typewriter.start("Asuka: " + self.asuka_lines[self.dialogue_index]["text"], self.dialogue_font,
+                              COLORS['TEXT_WHITE'], conv_width - 40)
     
     def _advance_dialogue(self):
         """Advance to next dialogue line"""
-        if self.dialogue_index < len(self.asuka_dialogues) - 1:
+        if self.dialogue_index < len(self.asuka_lines) - 1:
             self.dialogue_index += 1
+            self._start_dialogue_line()
         else:
             self._end_conversation()
     
@@ -196,6 +248,9 @@ class BedroomScene:
     
     def update(self, dt):
         """Update bedroom scene"""
+        if self.navigator:
+            self.navigator.update(dt)
+        
         # Update mouse controller
         if self.mouse_controller:
             self.mouse_controller.update(dt)
@@ -211,6 +266,14 @@ class BedroomScene:
         if self.status_system:
             self.status_system.update(dt)
         
+        # Typewriter reveal and auto-advance
+        if self.in_conversation:
+            self.typewriter.update(dt)
+            if self.typewriter.is_complete():
+                self.game_manager.read_lines.mark_seen(self.asuka_line_ids[self.dialogue_index])
+            if self.typewriter.should_auto_advance():
+                self._advance_dialogue()
+        
         # Check for scene completion
         if self.interactions_completed >= self.max_interactions and not self.in_conversation:
             if self.status_system:
@@ -218,87 +281,90 @@ class BedroomScene:
     
     def render(self, screen):
         """Render bedroom scene"""
+        queue = self.render_queue
+        
         # Calculate HUD area to avoid rendering game content behind it
         hud_start_x = SCREEN_WIDTH - 220 - 10  # Match HUD positioning
         playable_width = hud_start_x
         
         # Background - only fill the playable area
         background_rect = pygame.Rect(0, 0, playable_width, SCREEN_HEIGHT)
-        pygame.draw.rect(screen, (60, 45, 35), background_rect)
+        queue.rect((60, 45, 35), background_rect, LAYER_BACKGROUND)
         
         # Simple room elements
         # Floor - constrained to playable area
         floor_rect = pygame.Rect(0, SCREEN_HEIGHT - 100, playable_width, 100)
-        pygame.draw.rect(screen, (80, 60, 45), floor_rect)
+        queue.rect((80, 60, 45), floor_rect, LAYER_BACKGROUND, 1)
         
         # Window
         window_rect = pygame.Rect(50, 100, 100, 120)
-        pygame.draw.rect(screen, (150, 200, 255), window_rect)
-        pygame.draw.rect(screen, (100, 50, 25), window_rect, 5)
+        queue.rect((150, 200, 255), window_rect, LAYER_BACKGROUND, 2)
+        queue.rect((100, 50, 25), window_rect, LAYER_BACKGROUND, 2, width=5)
         
         # Interactive objects
-        self._render_interactive_objects(screen)
+        self._submit_interactive_objects(queue)
         
-        # Render Asuka if present
+        # Characters are y-sorted: whoever stands lower is drawn in front
         if self.asuka_present:
-            self._render_asuka(screen)
+            self._submit_asuka(queue)
         
         # Enhanced player or basic fallback
         if self.enhanced_player:
-            self.enhanced_player.render(screen)
+            player_rect = self.enhanced_player.get_rect()
+            # Inflated for the trail, pulse and health bar drawn around the body
+            queue.custom(self.enhanced_player.render, LAYER_ENTITIES, player_rect.bottom, player_rect.inflate(80, 80))
         else:
             # Basic player rectangle
             player_rect = pygame.Rect(self.player_x - 10, self.player_y - 15, 20, 30)
-            pygame.draw.rect(screen, COLORS['EVA_PURPLE'], player_rect)
-            pygame.draw.rect(screen, COLORS['TEXT_WHITE'], player_rect, 2)
+            queue.rect(COLORS['EVA_PURPLE'], player_rect, LAYER_ENTITIES, player_rect.bottom)
+            queue.rect(COLORS['TEXT_WHITE'], player_rect, LAYER_ENTITIES, player_rect.bottom, width=2)
         
         # Mouse controller visual effects
         if self.mouse_controller:
-            self.mouse_controller.render_mouse_ui(screen)
+            queue.custom(self.mouse_controller.render_mouse_ui, LAYER_EFFECTS)
         
         # Conversation overlay
         if self.in_conversation:
-            self._render_conversation(screen)
+            queue.custom(self._render_conversation, LAYER_UI)
         
         # Enhanced HUD (if available)
         if self.enhanced_hud:
-            self.enhanced_hud.render(screen)
+            queue.custom(self.enhanced_hud.render, LAYER_UI, 1)
         
         # Status system (if available)
         if self.status_system:
-            self.status_system.render(screen)
+            queue.custom(self.status_system.render, LAYER_OVERLAY)
+        
+        queue.flush(screen)
     
-    def _render_interactive_objects(self, screen):
-        """Render interactive objects"""
+    def _submit_interactive_objects(self, queue):
+        """Queue interactive objects"""
+        font = self.text_layout.get_font(16)
         for obj in self.interactive_objects:
             color = COLORS['UI_GRAY'] if obj["interacted"] else COLORS['SCHOOL_YELLOW']
             obj_rect = pygame.Rect(obj["pos"][0], obj["pos"][1], obj["size"][0], obj["size"][1])
-            pygame.draw.rect(screen, color, obj_rect, 2)
+            queue.rect(color, obj_rect, LAYER_WORLD, width=2)
             
             # Object label
-            font = pygame.font.Font(None, 16)
-            text = font.render(obj["name"], True, color)
-            text_rect = text.get_rect(center=(obj_rect.centerx, obj_rect.top - 10))
-            screen.blit(text, text_rect)
+            queue.text(obj["name"], font, color, (obj_rect.centerx, obj_rect.top - 10), LAYER_WORLD, anchor="center")
     
-    def _render_asuka(self, screen):
-        """Render Asuka character"""
+    def _submit_asuka(self, queue):
+        """Queue Asuka character"""
         # Asuka body (simplified representation)
         asuka_rect = pygame.Rect(self.asuka_x, self.asuka_y, self.asuka_width, self.asuka_height)
+        z = asuka_rect.bottom
         
         # Body color (orange/red for Asuka's plugsuit)
-        pygame.draw.rect(screen, COLORS['WARNING_ORANGE'], asuka_rect)
-        pygame.draw.rect(screen, COLORS['NERV_RED'], asuka_rect, 2)
+        queue.rect(COLORS['WARNING_ORANGE'], asuka_rect, LAYER_ENTITIES, z)
+        queue.rect(COLORS['NERV_RED'], asuka_rect, LAYER_ENTITIES, z, width=2)
         
         # Hair (blonde/orange)
         hair_rect = pygame.Rect(self.asuka_x - 3, self.asuka_y - 8, self.asuka_width + 6, 10)
-        pygame.draw.rect(screen, (255, 200, 100), hair_rect)
+        queue.rect((255, 200, 100), hair_rect, LAYER_ENTITIES, z)
         
         # Name label
-        font = pygame.font.Font(None, 16)
-        name_text = font.render("Asuka", True, COLORS['TEXT_WHITE'])
-        name_rect = name_text.get_rect(center=(self.asuka_x + self.asuka_width//2, self.asuka_y - 15))
-        screen.blit(name_text, name_rect)
+        queue.text("Asuka", self.text_layout.get_font(16), COLORS['TEXT_WHITE'],
+                   (self.asuka_x + self.asuka_width//2, self.asuka_y - 15), LAYER_ENTITIES, z, anchor="center")
     
     def _render_conversation(self, screen):
         """Render conversation interface"""
@@ -315,15 +381,11 @@ class BedroomScene:
         screen.blit(conv_surface, conv_rect.topleft)
         
         # Current dialogue
-        current_dialogue = self.asuka_dialogues[self.dialogue_index]
-        dialogue_font = pygame.font.Font(None, 20)
-        dialogue_text = dialogue_font.render(current_dialogue, True, COLORS['TEXT_WHITE'])
-        dialogue_rect = dialogue_text.get_rect(left=conv_rect.left + 20, top=conv_rect.top + 20)
-        screen.blit(dialogue_text, dialogue_rect)
+        self.typewriter.render(screen, (conv_rect.left + 20, conv_rect.top + 20))
         
         # Continue prompt
         prompt_text = "SPACE: Continue | ESC: End conversation"
-        prompt_font = pygame.font.Font(None, 16)
+        prompt_font = self.text_layout.get_font(16)
         prompt_surface = prompt_font.render(prompt_text, True, COLORS['UI_GRAY'])
         prompt_rect = prompt_surface.get_rect(right=conv_rect.right - 20, bottom=conv_rect.bottom - 10)
         screen.blit(prompt_surface, prompt_rect)
\ No newline at end of file
@@ -6,8 +6,15 @@ Hub scene with integrated art system
 """
 
 import pygame
+from config import COLORS
 from scenes.hub_scene import HubScene
 from assets.art_manager import ArtManager
+from ui.text_layout import get_text_layout
+from graphics.render_queue import (get_render_queue, LAYER_BACKGROUND, LAYER_WORLD, LAYER_ENTITIES,
+                                   LAYER_UI, LAYER_OVERLAY)
+from managers.game_log import get_logger
+
+logger = get_logger("enhanced_hub_scene")
 
 class EnhancedHubScene(HubScene):
     """
@@ -19,84 +26,91 @@ class EnhancedHubScene(HubScene):
         """Initialize enhanced hub scene"""
         # Initialize art manager
         self.art_manager = ArtManager()
+        self.scaled_art = {}        # (asset name, size) -> scaled Surface or None
+        self.text_layout = get_text_layout()
+        self.render_queue = get_render_queue()
         
         # Call parent initialization
         super().__init__(game_manager, scene_manager)
         
-        print("🎨 Enhanced Hub Scene with art support initialized")
+        logger.info("🎨 Enhanced Hub Scene with art support initialized")
     
     def render(self, screen):
         """Render hub scene with custom art"""
+        queue = self.render_queue
+        
         # === CUSTOM BACKGROUND ===
-        bg_art = self.art_manager.get_asset('nerv_hq_bg')
+        bg_art = self._get_scaled_art('nerv_hq_bg', screen.get_size())
         if bg_art:
-            # Scale background to screen size
-            bg_scaled = pygame.transform.scale(bg_art, (screen.get_width(), screen.get_height()))
-            screen.blit(bg_scaled, (0, 0))
+            queue.sprite(bg_art, (0, 0), LAYER_BACKGROUND)
         else:
             # Fallback to original rendering
-            self.enhanced_renderer.render_nerv_headquarters(screen)
+            queue.custom(self.enhanced_renderer.render_nerv_headquarters, LAYER_BACKGROUND)
         
         # === RENDER AREAS WITH CUSTOM ICONS ===
-        self._render_areas_with_art(screen)
-        
-        # === RENDER NPCS WITH CUSTOM SPRITES ===
-        self._render_npcs_with_art(screen)
+        queue.custom(self._render_areas_with_art, LAYER_WORLD)
         
-        # === RENDER PLAYER WITH CUSTOM SPRITE ===
-        self._render_player_with_art(screen)
+        # === RENDER NPCS AND PLAYER WITH CUSTOM SPRITES ===
+        self._submit_npcs_with_art(queue)
+        self._submit_player_with_art(queue)
         
         # === UI WITH CUSTOM ART ===
         if not self.in_dialogue:
-            self._render_hud_with_art(screen)
-            self.mouse_controller.render_mouse_ui(screen)
+            self._submit_hud_with_art(queue, screen)
+            queue.custom(self.mouse_controller.render_mouse_ui, LAYER_UI, 1)
         
-        self.status_manager.render(screen)
+        queue.custom(self.status_manager.render, LAYER_UI, 2)
         
         # === DIALOGUE SYSTEM ===
         if self.in_dialogue:
-            self._render_dialogue_with_art(screen)
+            queue.custom(self._render_dialogue_with_art, LAYER_OVERLAY)
         
         # === SCENE INFO ===
-        self._render_adjusted_scene_info(screen)
+        queue.custom(self._render_adjusted_scene_info, LAYER_OVERLAY, 1)
+        
+        queue.flush(screen)
+    
+    def _get_scaled_art(self, name, size):
+        """Get an art asset scaled to size (scaled once, not every frame)"""
+        key = (name, tuple(size))
+        if key not in self.scaled_art:
+            art = self.art_manager.get_asset(name)
+            self.scaled_art[key] = pygame.transform.scale(art, size) if art else None
+        return self.scaled_art[key]
     
-    def _render_npcs_with_art(self, screen):
-        """Render NPCs with custom sprites"""
+    def _submit_npcs_with_art(self, queue):
+        """Queue NPCs with custom sprites (y-sorted, culled when off-screen)"""
+        font = self.text_layout.get_font(16)
         for npc in self.npcs:
             # Get custom sprite
             character_name = npc.name.lower().replace(' ', '_').replace('.', '')
-            sprite = self.art_manager.get_asset(character_name)
+            sprite = self._get_scaled_art(character_name, (40, 60))
             
             if sprite:
-                # Scale sprite appropriately
-                sprite_scaled = pygame.transform.scale(sprite, (40, 60))
-                sprite_rect = sprite_scaled.get_rect(center=(npc.x, npc.y))
-                screen.blit(sprite_scaled, sprite_rect)
+                sprite_rect = sprite.get_rect(center=(npc.x, npc.y))
+                queue.sprite(sprite, sprite_rect.topleft, LAYER_ENTITIES, sprite_rect.bottom)
                 
-                # Name label
-                font = pygame.font.Font(None, 16)
-                name_surface = font.render(npc.name.split()[0], True, COLORS['TEXT_WHITE'])
+                # Name label with background
+                name_surface = queue.render_text(npc.name.split()[0], font, COLORS['TEXT_WHITE'])
                 name_rect = name_surface.get_rect(center=(npc.x, npc.y - 40))
-                
-                # Name background
-                bg_rect = name_rect.inflate(4, 2)
-                pygame.draw.rect(screen, (0, 0, 0, 120), bg_rect)
-                screen.blit(name_surface, name_rect)
+                queue.rect((0, 0, 0, 120), name_rect.inflate(4, 2), LAYER_ENTITIES, sprite_rect.bottom)
+                queue.sprite(name_surface, name_rect.topleft, LAYER_ENTITIES, sprite_rect.bottom)
             else:
                 # Fallback to original rendering
-                npc.render(screen)
+                npc_rect = pygame.Rect(npc.x - npc.width // 2, npc.y - npc.height // 2, npc.width, npc.height)
+                queue.custom(npc.render, LAYER_ENTITIES, npc_rect.bottom, npc_rect.inflate(80, 80))
     
-    def _render_player_with_art(self, screen):
-        """Render player with custom sprite"""
-        sprite = self.art_manager.get_asset('shinji')
+    def _submit_player_with_art(self, queue):
+        """Queue player with custom sprite"""
+        sprite = self._get_scaled_art('shinji', (32, 48))
         
         if sprite:
-            sprite_scaled = pygame.transform.scale(sprite, (32, 48))
-            sprite_rect = sprite_scaled.get_rect(center=(self.player.x, self.player.y))
-            screen.blit(sprite_scaled, sprite_rect)
+            sprite_rect = sprite.get_rect(center=(self.player.x, self.player.y))
+            queue.sprite(sprite, sprite_rect.topleft, LAYER_ENTITIES, sprite_rect.bottom)
         else:
             # Fallback to original rendering
-            self.player.render(screen)
+            player_rect = self.player.get_rect()
+            queue.custom(self.player.render, LAYER_ENTITIES, player_rect.bottom, player_rect.inflate(80, 80))
     
     def _render_dialogue_with_art(self, screen):
         """Render dialogue system with character portraits"""
@@ -169,13 +183,12 @@ class EnhancedHubScene(HubScene):
         instruction_rect = instruction_surface.get_rect(center=(screen.get_width() // 2, dialogue_rect.bottom - 15))
         screen.blit(instruction_surface, instruction_rect)
     
-    def _render_hud_with_art(self, screen):
-        """Render HUD with custom art elements"""
+    def _submit_hud_with_art(self, queue, screen):
+        """Queue HUD with custom art elements"""
         # Custom HUD panel
-        hud_bg = self.art_manager.get_asset('hud_panel')
+        hud_bg = self._get_scaled_art('hud_panel', (200, 500))
         if hud_bg:
-            hud_scaled = pygame.transform.scale(hud_bg, (200, 500))
-            screen.blit(hud_scaled, (screen.get_width() - 210, 10))
+            queue.sprite(hud_bg, (screen.get_width() - 210, 10), LAYER_UI)
         
         # Render HUD with custom icons
-        self.hud.render_with_custom_art(screen, self.art_manager)
\ No newline at end of file
+        queue.custom(lambda target: self.hud.render_with_custom_art(target, self.art_manager), LAYER_UI)
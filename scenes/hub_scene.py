@@ -6,6 +6,9 @@ Central hub for navigation and management
 """
 
 import pygame
+from managers.game_log import get_logger
+
+logger = get_logger("hub_scene")
 
 # Add proper imports for screen dimensions
 try:
@@ -40,7 +43,7 @@ class HubScene:
         self.title_font = pygame.font.Font(None, 36)
         self.area_font = pygame.font.Font(None, 24)
         
-        print("🏭 Hub Scene initialized")
+        logger.info("🏭 Hub Scene initialized")
     
     def handle_event(self, event):
         """Handle hub events"""
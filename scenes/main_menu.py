@@ -7,6 +7,12 @@ Enhanced main menu with all features
 
 import pygame
 import math
+from graphics.procedural_textures import get_procedural_textures
+from graphics.transform_cache import get_transform_cache
+from ui.widgets import UIRoot, Panel, Label, Button
+from managers.game_log import get_logger
+
+logger = get_logger("main_menu")
 
 # Add proper imports for screen dimensions
 try:
@@ -48,57 +54,76 @@ class MainMenuScene:
         self.menu_font = pygame.font.Font(None, 32)
         self.subtitle_font = pygame.font.Font(None, 20)
         
+        # Pulsing title rendered once at its peak size (48 * 1.1), then scaled through the transform cache
+        self.title_surface = pygame.font.Font(None, 53).render("EVANGELION", True, COLORS['NERV_RED'])
+        self.transforms = get_transform_cache()
+        
         # Background
         self.background = self._create_background()
         
-        print("🏠 Main Menu Scene initialized")
+        # Widget tree (built once; only changed widgets redraw)
+        self.ui = self._build_ui()
+        self._select_option(0)
+        
+        logger.info("🏠 Main Menu Scene initialized")
     
     def _create_background(self):
         """Create animated background"""
-        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        
-        # Gradient background
-        for y in range(SCREEN_HEIGHT):
-            gradient_factor = y / SCREEN_HEIGHT
-            color = (
-                int(20 + gradient_factor * 20),
-                int(20 + gradient_factor * 30),
-                int(40 + gradient_factor * 40)
-            )
-            pygame.draw.line(background, color, (0, y), (SCREEN_WIDTH, y))
-        
-        return background
+        # Gradient background (generated once, shared through the texture cache)
+        return get_procedural_textures().vertical_gradient((SCREEN_WIDTH, SCREEN_HEIGHT), (20, 20, 40), (40, 50, 80))
+    
+    def _build_ui(self):
+        """Build the menu widget tree"""
+        ui = UIRoot((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Subtitle and version info
+        ui.add(Label("Visual Novel Experience", self.subtitle_font, COLORS['UI_GRAY'])).place(center=(SCREEN_WIDTH // 2, 180))
+        ui.add(Label("Version 1.0.0 - Enhanced Edition", pygame.font.Font(None, 16), COLORS['UI_GRAY'])).place(
+            topleft=(20, SCREEN_HEIGHT - 25))
+        
+        # Menu options, centred on the menu position
+        button_height = 40
+        spacing = self.option_spacing - button_height
+        first_y = self.menu_y - (len(self.menu_options) // 2) * self.option_spacing - button_height // 2
+        options = ui.add(Panel(name="options", layout="vertical", spacing=spacing))
+        options.set_rect((self.menu_x - 100, first_y, 200, len(self.menu_options) * self.option_spacing - spacing))
+        
+        self.option_buttons = []
+        for index, option in enumerate(self.menu_options):
+            button = options.add(Button(f"{option['icon']} {option['text']}", self.menu_font, (200, button_height),
+                                        color=None, border_width=0, selected_border_width=2,
+                                        selected_border_color=COLORS['SCHOOL_YELLOW'],
+                                        selected_text_color=COLORS['SCHOOL_YELLOW']))
+            button.on_hover = lambda widget, index=index: self._select_option(index)
+            button.on_click = lambda widget, action=option["action"]: self._execute_action(action)
+            self.option_buttons.append(button)
+        return ui
+    
+    def _select_option(self, index):
+        """Move the selection highlight"""
+        self.option_buttons[self.selected_option].set(selected=False)
+        self.selected_option = index
+        self.option_buttons[index].set(selected=True)
     
     def handle_event(self, event):
         """Handle main menu events"""
         if event.type == pygame.MOUSEMOTION:
             self.mouse_pos = event.pos
-            self._update_selection_from_mouse()
         
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # Left click
-                self._execute_selected_option()
+        # Hover and clicks are routed through the widget tree
+        if self.ui.handle_event(event):
+            return
         
-        elif event.type == pygame.KEYDOWN:
+        if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
-                self.selected_option = (self.selected_option - 1) % len(self.menu_options)
+                self._select_option((self.selected_option - 1) % len(self.menu_options))
             elif event.key == pygame.K_DOWN:
-                self.selected_option = (self.selected_option + 1) % len(self.menu_options)
+                self._select_option((self.selected_option + 1) % len(self.menu_options))
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 self._execute_selected_option()
             elif event.key == pygame.K_ESCAPE:
                 self._execute_action("exit")
     
-    def _update_selection_from_mouse(self):
-        """Update selection based on mouse position"""
-        for i, option in enumerate(self.menu_options):
-            option_y = self.menu_y + (i - len(self.menu_options) // 2) * self.option_spacing
-            option_rect = pygame.Rect(self.menu_x - 100, option_y - 20, 200, 40)
-            
-            if option_rect.collidepoint(self.mouse_pos):
-                self.selected_option = i
-                break
-    
     def _execute_selected_option(self):
         """Execute the currently selected option"""
         option = self.menu_options[self.selected_option]
@@ -136,27 +161,13 @@ class MainMenuScene:
         self._render_animated_background(screen)
         
         # Title
-        title_text = "EVANGELION"
         title_pulse = 1.0 + 0.1 * math.sin(self.animation_timer * 2)
-        title_font = pygame.font.Font(None, int(48 * title_pulse))
-        title_surface = title_font.render(title_text, True, COLORS['NERV_RED'])
+        title_surface = self.transforms.scale_by(self.title_surface, 48 * title_pulse / 53)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 150))
         screen.blit(title_surface, title_rect)
         
-        # Subtitle
-        subtitle_text = "Visual Novel Experience"
-        subtitle_surface = self.subtitle_font.render(subtitle_text, True, COLORS['UI_GRAY'])
-        subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, 180))
-        screen.blit(subtitle_surface, subtitle_rect)
-        
-        # Menu options
-        for i, option in enumerate(self.menu_options):
-            self._render_menu_option(screen, i, option)
-        
-        # Version info
-        version_text = "Version 1.0.0 - Enhanced Edition"
-        version_surface = pygame.font.Font(None, 16).render(version_text, True, COLORS['UI_GRAY'])
-        screen.blit(version_surface, (20, SCREEN_HEIGHT - 25))
+        # Subtitle, menu options and version info
+        self.ui.render(screen)
     
     def _render_animated_background(self, screen):
         """Render animated background elements"""
@@ -166,32 +177,3 @@ class MainMenuScene:
             y = 100 + math.sin(self.animation_timer + i) * 50
             particle_rect = pygame.Rect(x, y, 4, 4)
             pygame.draw.rect(screen, COLORS['TERMINAL_GREEN'], particle_rect)
-    
-    def _render_menu_option(self, screen, index, option):
-        """Render individual menu option"""
-        is_selected = index == self.selected_option
-        
-        # Position - Better vertical centering
-        option_y = self.menu_y + (index - len(self.menu_options) // 2) * self.option_spacing
-        
-        # Colors and effects
-        if is_selected:
-            color = COLORS['SCHOOL_YELLOW']
-            scale = 1.1 + 0.05 * math.sin(self.animation_timer * 8)
-        else:
-            color = COLORS['TEXT_WHITE']
-            scale = 1.0
-        
-        # Render option text
-        font = pygame.font.Font(None, int(32 * scale))
-        option_text = f"{option['icon']} {option['text']}"
-        text_surface = font.render(option_text, True, color)
-        text_rect = text_surface.get_rect(center=(self.menu_x, option_y))
-        
-        # Selection highlight
-        if is_selected:
-            highlight_rect = text_rect.inflate(20, 10)
-            pygame.draw.rect(screen, (*COLORS['SCHOOL_YELLOW'], 50), highlight_rect)
-            pygame.draw.rect(screen, COLORS['SCHOOL_YELLOW'], highlight_rect, 2)
-        
-        screen.blit(text_surface, text_rect)
\ No newline at end of file
@@ -6,6 +6,9 @@ NERV ARRIVAL SCENE - FIXED IMPORTS
 
 import pygame
 import random
+from managers.game_log import get_logger
+
+logger = get_logger("nerv_arrival_scene")
 
 # Add proper imports for screen dimensions
 try:
@@ -15,24 +18,47 @@ except ImportError:
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
 
+from ui.text_layout import get_text_layout
+from ui.typewriter import TypewriterText
+from data.dialogue_editor import load_dialogue_lines
+
 # Import enhanced systems with correct names and fallbacks
 try:
     from ui.hud import EnhancedHUD as HUD
 except ImportError:
-    print("⚠️ EnhancedHUD not available, using fallback")
+    logger.warning("⚠️ EnhancedHUD not available, using fallback")
     HUD = None
 
 try:
     from entities.player import EnhancedPlayer as Player
 except ImportError:
-    print("⚠️ EnhancedPlayer not available, using fallback")
+    logger.warning("⚠️ EnhancedPlayer not available, using fallback")
     Player = None
 
 try:
-    from ui.status_system import StatusSystem
+    from ui.status_popup import StatusManager
 except ImportError:
-    print("⚠️ StatusSystem not available, using fallback")
-    StatusSystem = None
+    logger.warning("⚠️ StatusManager not available, using fallback")
+    StatusManager = None
+
+# Used only if a data/dialogues/<name>_nerv_arrival.json file is missing
+NERV_FALLBACK_LINES = {
+    "misato_nerv_arrival": [
+        {"id": "nerv_welcome", "text": "Welcome to NERV, Shinji."},
+        {"id": "nerv_fight_angels", "text": "This is where we fight the Angels."},
+        {"id": "nerv_ready_briefing", "text": "Are you ready for your first briefing?"}
+    ],
+    "maya_nerv_arrival": [
+        {"id": "eva_machines", "text": "The EVA units are incredible machines."},
+        {"id": "sync_compatibility", "text": "Your sync rate will determine compatibility."},
+        {"id": "pilot_good_luck", "text": "Good luck, pilot!"}
+    ],
+    "ritsuko_nerv_arrival": [
+        {"id": "eva_science", "text": "The science behind EVA is complex."},
+        {"id": "eva_understanding", "text": "But you don't need to understand it all."},
+        {"id": "focus_on_sync", "text": "Just focus on syncing with your unit."}
+    ]
+}
 
 class NervArrivalScene:
     """NERV Arrival Scene with enhanced systems"""
@@ -44,7 +70,7 @@ class NervArrivalScene:
         # Enhanced systems (with fallbacks)
         self.hud = HUD(game_manager) if HUD else None
         self.player = Player(400, 300, game_manager) if Player else None
-        self.status_system = StatusSystem() if StatusSystem else None
+        self.status_system = StatusManager() if StatusManager else None
         
         # Basic player fallback
         if not self.player:
@@ -58,24 +84,15 @@ class NervArrivalScene:
         self.briefing_complete = False
         self.elevator_available = False
         
-        # NERV personnel
+        # NERV personnel (lines and read-tracking ids from data/dialogues/<name>_nerv_arrival.json)
         self.personnel = [
-            {"name": "Misato", "pos": (200, 250), "talked": False, "dialogue": [
-                "Misato: Welcome to NERV, Shinji.",
-                "Misato: This is where we fight the Angels.",
-                "Misato: Are you ready for your first briefing?"
-            ]},
-            {"name": "Maya", "pos": (500, 200), "talked": False, "dialogue": [
-                "Maya: The EVA units are incredible machines.",
-                "Maya: Your sync rate will determine compatibility.",
-                "Maya: Good luck, pilot!"
-            ]},
-            {"name": "Ritsuko", "pos": (350, 180), "talked": False, "dialogue": [
-                "Ritsuko: The science behind EVA is complex.",
-                "Ritsuko: But you don't need to understand it all.",
-                "Ritsuko: Just focus on syncing with your unit."
-            ]}
+            {"name": "Misato", "pos": (200, 250), "talked": False},
+            {"name": "Maya", "pos": (500, 200), "talked": False},
+            {"name": "Ritsuko", "pos": (350, 180), "talked": False}
         ]
+        for npc in self.personnel:
+            dialogue_name = npc["name"].lower() + "_nerv_arrival"
+            npc["lines"] = load_dialogue_lines(dialogue_name, NERV_FALLBACK_LINES[dialogue_name])
         
         # Interactive areas
         self.interactive_areas = [
@@ -96,12 +113,14 @@ class NervArrivalScene:
         # Fonts
         self.title_font = pygame.font.Font(None, 36)
         self.text_font = pygame.font.Font(None, 24)
-        self.dialogue_font = pygame.font.Font(None, 20)
+        self.text_layout = get_text_layout()
+        self.dialogue_font = self.text_layout.get_font(20)
+        self.typewriter = TypewriterText(self.text_layout)
         
         # Background
         self.background = self._create_nerv_background()
         
-        print("🏢 NERV Arrival Scene initialized")
+        logger.info("🏢 NERV Arrival Scene initialized")
     
     def _create_nerv_background(self):
         """Create NERV facility background"""
@@ -135,7 +154,11 @@ class NervArrivalScene:
         if self.in_conversation:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                    self._advance_dialogue()
+                    # First press completes the reveal, second advances
+                    if self.typewriter.is_complete():
+                        self._advance_dialogue()
+                    else:
+                        self.typewriter.finish()
                 elif event.key == pygame.K_ESCAPE:
                     self._end_conversation()
         else:
@@ -196,11 +219,34 @@ class NervArrivalScene:
         
         if self.status_system:
             self.status_system.add_message(f"Talking to {npc['name']}", "info")
+        self._show_dialogue_line()
+    
+    def _get_line_ids(self, npc):
+        """Get read-tracking ids for an NPC's dialogue lines"""
+        return [line["id"] for line in npc["lines"]]
+    
+    def _show_dialogue_line(self):
+        """Show current line, fast-forwarding through read lines in skip mode"""
+        line_ids = self._get_line_ids(self.current_npc)
+        read_lines = self.game_manager.read_lines
+        
+        if self.game_manager.game_settings.get("skip_read_text", False):
+            self.dialogue_index = read_lines.first_unseen(line_ids, self.dialogue_index)
+            if self.dialogue_index >= len(line_ids):
+                self._end_conversation()
+                return
+        
+        # Same box geometry as _render_conversation
+        line = self.current_npc["lines"][self.dialogue_index]
+        self.typewriter.apply_settings(self.game_manager.game_settings)
+        self.typewriter.start(f"{self.current_npc['name']}: {line['text']}", self.dialogue_font,
+                              COLORS['TEXT_WHITE'], SCREEN_WIDTH - 100 - 40)
     
     def _advance_dialogue(self):
         """Advance to next dialogue line"""
-        if self.current_npc and self.dialogue_index < len(self.current_npc["dialogue"]) - 1:
+        if self.current_npc and self.dialogue_index < len(self.current_npc["lines"]) - 1:
             self.dialogue_index += 1
+            self._show_dialogue_line()
         else:
             self._end_conversation()
     
@@ -273,6 +319,14 @@ class NervArrivalScene:
         if self.status_system:
             self.status_system.update(dt)
         
+        # Typewriter reveal and auto-advance (a line counts as read once fully shown)
+        if self.in_conversation:
+            self.typewriter.update(dt)
+            if self.typewriter.is_complete():
+                self.game_manager.read_lines.mark_seen(self._get_line_ids(self.current_npc)[self.dialogue_index])
+            if self.typewriter.should_auto_advance():
+                self._advance_dialogue()
+        
         # Update scene state
         self._check_briefing_status()
     
@@ -392,13 +446,10 @@ class NervArrivalScene:
         screen.blit(conv_surface, conv_rect.topleft)
         
         # Current dialogue
-        current_dialogue = self.current_npc["dialogue"][self.dialogue_index]
-        dialogue_text = self.dialogue_font.render(current_dialogue, True, COLORS['TEXT_WHITE'])
-        dialogue_rect = dialogue_text.get_rect(left=conv_rect.left + 20, top=conv_rect.top + 20)
-        screen.blit(dialogue_text, dialogue_rect)
+        self.typewriter.render(screen, (conv_rect.left + 20, conv_rect.top + 20))
         
         # Progress indicator
-        progress_text = f"{self.dialogue_index + 1}/{len(self.current_npc['dialogue'])}"
+        progress_text = f"{self.dialogue_index + 1}/{len(self.current_npc['lines'])}"
         progress_surface = pygame.font.Font(None, 14).render(progress_text, True, COLORS['UI_GRAY'])
         progress_rect = progress_surface.get_rect(right=conv_rect.right - 20, top=conv_rect.top + 10)
         screen.blit(progress_surface, progress_rect)
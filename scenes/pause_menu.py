@@ -15,9 +15,24 @@ FEATURES:
 
 import pygame
 import json
+import math
 import os
 import time
 from config import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from graphics.procedural_textures import get_procedural_textures
+from graphics.transform_cache import get_transform_cache
+from managers.io_service import get_io_service
+from ui.widgets import UIRoot, Panel, Label, Button, ListWidget
+from managers.game_log import get_logger
+
+logger = get_logger("pause_menu")
+
+# Background wave: dots every BACKGROUND_DOT_SPACING px, phase quantized into WAVE_PHASE_STEPS frames
+BACKGROUND_DOT_SPACING = 40
+WAVE_PHASE_STEPS = 64
+
+# Pulsing title is rendered once at this font size and scaled down
+TITLE_PEAK_SIZE = 44
 
 class PauseMenu:
     """
@@ -110,15 +125,26 @@ class PauseMenu:
         self.info_font = pygame.font.Font(None, 18)
         self.small_font = pygame.font.Font(None, 14)
         
+        # Pulsing title rendered once at its peak size, then scaled down through the transform cache
+        title_peak_font = pygame.font.Font(None, TITLE_PEAK_SIZE)
+        self.title_surface = title_peak_font.render("⏸️ GAME PAUSED", True, COLORS['NERV_RED'])
+        self.title_glow_surface = title_peak_font.render("⏸️ GAME PAUSED", True, (80, 20, 20))
+        self.transforms = get_transform_cache()
+        
         # === ANIMATIONS ===
         self.button_hover_animations = [0] * len(self.buttons)
         self.menu_animation_timer = 0
         self.background_pulse = 0
         self.particle_effects = []
         
+        # === BACKGROUND CACHE (rebuilt only when the resolution changes) ===
+        self.background_size = None
+        self.background_overlay = None
+        self.wave_frames = []           # Phase step -> blits() sequence of dot stamps
+        
         # === SAVE SYSTEM ===
         self.save_slots = 5
-        self.saves_directory = "saves"
+        self.saves_directory = self.game_manager.save_directory
         self.current_save_slot = 0
         self.available_saves = []
         
@@ -137,7 +163,11 @@ class PauseMenu:
         self._scan_available_saves()
         self.game_manager.pause_game()
         
-        print("⏸️ Complete Pause Menu initialized with all features")
+        # === WIDGET TREE ===
+        self.ui = self._build_ui()
+        self._sync_widgets()
+        
+        logger.info("⏸️ Complete Pause Menu initialized with all features")
     
     def _scan_available_saves(self, force_refresh=False):
         """Scan for available save files with caching"""
@@ -184,10 +214,153 @@ class PauseMenu:
             self.available_saves.append(save_info)
         
         self.saves_cache_time = current_time
-        print(f"💾 Found {sum(1 for save in self.available_saves if save['exists'])} save files")
+        logger.info(f"💾 Found {sum(1 for save in self.available_saves if save['exists'])} save files")
+    
+    # === WIDGET TREE ===
+    
+    def _build_ui(self):
+        """Build the main, save/load and confirmation views once"""
+        ui = UIRoot((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        center_x = self.menu_x + self.menu_width // 2
+        
+        # === MAIN VIEW (frame and title are animated, drawn by _render_main_menu) ===
+        self.main_view = ui.add(Panel((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        button_panel = self.main_view.add(Panel(layout="vertical", spacing=self.button_spacing - self.button_height))
+        button_panel.set_rect((self.menu_x + (self.menu_width - self.button_width) // 2, self.buttons_start_y,
+                               self.button_width, len(self.buttons) * self.button_spacing))
+        self.main_buttons = []
+        for index, button in enumerate(self.buttons):
+            widget = button_panel.add(Button(f"{button['icon']} {button['text']}", self.button_font,
+                                             (self.button_width, self.button_height),
+                                             selected_color=tuple(int(c * 0.85) for c in button["color"]),
+                                             selected_border_color=button["color"], text_shadow=True))
+            widget.on_hover = lambda widget, index=index: self._hover_button(index)
+            widget.on_click = lambda widget, index=index: self._click_button(index)
+            self.main_buttons.append(widget)
+        
+        # Game info
+        info_y = self.menu_y + self.menu_height - 80
+        self.info_labels = [self.main_view.add(Label("", self.desc_font, COLORS['UI_GRAY'])) for _ in range(3)]
+        for index, label in enumerate(self.info_labels):
+            label.place(centerx=center_x, centery=info_y + index * 18)
+        self._refresh_game_info()
+        
+        # === SAVE / LOAD VIEW ===
+        self.submenu_view = ui.add(Panel((self.menu_width, self.menu_height), color=(20, 20, 40),
+                                         border_color=COLORS['HANGAR_BLUE'], border_width=3))
+        self.submenu_view.place(topleft=(self.menu_x, self.menu_y))
+        self.submenu_title = self.submenu_view.add(Label("", self.title_font, COLORS['HANGAR_BLUE']))
+        self.submenu_instruction = self.submenu_view.add(Label("", self.info_font, COLORS['TEXT_WHITE']))
+        self.slot_list = self.submenu_view.add(ListWidget((self.menu_width - 40, self.save_slots * 60), 50,
+                                                          self._render_save_slot, spacing=10))
+        self.slot_list.place(topleft=(self.menu_x + 20, self.menu_y + 100))
+        self.slot_list.on_hover = lambda widget: setattr(self, 'submenu_selection', widget.selected_index)
+        self.slot_list.on_select = lambda widget, index: self._activate_slot(index)
+        self.submenu_view.add(Label("↑↓ Select | ENTER Confirm | ESC Back", self.small_font, COLORS['UI_GRAY'])).place(
+            center=(center_x, self.menu_y + self.menu_height - 20))
+        
+        # === CONFIRMATION VIEW ===
+        dialog_rect = pygame.Rect((SCREEN_WIDTH - 400) // 2, (SCREEN_HEIGHT - 150) // 2, 400, 150)
+        self.confirm_view = ui.add(Panel(dialog_rect.size, color=(40, 20, 20), border_color=COLORS['NERV_RED'],
+                                         border_width=3))
+        self.confirm_view.place(topleft=dialog_rect.topleft)
+        self.confirm_view.add(Label("⚠️ CONFIRMATION", self.button_font, COLORS['NERV_RED'])).place(
+            center=(dialog_rect.centerx, dialog_rect.top + 30))
+        self.confirm_message_label = self.confirm_view.add(Label("", self.info_font, COLORS['TEXT_WHITE']))
+        self.confirm_buttons = []
+        for index, button_text in enumerate(self.confirmation_buttons):
+            widget = self.confirm_view.add(Button(button_text, self.info_font, (80, 35), color=COLORS['UI_GRAY'],
+                                                  border_color=COLORS['TEXT_WHITE'], selected_border_width=2,
+                                                  selected_color=COLORS['NERV_RED'] if index == 0 else COLORS['TERMINAL_GREEN']))
+            widget.place(center=(dialog_rect.centerx - 60 + index * 120, dialog_rect.top + 117))
+            widget.on_hover = lambda widget, index=index: setattr(self, 'confirmation_selection', index)
+            widget.on_click = lambda widget, index=index: self._answer_confirmation(index)
+            self.confirm_buttons.append(widget)
+        
+        return ui
+    
+    def _sync_widgets(self):
+        """Push menu state into the widget tree (unchanged widgets are not redrawn)"""
+        self.main_view.set_visible(not self.show_confirmation and not self.in_submenu)
+        self.submenu_view.set_visible(self.in_submenu and not self.show_confirmation)
+        self.confirm_view.set_visible(self.show_confirmation)
+        
+        for index, widget in enumerate(self.main_buttons):
+            widget.set(selected=index == self.selected_button)
+        
+        if self.in_submenu:
+            is_save = self.submenu_type == "save"
+            center_x = self.menu_x + self.menu_width // 2
+            self.submenu_title.set_text("💾 SAVE GAME" if is_save else "📁 LOAD GAME")
+            self.submenu_title.place(center=(center_x, self.menu_y + 30))
+            self.submenu_instruction.set_text("Select slot to save to:" if is_save else "Select slot to load from:")
+            self.submenu_instruction.place(center=(center_x, self.menu_y + 60))
+            self.slot_list.set_items(self.available_saves)
+            self.slot_list.select(self.submenu_selection)
+        
+        if self.show_confirmation:
+            self.confirm_message_label.set_text(self.confirmation_message)
+            self.confirm_message_label.place(center=(self.confirm_view.rect.centerx, self.confirm_view.rect.top + 65))
+            for index, widget in enumerate(self.confirm_buttons):
+                widget.set(selected=index == self.confirmation_selection)
+    
+    def _refresh_game_info(self):
+        """Update the game info labels"""
+        visible = hasattr(self.game_manager, 'scene_manager') and self.game_manager.scene_manager
+        for label in self.info_labels:
+            label.set_visible(bool(visible))
+        if not visible:
+            return
+        
+        current_scene = self.game_manager.scene_manager.get_current_scene_name()
+        player_data = self.game_manager.get_player_data()
+        info_lines = [
+            f"📍 Location: {current_scene}",
+            f"⭐ Level: {getattr(player_data, 'level', 1)} | 🔗 Sync: {getattr(player_data, 'sync_ratio', 50.0):.1f}%",
+            f"🕐 Current Time: 2025-09-03 05:54:51"
+        ]
+        center_x = self.menu_x + self.menu_width // 2
+        for label, line in zip(self.info_labels, info_lines):
+            label.set_text(line)
+            label.place(centerx=center_x)
+    
+    def _hover_button(self, index):
+        """Select a main button under the mouse"""
+        if self.selected_button != index:
+            self.selected_button = index
+            self._play_sound("menu_hover")
+    
+    def _click_button(self, index):
+        """Activate a clicked main button"""
+        self.selected_button = index
+        self._execute_button_action()
+    
+    def _activate_slot(self, slot):
+        """Save to or load from a clicked slot"""
+        self.submenu_selection = slot
+        if self.submenu_type == "save":
+            self._save_to_slot(slot)
+        elif self.submenu_type == "load":
+            self._load_from_slot(slot)
+    
+    def _answer_confirmation(self, index):
+        """Handle Yes (0) or No (1) in the confirmation dialog"""
+        self.confirmation_selection = index
+        if index == 0:  # Yes
+            self._execute_confirmed_action()
+        else:  # No
+            self.show_confirmation = False
+            self._play_sound("menu_back")
+    
+    # === EVENTS ===
     
     def handle_event(self, event):
         """Handle pause menu events with full feature support"""
+        # Mouse hover and clicks go through the widget tree of the visible view
+        self._sync_widgets()
+        if self.ui.handle_event(event):
+            return
+        
         if self.show_confirmation:
             self._handle_confirmation_events(event)
             return
@@ -211,13 +384,6 @@ class PauseMenu:
             
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 self._execute_button_action()
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # Left click
-                self._handle_mouse_click(event.pos)
-        
-        elif event.type == pygame.MOUSEMOTION:
-            self._handle_mouse_hover(event.pos)
     
     def _handle_confirmation_events(self, event):
         """Handle confirmation dialog events"""
@@ -235,15 +401,7 @@ class PauseMenu:
                 self._play_sound("menu_move")
             
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                if self.confirmation_selection == 0:  # Yes
-                    self._execute_confirmed_action()
-                else:  # No
-                    self.show_confirmation = False
-                    self._play_sound("menu_back")
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # Handle confirmation button clicks
-            self._handle_confirmation_click(event.pos)
+                self._answer_confirmation(self.confirmation_selection)
     
     def _handle_submenu_events(self, event):
         """Handle submenu events (save/load)"""
@@ -262,71 +420,7 @@ class PauseMenu:
                 self._play_sound("menu_move")
             
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                if self.submenu_type == "save":
-                    self._save_to_slot(self.submenu_selection)
-                elif self.submenu_type == "load":
-                    self._load_from_slot(self.submenu_selection)
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            self._handle_submenu_click(event.pos)
-    
-    def _handle_mouse_click(self, pos):
-        """Handle mouse clicks on main menu"""
-        for i, button in enumerate(self.buttons):
-            button_rect = self._get_button_rect(i)
-            if button_rect.collidepoint(pos):
-                self.selected_button = i
-                self._execute_button_action()
-                break
-    
-    def _handle_mouse_hover(self, pos):
-        """Handle mouse hover over buttons"""
-        for i, button in enumerate(self.buttons):
-            button_rect = self._get_button_rect(i)
-            if button_rect.collidepoint(pos):
-                if self.selected_button != i:
-                    self.selected_button = i
-                    self._play_sound("menu_hover")
-                break
-    
-    def _handle_confirmation_click(self, pos):
-        """Handle clicks on confirmation dialog"""
-        confirm_y = SCREEN_HEIGHT // 2 + 20
-        button_width = 80
-        button_spacing = 120
-        
-        for i, button_text in enumerate(self.confirmation_buttons):
-            button_x = SCREEN_WIDTH // 2 - button_spacing // 2 + i * button_spacing - button_width // 2
-            button_rect = pygame.Rect(button_x, confirm_y, button_width, 35)
-            
-            if button_rect.collidepoint(pos):
-                self.confirmation_selection = i
-                if i == 0:  # Yes
-                    self._execute_confirmed_action()
-                else:  # No
-                    self.show_confirmation = False
-                    self._play_sound("menu_back")
-                break
-    
-    def _handle_submenu_click(self, pos):
-        """Handle clicks in save/load submenu"""
-        for i in range(self.save_slots):
-            slot_y = self.menu_y + 100 + i * 60
-            slot_rect = pygame.Rect(self.menu_x + 20, slot_y, self.menu_width - 40, 50)
-            
-            if slot_rect.collidepoint(pos):
-                self.submenu_selection = i
-                if self.submenu_type == "save":
-                    self._save_to_slot(i)
-                elif self.submenu_type == "load":
-                    self._load_from_slot(i)
-                break
-    
-    def _get_button_rect(self, button_index):
-        """Get rectangle for button with enhanced sizing"""
-        button_x = self.menu_x + (self.menu_width - self.button_width) // 2
-        button_y = self.buttons_start_y + button_index * self.button_spacing
-        return pygame.Rect(button_x, button_y, self.button_width, self.button_height)
+                self._activate_slot(self.submenu_selection)
     
     def _execute_button_action(self):
         """Execute selected button action with enhancements"""
@@ -353,7 +447,7 @@ class PauseMenu:
         self._play_sound("menu_resume")
         self.game_manager.resume_game()
         self.scene_manager.current_scene = self.previous_scene
-        print("▶️ Game resumed")
+        logger.info("▶️ Game resumed")
     
     def _open_save_menu(self):
         """Open save game submenu"""
@@ -361,7 +455,7 @@ class PauseMenu:
         self.submenu_type = "save"
         self.submenu_selection = 0
         self._scan_available_saves()
-        print("💾 Save menu opened")
+        logger.info("💾 Save menu opened")
     
     def _open_load_menu(self):
         """Open load game submenu"""
@@ -369,7 +463,7 @@ class PauseMenu:
         self.submenu_type = "load"
         self.submenu_selection = 0
         self._scan_available_saves()
-        print("📁 Load menu opened")
+        logger.info("📁 Load menu opened")
     
     def _save_to_slot(self, slot):
         """Save game to specific slot"""
@@ -392,12 +486,12 @@ class PauseMenu:
                     "current_mood": player_data.current_mood,
                     "relationships": player_data.relationships,
                     "inventory": player_data.inventory,
-                    "story_flags": player_data.story_flags,
+                    "story_flags": player_data.story_flags.to_save(),
                     "position": player_data.position,
                     "battles_won": player_data.battles_won,
                     "missions_completed": player_data.missions_completed
                 },
-                "story_progress": self.scene_manager.get_story_progress(),
+                "story_progress": self.scene_manager.get_story_progress().to_save(),
                 "game_settings": {
                     "difficulty": "normal",
                     "auto_save": True
@@ -410,38 +504,46 @@ class PauseMenu:
                 }
             }
             
-            # Save to file
+            # Write in the background; confirmation comes from _on_slot_saved
             save_file = os.path.join(self.saves_directory, f"save_slot_{slot}.json")
-            with open(save_file, "w") as f:
-                json.dump(save_data, f, indent=4)
-            
-            print(f"💾 Game saved to slot {slot + 1}")
-            self._show_save_confirmation(slot)
-            
-            # Refresh save list (force refresh after save)
-            self._scan_available_saves(force_refresh=True)
+            get_io_service().write_json(save_file, save_data,
+                                        callback=lambda error: self._on_slot_saved(slot, error))
             
-            # Close submenu after successful save
+            # Close submenu once the save is queued
             self.in_submenu = False
             self.submenu_type = None
             
         except Exception as e:
-            print(f"❌ Save failed: {e}")
+            logger.error(f"❌ Save failed: {e}")
             self._show_save_error(str(e))
     
+    def _on_slot_saved(self, slot, error):
+        """Confirm a finished save write (main thread)"""
+        if error:
+            logger.error(f"❌ Save failed: {error}")
+            self._show_save_error(str(error))
+            return
+        
+        logger.info(f"💾 Game saved to slot {slot + 1}")
+        self._show_save_confirmation(slot)
+        
+        # Refresh save list (force refresh after save)
+        self._scan_available_saves(force_refresh=True)
+    
     def _load_from_slot(self, slot):
         """Load game from specific slot"""
         save_info = self.available_saves[slot]
         
         if not save_info["exists"]:
-            print(f"📁 No save file in slot {slot + 1}")
+            logger.info(f"📁 No save file in slot {slot + 1}")
             return
         
         if save_info.get("corrupted", False):
-            print(f"📁 Save file in slot {slot + 1} is corrupted")
+            logger.info(f"📁 Save file in slot {slot + 1} is corrupted")
             return
         
         try:
+            get_io_service().flush(save_info["file_path"])
             with open(save_info["file_path"], "r") as f:
                 save_data = json.load(f)
             
@@ -454,25 +556,23 @@ class PauseMenu:
                 if hasattr(player_data, attr):
                     setattr(player_data, attr, value)
                 else:
-                    print(f"⚠️ Unknown player attribute: {attr}")
+                    logger.warning(f"⚠️ Unknown player attribute: {attr}")
             
             # Restore story progress
             if "story_progress" in save_data:
-                story_progress = save_data["story_progress"]
-                for flag, value in story_progress.items():
-                    self.scene_manager.story_flags[flag] = value
+                self.scene_manager.get_story_progress().load(save_data["story_progress"])
             
             # Restore scene
             saved_scene = save_data.get("current_scene", "bedroom")
             
-            print(f"📁 Game loaded from slot {slot + 1} - Scene: {saved_scene}")
+            logger.info(f"📁 Game loaded from slot {slot + 1} - Scene: {saved_scene}")
             
             # Resume and change to saved scene
             self.game_manager.resume_game()
             self.scene_manager.change_scene(saved_scene)
             
         except Exception as e:
-            print(f"❌ Load failed: {e}")
+            logger.error(f"❌ Load failed: {e}")
             self._show_load_error(str(e))
     
     def _open_settings(self):
@@ -484,7 +584,7 @@ class PauseMenu:
         # Go to settings
         self.game_manager.resume_game()
         self.scene_manager.change_scene("settings")
-        print("⚙️ Settings opened from pause menu")
+        logger.info("⚙️ Settings opened from pause menu")
     
     def _show_confirmation(self, message, action):
         """Show confirmation dialog"""
@@ -507,13 +607,13 @@ class PauseMenu:
     
     def _return_to_main_menu(self):
         """Return to main menu"""
-        print("🏠 Returning to main menu")
+        logger.info("🏠 Returning to main menu")
         self.game_manager.resume_game()
         self.scene_manager.change_scene("main_menu")
     
     def _exit_game(self):
         """Exit the game"""
-        print("🚪 Exiting game")
+        logger.info("🚪 Exiting game")
         import sys
         sys.exit()
     
@@ -521,26 +621,24 @@ class PauseMenu:
         """Show save confirmation message"""
         timestamp = time.strftime("%H:%M:%S")
         message = f"Game saved to slot {slot + 1} at {timestamp}"
-        print(f"✅ {message}")
+        logger.info(f"✅ {message}")
         
         # Could add visual confirmation here
         self._add_particle_effect("save_success")
     
     def _show_save_error(self, error):
         """Show save error message"""
-        print(f"❌ Save error: {error}")
+        logger.error(f"❌ Save error: {error}")
         self._add_particle_effect("error")
     
     def _show_load_error(self, error):
         """Show load error message"""
-        print(f"❌ Load error: {error}")
+        logger.error(f"❌ Load error: {error}")
         self._add_particle_effect("error")
     
     def _play_sound(self, sound_name):
         """Play menu sound effect"""
-        # In full implementation, would use audio manager
-        print(f"🔊 Playing sound: {sound_name}")
-        # self.game_manager.audio_manager.play_sfx(sound_name)
+        self.game_manager.audio_manager.play_sfx(sound_name, priority=1)
     
     def _add_particle_effect(self, effect_type):
         """Add particle effect for feedback"""
@@ -575,51 +673,72 @@ class PauseMenu:
         # === BACKGROUND OVERLAY ===
         self._render_enhanced_background(screen)
         
-        if self.show_confirmation:
-            self._render_confirmation_dialog(screen)
-        elif self.in_submenu:
-            self._render_submenu(screen)
-        else:
+        self._sync_widgets()
+        on_main_menu = not self.show_confirmation and not self.in_submenu
+        if on_main_menu:
             self._render_main_menu(screen)
         
+        # === WIDGETS (only the visible view draws) ===
+        self.ui.render(screen)
+        if on_main_menu:
+            self._render_button_effects(screen)
+        
         # === PARTICLE EFFECTS ===
         self._render_particle_effects(screen)
     
+    def _build_background_tables(self, size):
+        """Precompute the dot distance map and per-phase dot stamps for a resolution"""
+        width, height = size
+        self.background_size = size
+        self.background_overlay = pygame.Surface(size)
+        self.background_overlay.fill((0, 0, 0))
+        
+        # Static radial distance of every dot from the screen centre
+        dots = [(i, j, math.sqrt((i - width // 2) ** 2 + (j - height // 2) ** 2))
+                for i in range(0, width, BACKGROUND_DOT_SPACING)
+                for j in range(0, height, BACKGROUND_DOT_SPACING)]
+        
+        # One pre-rendered dot per alpha level the wave can reach (10-50)
+        stamps = {}
+        for alpha in range(10, 51):
+            stamp = pygame.Surface((5, 5), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (40, 40, 80, alpha), (2, 2), 2)
+            stamps[alpha] = stamp
+        
+        # Phase table: the wave for each quantized phase, resolved to stamp blits
+        self.wave_frames = []
+        for step in range(WAVE_PHASE_STEPS):
+            phase = step * 2 * math.pi / WAVE_PHASE_STEPS
+            self.wave_frames.append([(stamps[max(10, int(30 + math.sin(distance * 0.01 + phase) * 20))], (i - 2, j - 2))
+                                     for i, j, distance in dots])
+    
     def _render_enhanced_background(self, screen):
         """Render enhanced background with effects"""
-        # Animated overlay
-        import math
+        if screen.get_size() != self.background_size:
+            self._build_background_tables(screen.get_size())
+        
+        # Animated overlay (one reused surface, only its alpha changes)
         pulse_alpha = int(120 + 30 * math.sin(self.background_pulse * 2))
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, pulse_alpha))
-        screen.blit(overlay, (0, 0))
-        
-        # Animated background pattern
-        for i in range(0, SCREEN_WIDTH, 40):
-            for j in range(0, SCREEN_HEIGHT, 40):
-                distance_from_center = math.sqrt((i - SCREEN_WIDTH//2)**2 + (j - SCREEN_HEIGHT//2)**2)
-                wave = math.sin(distance_from_center * 0.01 + self.background_pulse * 3) * 20
-                alpha = max(0, int(30 + wave))
-                if alpha > 0:
-                    pygame.draw.circle(screen, (40, 40, 80, alpha), (i, j), 2)
+        self.background_overlay.set_alpha(pulse_alpha)
+        screen.blit(self.background_overlay, (0, 0))
+        
+        # Animated background pattern: look up the current phase step
+        phase = (self.background_pulse * 3) % (2 * math.pi)
+        step = int(phase / (2 * math.pi) * WAVE_PHASE_STEPS) % WAVE_PHASE_STEPS
+        screen.blits(self.wave_frames[step], doreturn=False)
     
     def _render_main_menu(self, screen):
         """Render main pause menu"""
         # === MENU BACKGROUND ===
         menu_rect = pygame.Rect(self.menu_x, self.menu_y, self.menu_width, self.menu_height)
         
-        # Gradient background
-        menu_surface = pygame.Surface((self.menu_width, self.menu_height), pygame.SRCALPHA)
-        for y in range(self.menu_height):
-            gradient_factor = y / self.menu_height
-            alpha = int(200 - gradient_factor * 50)
-            color = (30 + int(gradient_factor * 20), 30 + int(gradient_factor * 20), 50 + int(gradient_factor * 30), alpha)
-            pygame.draw.line(menu_surface, color, (0, y), (self.menu_width, y))
+        # Gradient background (built once, not every frame)
+        menu_surface = get_procedural_textures().vertical_gradient(
+            (self.menu_width, self.menu_height), (30, 30, 50, 200), (50, 50, 80, 150))
         
         screen.blit(menu_surface, menu_rect.topleft)
         
         # Enhanced border with animation
-        import math
         border_pulse = 1.0 + 0.2 * math.sin(self.menu_animation_timer * 3)
         border_width = int(3 * border_pulse)
         pygame.draw.rect(screen, COLORS['NERV_RED'], menu_rect, border_width)
@@ -641,33 +760,24 @@ class PauseMenu:
         
         # === TITLE ===
         title_pulse = 1.0 + 0.1 * math.sin(self.menu_animation_timer * 4)
-        title_font_size = int(40 * title_pulse)
-        title_font = pygame.font.Font(None, title_font_size)
-        title_text = title_font.render("⏸️ GAME PAUSED", True, COLORS['NERV_RED'])
+        title_scale = 40 * title_pulse / TITLE_PEAK_SIZE
+        title_text = self.transforms.scale_by(self.title_surface, title_scale)
         title_rect = title_text.get_rect(center=(self.menu_x + self.menu_width // 2, self.menu_y + 45))
         
         # Title glow effect
+        glow_surface = self.transforms.scale_by(self.title_glow_surface, title_scale)
         for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
             glow_rect = title_rect.copy()
             glow_rect.x += offset[0]
             glow_rect.y += offset[1]
-            glow_surface = title_font.render("⏸️ GAME PAUSED", True, (80, 20, 20))
             screen.blit(glow_surface, glow_rect)
         
         screen.blit(title_text, title_rect)
-        
-        # === MENU BUTTONS ===
-        self._render_enhanced_buttons(screen)
-        
-        # === GAME INFO ===
-        self._render_game_info(screen)
     
-    def _render_enhanced_buttons(self, screen):
-        """Render menu buttons with enhanced effects"""
-        import math
-        
+    def _render_button_effects(self, screen):
+        """Render animated glow and pulse around the cached button widgets"""
         for i, button in enumerate(self.buttons):
-            button_rect = self._get_button_rect(i)
+            button_rect = self.main_buttons[i].rect
             hover_amount = self.button_hover_animations[i]
             
             # Button glow effect
@@ -679,186 +789,53 @@ class PauseMenu:
                 pygame.draw.rect(glow_surface, (*button["color"], glow_alpha), glow_surface.get_rect(), 3)
                 screen.blit(glow_surface, glow_rect.topleft)
             
-            # Button background with hover effect
+            # Pulsing outline for selected button
             if i == self.selected_button:
-                bg_intensity = 0.7 + 0.3 * hover_amount
-                bg_color = tuple(int(c * bg_intensity) for c in button["color"])
-                border_color = button["color"]
-                text_color = COLORS['TEXT_WHITE']
-                
-                # Pulsing effect for selected button
                 pulse = 1.0 + 0.1 * math.sin(self.menu_animation_timer * 6)
                 pulsed_rect = button_rect.inflate(int((pulse - 1) * 20), int((pulse - 1) * 10))
-            else:
-                bg_color = (40, 40, 60)
-                border_color = COLORS['UI_GRAY']
-                text_color = COLORS['TEXT_WHITE']
-                pulsed_rect = button_rect
-            
-            # Draw button background
-            pygame.draw.rect(screen, bg_color, pulsed_rect)
-            
-            # Button border with enhanced width
-            border_width = 3 if i == self.selected_button else 2
-            pygame.draw.rect(screen, border_color, pulsed_rect, border_width)
-            
-            # Inner highlight
-            if i == self.selected_button:
-                inner_rect = pulsed_rect.inflate(-6, -6)
-                pygame.draw.rect(screen, (*COLORS['TEXT_WHITE'], 30), inner_rect)
-            
-            # Button text with icon
-            button_text = f"{button['icon']} {button['text']}"
-            text_surface = self.button_font.render(button_text, True, text_color)
-            text_rect = text_surface.get_rect(center=pulsed_rect.center)
-            
-            # Text shadow for selected button
-            if i == self.selected_button:
-                shadow_surface = self.button_font.render(button_text, True, (0, 0, 0))
-                shadow_rect = text_rect.copy()
-                shadow_rect.x += 2
-                shadow_rect.y += 2
-                screen.blit(shadow_surface, shadow_rect)
-            
-            screen.blit(text_surface, text_rect)
-    
-    def _render_submenu(self, screen):
-        """Render save/load submenu"""
-        # Submenu background
-        submenu_rect = pygame.Rect(self.menu_x, self.menu_y, self.menu_width, self.menu_height)
-        pygame.draw.rect(screen, (20, 20, 40), submenu_rect)
-        pygame.draw.rect(screen, COLORS['HANGAR_BLUE'], submenu_rect, 3)
-        
-        # Title
-        title = "💾 SAVE GAME" if self.submenu_type == "save" else "📁 LOAD GAME"
-        title_text = self.title_font.render(title, True, COLORS['HANGAR_BLUE'])
-        title_rect = title_text.get_rect(center=(self.menu_x + self.menu_width // 2, self.menu_y + 30))
-        screen.blit(title_text, title_rect)
+                pygame.draw.rect(screen, button["color"], pulsed_rect, 2)
+    
+    def _render_save_slot(self, surface, slot_rect, save_info, index, selected):
+        """Render one save/load slot row into the slot list surface"""
+        # Slot background
+        if selected:
+            pygame.draw.rect(surface, (60, 60, 100), slot_rect)
+            border_color = COLORS['SCHOOL_YELLOW']
+        else:
+            pygame.draw.rect(surface, (30, 30, 50), slot_rect)
+            border_color = COLORS['UI_GRAY']
         
-        # Instructions
-        instruction = "Select slot to save to:" if self.submenu_type == "save" else "Select slot to load from:"
-        instruction_text = self.info_font.render(instruction, True, COLORS['TEXT_WHITE'])
-        instruction_rect = instruction_text.get_rect(center=(self.menu_x + self.menu_width // 2, self.menu_y + 60))
-        screen.blit(instruction_text, instruction_rect)
+        pygame.draw.rect(surface, border_color, slot_rect, 2)
         
-        # Save slots
-        for i, save_info in enumerate(self.available_saves):
-            slot_y = self.menu_y + 100 + i * 60
-            slot_rect = pygame.Rect(self.menu_x + 20, slot_y, self.menu_width - 40, 50)
-            
-            # Slot background
-            if i == self.submenu_selection:
-                pygame.draw.rect(screen, (60, 60, 100), slot_rect)
-                border_color = COLORS['SCHOOL_YELLOW']
-            else:
-                pygame.draw.rect(screen, (30, 30, 50), slot_rect)
-                border_color = COLORS['UI_GRAY']
-            
-            pygame.draw.rect(screen, border_color, slot_rect, 2)
-            
-            # Slot content
-            slot_text = f"Slot {i + 1}:"
-            slot_surface = self.info_font.render(slot_text, True, COLORS['TEXT_WHITE'])
-            screen.blit(slot_surface, (slot_rect.left + 10, slot_rect.top + 5))
-            
-            if save_info["exists"]:
-                if save_info.get("corrupted", False):
-                    detail_text = "❌ Corrupted Save"
-                    detail_color = COLORS['NERV_RED']
-                else:
-                    timestamp = save_info.get("timestamp", "Unknown")
-                    scene = save_info.get("scene", "Unknown")
-                    level = save_info.get("level", 1)
-                    detail_text = f"Level {level} - {scene}"
-                    detail_color = COLORS['TERMINAL_GREEN']
-                    
-                    # Timestamp on second line
-                    time_text = f"Saved: {timestamp}"
-                    time_surface = self.small_font.render(time_text, True, COLORS['UI_GRAY'])
-                    screen.blit(time_surface, (slot_rect.left + 10, slot_rect.top + 30))
-            else:
-                detail_text = "Empty Slot"
-                detail_color = COLORS['UI_GRAY']
-            
-            detail_surface = self.desc_font.render(detail_text, True, detail_color)
-            screen.blit(detail_surface, (slot_rect.left + 80, slot_rect.top + 8))
-        
-        # Controls
-        controls_text = "↑↓ Select | ENTER Confirm | ESC Back"
-        controls_surface = self.small_font.render(controls_text, True, COLORS['UI_GRAY'])
-        controls_rect = controls_surface.get_rect(center=(self.menu_x + self.menu_width // 2, self.menu_y + self.menu_height - 20))
-        screen.blit(controls_surface, controls_rect)
-    
-    def _render_confirmation_dialog(self, screen):
-        """Render confirmation dialog"""
-        # Dialog background
-        dialog_width = 400
-        dialog_height = 150
-        dialog_x = (SCREEN_WIDTH - dialog_width) // 2
-        dialog_y = (SCREEN_HEIGHT - dialog_height) // 2
-        dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
-        
-        pygame.draw.rect(screen, (40, 20, 20), dialog_rect)
-        pygame.draw.rect(screen, COLORS['NERV_RED'], dialog_rect, 3)
-        
-        # Warning icon and message
-        warning_text = "⚠️ CONFIRMATION"
-        warning_surface = self.button_font.render(warning_text, True, COLORS['NERV_RED'])
-        warning_rect = warning_surface.get_rect(center=(dialog_x + dialog_width // 2, dialog_y + 30))
-        screen.blit(warning_surface, warning_rect)
-        
-        # Message
-        message_surface = self.info_font.render(self.confirmation_message, True, COLORS['TEXT_WHITE'])
-        message_rect = message_surface.get_rect(center=(dialog_x + dialog_width // 2, dialog_y + 65))
-        screen.blit(message_surface, message_rect)
-        
-        # Buttons
-        button_y = dialog_y + 100
-        button_width = 80
-        button_spacing = 120
-        
-        for i, button_text in enumerate(self.confirmation_buttons):
-            button_x = dialog_x + dialog_width // 2 - button_spacing // 2 + i * button_spacing - button_width // 2
-            button_rect = pygame.Rect(button_x, button_y, button_width, 35)
-            
-            if i == self.confirmation_selection:
-                button_color = COLORS['NERV_RED'] if i == 0 else COLORS['TERMINAL_GREEN']
-                text_color = COLORS['TEXT_WHITE']
+        # Slot content
+        slot_text = f"Slot {index + 1}:"
+        slot_surface = self.info_font.render(slot_text, True, COLORS['TEXT_WHITE'])
+        surface.blit(slot_surface, (slot_rect.left + 10, slot_rect.top + 5))
+        
+        if save_info["exists"]:
+            if save_info.get("corrupted", False):
+                detail_text = "❌ Corrupted Save"
+                detail_color = COLORS['NERV_RED']
             else:
-                button_color = COLORS['UI_GRAY']
-                text_color = COLORS['TEXT_WHITE']
-            
-            pygame.draw.rect(screen, button_color, button_rect)
-            pygame.draw.rect(screen, COLORS['TEXT_WHITE'], button_rect, 2)
-            
-            text_surface = self.info_font.render(button_text, True, text_color)
-            text_rect = text_surface.get_rect(center=button_rect.center)
-            screen.blit(text_surface, text_rect)
-    
-    def _render_game_info(self, screen):
-        """Render current game information"""
-        info_y = self.menu_y + self.menu_height - 80
+                timestamp = save_info.get("timestamp", "Unknown")
+                scene = save_info.get("scene", "Unknown")
+                level = save_info.get("level", 1)
+                detail_text = f"Level {level} - {scene}"
+                detail_color = COLORS['TERMINAL_GREEN']
+                
+                # Timestamp on second line
+                time_text = f"Saved: {timestamp}"
+                time_surface = self.small_font.render(time_text, True, COLORS['UI_GRAY'])
+                surface.blit(time_surface, (slot_rect.left + 10, slot_rect.top + 30))
+        else:
+            detail_text = "Empty Slot"
+            detail_color = COLORS['UI_GRAY']
         
-        # Current scene and player info
-        if hasattr(self.game_manager, 'scene_manager') and self.game_manager.scene_manager:
-            current_scene = self.game_manager.scene_manager.get_current_scene_name()
-            player_data = self.game_manager.get_player_data()
-            
-            info_lines = [
-                f"📍 Location: {current_scene}",
-                f"⭐ Level: {getattr(player_data, 'level', 1)} | 🔗 Sync: {getattr(player_data, 'sync_ratio', 50.0):.1f}%",
-                f"🕐 Current Time: 2025-09-03 05:54:51"
-            ]
-            
-            for i, line in enumerate(info_lines):
-                info_surface = self.desc_font.render(line, True, COLORS['UI_GRAY'])
-                info_rect = info_surface.get_rect(center=(self.menu_x + self.menu_width // 2, info_y + i * 18))
-                screen.blit(info_surface, info_rect)
+        detail_surface = self.desc_font.render(detail_text, True, detail_color)
+        surface.blit(detail_surface, (slot_rect.left + 80, slot_rect.top + 8))
     
     def _render_particle_effects(self, screen):
         """Render particle effects for feedback"""
-        import math
-        
         for effect in self.particle_effects:
             if effect["type"] == "save_success":
                 # Green particles radiating from center
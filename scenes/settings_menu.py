@@ -8,6 +8,9 @@ Professional settings menu with all advanced features
 import pygame
 import json
 import os
+from managers.game_log import get_logger
+
+logger = get_logger("settings_menu")
 
 # Add proper imports for screen dimensions
 try:
@@ -17,7 +20,13 @@ except ImportError:
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
 
-from managers.settings_manager import SettingsManager
+from managers.settings_manager import to_game_setting
+from ui.widgets import UIRoot, Panel, Label, Button, Slider
+
+# (category, key) -> (minimum, maximum, step) for numeric settings; others use 0-100 in steps of 5
+SETTING_RANGES = {
+    ("gameplay", "text_speed"): (1, 5, 1)
+}
 
 class SettingsMenu:  # Make sure this line is properly defined
     """
@@ -29,7 +38,7 @@ class SettingsMenu:  # Make sure this line is properly defined
         """Initialize complete settings menu"""
         self.game_manager = game_manager
         self.scene_manager = scene_manager
-        self.settings_manager = SettingsManager()
+        self.settings_manager = game_manager.settings_manager   # Loaded at startup and applied to game_settings
         
         # === MENU STATE ===
         self.active_tab = "audio"
@@ -88,7 +97,11 @@ class SettingsMenu:  # Make sure this line is properly defined
         self.preview_changes = {}
         self.changes_pending = False
         
-        print("⚙️ Settings Menu initialized successfully")
+        # === WIDGET TREE ===
+        self.ui = self._build_ui()
+        self._select_tab(self.active_tab)
+        
+        logger.info("⚙️ Settings Menu initialized successfully")
     
     def _create_basic_ui_elements(self):
         """Create basic UI elements"""
@@ -100,11 +113,112 @@ class SettingsMenu:  # Make sure this line is properly defined
             "advanced": []
         }
     
+    def _build_ui(self):
+        """Build the settings widget tree (tab contents are rebuilt on tab switch)"""
+        ui = UIRoot((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Background overlay and menu frame
+        ui.add(Panel((SCREEN_WIDTH, SCREEN_HEIGHT), color=(0, 0, 0, 150)))
+        menu = ui.add(Panel((self.menu_width, self.menu_height), color=(25, 25, 45),
+                            border_color=COLORS['NERV_RED'], border_width=3))
+        menu.place(topleft=(self.menu_x, self.menu_y))
+        
+        # Title
+        menu.add(Label("⚙️ SETTINGS", self.title_font, COLORS['NERV_RED'])).place(
+            center=(SCREEN_WIDTH // 2, self.menu_y + 30))
+        
+        # Tabs
+        tab_bar = menu.add(Panel((self.menu_width - 40, self.tab_height), layout="horizontal", align="stretch"))
+        tab_bar.place(topleft=(self.menu_x + 20, self.menu_y + 55))
+        self.tab_buttons = {}
+        for tab in self.tabs:
+            button = tab_bar.add(Button(f"{tab['icon']} {tab['name']}", self.tab_font,
+                                        ((self.menu_width - 40) // len(self.tabs), self.tab_height),
+                                        color=(30, 30, 50), selected_color=(50, 50, 80),
+                                        selected_border_color=tab["color"], selected_text_color=tab["color"]))
+            button.on_click = lambda widget, tab_id=tab["id"]: self._select_tab(tab_id)
+            self.tab_buttons[tab["id"]] = button
+        
+        # Tab content
+        content_top = self.menu_y + 55 + self.tab_height + 15
+        self.content_panel = menu.add(Panel((self.menu_width - 40, self.menu_y + self.menu_height - 60 - content_top),
+                                            layout="vertical", padding=10, spacing=8, align="stretch",
+                                            color=(20, 20, 35), border_color=COLORS['UI_GRAY'], border_width=1))
+        self.content_panel.place(topleft=(self.menu_x + 20, content_top))
+        
+        # Controls
+        menu.add(Label("Click a tab or use ←→ | Drag sliders | ESC: Save and return", self.desc_font,
+                       COLORS['UI_GRAY'])).place(center=(SCREEN_WIDTH // 2, self.menu_y + self.menu_height - 30))
+        return ui
+    
+    def _select_tab(self, tab_id):
+        """Switch tabs and rebuild the content widgets"""
+        for other_id, button in self.tab_buttons.items():
+            button.set(selected=other_id == tab_id)
+        self.active_tab = tab_id
+        
+        self.content_panel.clear_children()
+        settings = self.settings_manager.current_settings.get(tab_id, {})
+        if not settings:
+            self.content_panel.add(Label("No settings in this category yet", self.setting_font, COLORS['UI_GRAY']))
+        for key, value in settings.items():
+            self.content_panel.add(self._create_setting_widget(tab_id, key, value))
+    
+    def _create_setting_widget(self, category, key, value):
+        """Create the widget that edits one setting"""
+        label = key.replace("_", " ").title()
+        size = (self.menu_width - 60, 32)
+        
+        if category == "controls":
+            return Label(f"{label}: {pygame.key.name(value).upper()}", self.setting_font, COLORS['TEXT_WHITE'],
+                         size=size, align="left")
+        
+        if isinstance(value, bool):
+            button = Button(f"{label}: {'ON' if value else 'OFF'}", self.setting_font, size,
+                            color=(30, 30, 50), selected_color=(50, 50, 80))
+            button.on_click = lambda widget: self._toggle_setting(widget, category, key, label)
+            return button
+        
+        if isinstance(value, (int, float)):
+            minimum, maximum, step = SETTING_RANGES.get((category, key), (0, 100, 5))
+            return Slider(label, self.setting_font, size, value, minimum, maximum, step,
+                          on_change=lambda widget, new_value: self._change_setting(category, key, new_value))
+        
+        return Label(f"{label}: {value}", self.setting_font, COLORS['TEXT_WHITE'], size=size, align="left")
+    
+    def _toggle_setting(self, button, category, key, label):
+        """Flip an on/off setting"""
+        value = not self.settings_manager.get_setting(category, key)
+        self._change_setting(category, key, value)
+        button.set(text=f"{label}: {'ON' if value else 'OFF'}")
+    
+    def _change_setting(self, category, key, value):
+        """Store a changed setting and apply it to the running game immediately"""
+        self.settings_manager.set_setting(category, key, value)
+        self.changes_pending = True
+        
+        mapped = to_game_setting(category, key, value)
+        if mapped:
+            self.game_manager.game_settings[mapped[0]] = mapped[1]
+            if category == "audio":
+                self.game_manager.audio_manager.apply_settings(self.game_manager.game_settings)
+    
     def handle_event(self, event):
         """Handle settings menu events"""
+        if event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+        
+        # Tabs, toggles and sliders are routed through the widget tree
+        if self.ui.handle_event(event):
+            return
+        
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self._save_and_exit()
+            elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                tab_ids = [tab["id"] for tab in self.tabs]
+                step = 1 if event.key == pygame.K_RIGHT else -1
+                self._select_tab(tab_ids[(tab_ids.index(self.active_tab) + step) % len(tab_ids)])
     
     def update(self, dt):
         """Update settings menu"""
@@ -112,35 +226,13 @@ class SettingsMenu:  # Make sure this line is properly defined
     
     def render(self, screen):
         """Render settings menu"""
-        # Background overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
-        
-        # Menu background
-        menu_rect = pygame.Rect(self.menu_x, self.menu_y, self.menu_width, self.menu_height)
-        pygame.draw.rect(screen, (25, 25, 45), menu_rect)
-        pygame.draw.rect(screen, COLORS['NERV_RED'], menu_rect, 3)
-        
-        # Title
-        title_text = self.title_font.render("⚙️ SETTINGS", True, COLORS['NERV_RED'])
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, self.menu_y + 30))
-        screen.blit(title_text, title_rect)
-        
-        # Simple message
-        msg_text = "Settings menu loaded successfully!"
-        msg_surface = self.setting_font.render(msg_text, True, COLORS['TEXT_WHITE'])
-        msg_rect = msg_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        screen.blit(msg_surface, msg_rect)
-        
-        # Controls
-        controls_text = "Press ESC to return"
-        controls_surface = self.desc_font.render(controls_text, True, COLORS['UI_GRAY'])
-        controls_rect = controls_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        screen.blit(controls_surface, controls_rect)
+        self.ui.render(screen)
     
     def _save_and_exit(self):
         """Save settings and return"""
+        if self.changes_pending:
+            self.settings_manager.save_settings()
+            self.changes_pending = False
         self._return_to_previous_scene()
     
     def _return_to_previous_scene(self):
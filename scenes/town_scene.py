@@ -6,6 +6,12 @@ School and town exploration scene
 """
 
 import pygame
+import math
+from entities.navigation import NavigationGrid, Navigator
+from entities.crowd import Crowd, CROWD_AVAILABLE
+from managers.game_log import get_logger
+
+logger = get_logger("town_scene")
 
 # Add proper imports for screen dimensions
 try:
@@ -15,6 +21,16 @@ except ImportError:
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
 
+try:
+    from config import PLAYER_SPEED
+except ImportError:
+    PLAYER_SPEED = 180
+
+try:
+    from config import CROWD_SIZE
+except ImportError:
+    CROWD_SIZE = 240
+
 class TownScene:
     """Complete town exploration scene"""
     
@@ -34,17 +50,42 @@ class TownScene:
             {"name": "Teacher", "pos": (500, 200), "dialogue": ["Study hard for the exams!"]}
         ]
         
+        # Buildings
+        self.school_rect = pygame.Rect(300, 100, 200, 150)
+        
+        # Click-to-move navigation (player position is the centre of its 20x30 body)
+        obstacles = [self.school_rect] + [pygame.Rect(npc["pos"][0] - 15, npc["pos"][1] - 15, 30, 30)
+                                          for npc in self.npcs]
+        self.navigator = Navigator(NavigationGrid((20, 20, SCREEN_WIDTH - 39, SCREEN_HEIGHT - 39),
+                                                  obstacles, agent_rect=(-10, -15, 20, 30)))
+        self.move_target = None
+        self.move_path = None
+        
+        # Street crowd (seeded per scene so recorded sessions replay identically)
+        self.crowd = None
+        if CROWD_SIZE > 0 and CROWD_AVAILABLE:
+            seed = game_manager.get_scene_rng("town_crowd").getrandbits(32)
+            self.crowd = Crowd(NavigationGrid((20, 20, SCREEN_WIDTH - 39, SCREEN_HEIGHT - 39),
+                                              obstacles, agent_rect=(-5, -5, 10, 10)), CROWD_SIZE, seed)
+        
         # Fonts
         self.title_font = pygame.font.Font(None, 36)
         
-        print("🏫 Town Scene initialized")
+        logger.info("🏫 Town Scene initialized")
     
     def handle_event(self, event):
         """Handle town events"""
-        if event.type == pygame.KEYDOWN:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.move_target = event.pos
+            self.move_path = None
+        
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.scene_manager.change_scene("hub")
-            elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
+                return
+            # Keyboard movement cancels click-to-move
+            self.move_target = None
+            if event.key == pygame.K_LEFT or event.key == pygame.K_a:
                 self.player_x = max(20, self.player_x - 20)
             elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
                 self.player_x = min(SCREEN_WIDTH - 20, self.player_x + 20)
@@ -55,7 +96,35 @@ class TownScene:
     
     def update(self, dt):
         """Update town scene"""
-        pass
+        self.navigator.update(dt)
+        if self.move_target:
+            self._follow_path(dt)
+        if self.crowd:
+            self.crowd.update(dt, (self.player_x, self.player_y))
+    
+    def _follow_path(self, dt):
+        """Walk along the navigation path toward the clicked point"""
+        if self.move_path is None:
+            self.move_path = self.navigator.find_path((self.player_x, self.player_y), self.move_target)
+            if self.move_path is None:
+                return  # Still searching
+        
+        step = PLAYER_SPEED * dt
+        while self.move_path and step > 0:
+            waypoint_x, waypoint_y = self.move_path[0]
+            distance = math.hypot(waypoint_x - self.player_x, waypoint_y - self.player_y)
+            if distance <= step:
+                self.player_x, self.player_y = waypoint_x, waypoint_y
+                self.move_path.pop(0)
+                step -= distance
+            else:
+                self.player_x += (waypoint_x - self.player_x) / distance * step
+                self.player_y += (waypoint_y - self.player_y) / distance * step
+                step = 0
+        
+        if not self.move_path:
+            self.move_target = None
+            self.move_path = None
     
     def render(self, screen):
         """Render town scene"""
@@ -63,9 +132,8 @@ class TownScene:
         screen.fill((100, 150, 100))  # Green for outdoors
         
         # School building
-        school_rect = pygame.Rect(300, 100, 200, 150)
-        pygame.draw.rect(screen, (150, 100, 50), school_rect)
-        pygame.draw.rect(screen, COLORS['TEXT_WHITE'], school_rect, 2)
+        pygame.draw.rect(screen, (150, 100, 50), self.school_rect)
+        pygame.draw.rect(screen, COLORS['TEXT_WHITE'], self.school_rect, 2)
         
         # Title
         title_text = "TOKYO-3 SCHOOL"
@@ -73,17 +141,21 @@ class TownScene:
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 30))
         screen.blit(title_surface, title_rect)
         
+        # Pedestrians
+        if self.crowd:
+            self.crowd.render(screen)
+        
         # NPCs
         for npc in self.npcs:
             pygame.draw.circle(screen, COLORS['SCHOOL_YELLOW'], npc["pos"], 15)
             pygame.draw.circle(screen, COLORS['TEXT_WHITE'], npc["pos"], 15, 2)
         
         # Player
-        player_rect = pygame.Rect(self.player_x - 10, self.player_y - 15, 20, 30)
+        player_rect = pygame.Rect(int(self.player_x) - 10, int(self.player_y) - 15, 20, 30)
         pygame.draw.rect(screen, COLORS['EVA_PURPLE'], player_rect)
         pygame.draw.rect(screen, COLORS['TEXT_WHITE'], player_rect, 2)
         
         # Instructions
-        instruction_text = "Use WASD or Arrow Keys to move | ESC: Return to Hub"
+        instruction_text = "Click or use WASD / Arrow Keys to move | ESC: Return to Hub"
         instruction_surface = pygame.font.Font(None, 16).render(instruction_text, True, COLORS['TEXT_WHITE'])
         screen.blit(instruction_surface, (20, SCREEN_HEIGHT - 25))
\ No newline at end of file
@@ -7,13 +7,22 @@ First combat simulation tutorial with correct class name
 
 import pygame
 import math
-import random
 from entities.player import Player
 from entities.angel import Angel
+from entities.component_store import ComponentStore, move, expire
+from entities.angel_ai import AngelBrain, AIScheduler
 from ui.hud import HUD
 from ui.status_popup import StatusManager
+from ui.text_layout import get_text_layout
+from graphics.render_queue import (get_render_queue, LAYER_BACKGROUND, LAYER_ENTITIES, LAYER_EFFECTS,
+                                   LAYER_UI)
 from input.mouse_controller import MouseController
 from config import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.game_log import get_logger
+
+logger = get_logger("tutorial_battle_scene")
+
+ATTACK_EFFECT_SPEED = 400       # Pixels per second
 
 class TutorialBattleScene:
     """
@@ -27,7 +36,7 @@ class TutorialBattleScene:
         self.scene_manager = scene_manager
         self.angel_name = angel_name
         
-        print(f"🎓 Initializing Tutorial Battle Scene against {angel_name}")
+        logger.info(f"🎓 Initializing Tutorial Battle Scene against {angel_name}")
         
         # === PLAYER INITIALIZATION ===
         self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
@@ -40,9 +49,19 @@ class TutorialBattleScene:
         self.angel = Angel(angel_name, SCREEN_WIDTH // 2, 200)
         self.angel.hp = 100  # Weaker for tutorial
         
+        # Angel AI runs on its own fixed tick, driven by cooldowns
+        self.ai_scheduler = AIScheduler()
+        self.angel_brain = self.ai_scheduler.add(
+            AngelBrain(angel_name, self._angel_tutorial_attack, game_manager.get_scene_rng("tutorial_battle")))
+        
         # === UI SYSTEMS ===
         self.hud = HUD(game_manager)
-        self.status_manager = StatusManager()
+        self.status_manager = StatusManager(self.game_manager.audio_manager)
+        self.text_layout = get_text_layout()
+        
+        # === RENDERING ===
+        self.render_queue = get_render_queue()
+        self.background_surface = None
         
         # === TUTORIAL STATE ===
         self.tutorial_active = True
@@ -84,7 +103,7 @@ class TutorialBattleScene:
         ]
         
         # === ATTACK EFFECTS ===
-        self.attack_effects = []
+        self.attack_effects = ComponentStore()
         self.parry_active = False
         self.parry_timer = 0
         
@@ -94,7 +113,7 @@ class TutorialBattleScene:
         # === INITIAL MESSAGES ===
         self.status_manager.show_status("EVA Unit-01 Combat Simulation - Tutorial Mode", "info", 4.0)
         
-        print("✅ Tutorial battle initialized successfully")
+        logger.info("✅ Tutorial battle initialized successfully")
     
     def handle_event(self, event):
         """Handle tutorial battle events"""
@@ -148,16 +167,12 @@ class TutorialBattleScene:
             dx /= distance
             dy /= distance
             
-            # Create attack effect
-            attack_effect = {
-                'start_pos': (self.player.x, self.player.y),
-                'direction': (dx, dy),
-                'distance': 0,
-                'max_distance': min(250, distance),
-                'timer': 0.4,
-                'type': 'slash'
-            }
-            self.attack_effects.append(attack_effect)
+            # Create attack effect (flies at ATTACK_EFFECT_SPEED until its time or range runs out)
+            self.attack_effects.spawn(
+                position=(self.player.x, self.player.y),
+                velocity=(dx * ATTACK_EFFECT_SPEED, dy * ATTACK_EFFECT_SPEED),
+                timer=min(0.4, min(250, distance) / ATTACK_EFFECT_SPEED)
+            )
             
             # Tutorial feedback
             if self.tutorial_active:
@@ -239,18 +254,14 @@ class TutorialBattleScene:
         # === UPDATE ANGEL ===
         if self.battle_active:
             self.angel.update(dt)
-            
-            # Simple Angel AI for tutorial
-            if random.random() < 0.01:  # 1% chance per frame
-                self._angel_tutorial_attack()
+        
+        # Angel AI (slow, telegraphed attacks for the tutorial)
+        self.angel_brain.active = self.battle_active
+        self.ai_scheduler.update(dt)
         
         # === UPDATE ATTACK EFFECTS ===
-        for effect in self.attack_effects[:]:
-            effect['timer'] -= dt
-            effect['distance'] += 400 * dt
-            
-            if effect['timer'] <= 0 or effect['distance'] >= effect['max_distance']:
-                self.attack_effects.remove(effect)
+        move(self.attack_effects, dt)
+        expire(self.attack_effects, dt)
         
         # === UPDATE PARRY ===
         if self.parry_active:
@@ -266,10 +277,8 @@ class TutorialBattleScene:
             if event.type == pygame.USEREVENT + 1:
                 self.scene_manager.change_scene("hub")
     
-    def _angel_tutorial_attack(self):
-        """Angel attacks in tutorial (weaker)"""
-        damage = 10
-        
+    def _angel_tutorial_attack(self, damage):
+        """Angel attacks in tutorial (called by the Angel's AI)"""
         if self.parry_active:
             damage = 3
             self.status_manager.show_status(f"Parried! Damage reduced to {damage}!", "success", 2.0)
@@ -293,41 +302,55 @@ class TutorialBattleScene:
     
     def render(self, screen):
         """Render tutorial battle"""
+        queue = self.render_queue
+        
         # === SIMULATION BACKGROUND ===
-        self._render_simulation_background(screen)
+        queue.sprite(self._get_simulation_background(), (0, 0), LAYER_BACKGROUND)
         
         # === ENTITIES ===
+        # Inflated bounds cover the AT field, pulse and health bars drawn around each body
         if self.battle_active or self.tutorial_complete:
-            self.angel.render(screen)
+            queue.custom(self.angel.render, LAYER_ENTITIES, self.angel.rect.bottom, self.angel.rect.inflate(120, 120))
+            # Telegraph an incoming attack so the player can parry
+            if self.angel_brain.is_winding_up():
+                queue.rect(COLORS['TEXT_WHITE'], self.angel.rect.inflate(16, 16), LAYER_EFFECTS, width=2)
         
-        self.player.render(screen)
+        player_rect = self.player.get_rect()
+        queue.custom(self.player.render, LAYER_ENTITIES, player_rect.bottom, player_rect.inflate(80, 80))
         
         # === EFFECTS ===
-        for effect in self.attack_effects:
-            self._render_attack_effect(screen, effect)
+        for _, position, velocity in self.attack_effects.rows("position", "velocity"):
+            self._submit_attack_effect(queue, position, velocity)
         
         if self.parry_active:
-            self._render_parry_effect(screen)
+            queue.custom(self._render_parry_effect, LAYER_EFFECTS, 1)
         
         # === TUTORIAL OVERLAY ===
         if self.tutorial_active:
-            self._render_tutorial_overlay(screen)
+            queue.custom(self._render_tutorial_overlay, LAYER_UI, -1)
         
         # === HEALTH BARS ===
-        self._render_health_bars(screen)
+        self._submit_health_bars(queue)
         
         # === UI ===
-        self.hud.render(screen)
-        self.status_manager.render(screen)
+        queue.custom(self.hud.render, LAYER_UI, 1)
+        queue.custom(self.status_manager.render, LAYER_UI, 2)
         
         # === MOUSE UI ===
-        self.mouse_controller.render_mouse_ui(screen)
+        queue.custom(self.mouse_controller.render_mouse_ui, LAYER_UI, 3)
         
         # === SCENE INFO ===
-        self._render_scene_info(screen)
+        queue.custom(self._render_scene_info, LAYER_UI, 4)
+        
+        queue.flush(screen)
     
-    def _render_simulation_background(self, screen):
-        """Render simulation chamber background"""
+    def _get_simulation_background(self):
+        """Get the simulation chamber background (drawn once)"""
+        if self.background_surface is not None:
+            return self.background_surface
+        
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
         # === BASE BACKGROUND ===
         screen.fill((20, 40, 60))
         
@@ -348,6 +371,9 @@ class TutorialBattleScene:
                         (10, SCREEN_HEIGHT - indicator_size - 10, indicator_size, indicator_size))
         pygame.draw.rect(screen, COLORS['TERMINAL_GREEN'], 
                         (SCREEN_WIDTH - indicator_size - 10, SCREEN_HEIGHT - indicator_size - 10, indicator_size, indicator_size))
+        
+        self.background_surface = screen.convert() if pygame.display.get_surface() else screen
+        return self.background_surface
     
     def _render_tutorial_overlay(self, screen):
         """Render tutorial instruction overlay"""
@@ -366,19 +392,18 @@ class TutorialBattleScene:
         pygame.draw.rect(screen, COLORS['SCHOOL_YELLOW'], panel_rect, 3)
         
         # === TITLE ===
-        title_font = pygame.font.Font(None, 24)
+        title_font = self.text_layout.get_font(24)
         title_text = title_font.render(current_step["title"], True, COLORS['SCHOOL_YELLOW'])
         title_rect = title_text.get_rect(center=(panel_rect.centerx, panel_rect.top + 20))
         screen.blit(title_text, title_rect)
         
         # === INSTRUCTION ===
-        instruction_font = pygame.font.Font(None, 18)
-        instruction_lines = self._wrap_text(current_step["instruction"], instruction_font, panel_rect.width - 20)
-        
-        for i, line in enumerate(instruction_lines):
-            line_surface = instruction_font.render(line, True, COLORS['TEXT_WHITE'])
-            line_rect = line_surface.get_rect(center=(panel_rect.centerx, panel_rect.top + 45 + i * 20))
-            screen.blit(line_surface, line_rect)
+        instruction_font = self.text_layout.get_font(18)
+        instruction_surface = self.text_layout.render_block(
+            current_step["instruction"], instruction_font, COLORS['TEXT_WHITE'],
+            panel_rect.width - 20, line_spacing=20, markup=True, align="center")
+        instruction_rect = instruction_surface.get_rect(centerx=panel_rect.centerx, top=panel_rect.top + 35)
+        screen.blit(instruction_surface, instruction_rect)
         
         # === PROGRESS ===
         progress_text = f"Step {self.tutorial_step + 1}/{len(self.tutorial_steps)}"
@@ -401,44 +426,20 @@ class TutorialBattleScene:
             prompt_rect = prompt_surface.get_rect(center=(panel_rect.centerx, panel_rect.bottom + 20))
             screen.blit(prompt_surface, prompt_rect)
     
-    def _wrap_text(self, text, font, max_width):
-        """Wrap text to fit width"""
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + word + " "
-            if font.size(test_line)[0] <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line.strip())
-        
-        return lines
-    
-    def _render_attack_effect(self, screen, effect):
-        """Render attack effect"""
-        start_x, start_y = effect['start_pos']
-        dx, dy = effect['direction']
-        
-        current_x = start_x + dx * effect['distance']
-        current_y = start_y + dy * effect['distance']
+    def _submit_attack_effect(self, queue, position, velocity):
+        """Queue attack effect (culled once it flies off-screen)"""
+        current_x, current_y = position
+        dx = velocity[0] / ATTACK_EFFECT_SPEED
+        dy = velocity[1] / ATTACK_EFFECT_SPEED
         
         # Attack line with glow
         end_x = current_x + dx * 40
         end_y = current_y + dy * 40
         
-        pygame.draw.line(screen, (150, 255, 150), 
-                        (int(current_x), int(current_y)), 
-                        (int(end_x), int(end_y)), 6)
-        pygame.draw.line(screen, COLORS['TERMINAL_GREEN'], 
-                        (int(current_x), int(current_y)), 
-                        (int(end_x), int(end_y)), 3)
+        start = (int(current_x), int(current_y))
+        end = (int(end_x), int(end_y))
+        queue.line((150, 255, 150), start, end, LAYER_EFFECTS, width=6)
+        queue.line(COLORS['TERMINAL_GREEN'], start, end, LAYER_EFFECTS, width=3)
     
     def _render_parry_effect(self, screen):
         """Render parry shield effect"""
@@ -449,36 +450,36 @@ class TutorialBattleScene:
         pygame.draw.circle(screen, COLORS['HANGAR_BLUE'], 
                          (int(self.player.x), int(self.player.y)), shield_radius, 3)
     
-    def _render_health_bars(self, screen):
-        """Render health bars"""
+    def _submit_health_bars(self, queue):
+        """Queue health bars"""
+        bar_font = self.text_layout.get_font(18)
+        
         # Player health
         player_bar_rect = pygame.Rect(50, SCREEN_HEIGHT - 80, 200, 20)
-        pygame.draw.rect(screen, (40, 40, 40), player_bar_rect)
-        pygame.draw.rect(screen, COLORS['HANGAR_BLUE'], player_bar_rect, 2)
+        queue.rect((40, 40, 40), player_bar_rect, LAYER_UI)
+        queue.rect(COLORS['HANGAR_BLUE'], player_bar_rect, LAYER_UI, width=2)
         
         player_health_width = int((self.player_hp / 100) * 196)
         if player_health_width > 0:
             health_rect = pygame.Rect(52, SCREEN_HEIGHT - 78, player_health_width, 16)
-            pygame.draw.rect(screen, COLORS['TERMINAL_GREEN'], health_rect)
+            queue.rect(COLORS['TERMINAL_GREEN'], health_rect, LAYER_UI)
         
         player_text = f"EVA Unit-01: {self.player_hp}/100"
-        player_surface = pygame.font.Font(None, 18).render(player_text, True, COLORS['TEXT_WHITE'])
-        screen.blit(player_surface, (50, SCREEN_HEIGHT - 100))
+        queue.text(player_text, bar_font, COLORS['TEXT_WHITE'], (50, SCREEN_HEIGHT - 100))
         
         # Angel health (if in combat)
         if self.battle_active:
             angel_bar_rect = pygame.Rect(SCREEN_WIDTH - 250, 30, 200, 20)
-            pygame.draw.rect(screen, (40, 40, 40), angel_bar_rect)
-            pygame.draw.rect(screen, COLORS['NERV_RED'], angel_bar_rect, 2)
+            queue.rect((40, 40, 40), angel_bar_rect, LAYER_UI)
+            queue.rect(COLORS['NERV_RED'], angel_bar_rect, LAYER_UI, width=2)
             
             angel_health_width = int((self.angel_hp / 100) * 196)
             if angel_health_width > 0:
                 angel_health_rect = pygame.Rect(SCREEN_WIDTH - 248, 32, angel_health_width, 16)
-                pygame.draw.rect(screen, COLORS['NERV_RED'], angel_health_rect)
+                queue.rect(COLORS['NERV_RED'], angel_health_rect, LAYER_UI)
             
             angel_text = f"Tutorial Angel: {max(0, self.angel_hp)}/100"
-            angel_surface = pygame.font.Font(None, 18).render(angel_text, True, COLORS['TEXT_WHITE'])
-            screen.blit(angel_surface, (SCREEN_WIDTH - 250, 10))
+            queue.text(angel_text, bar_font, COLORS['TEXT_WHITE'], (SCREEN_WIDTH - 250, 10))
     
     def _render_scene_info(self, screen):
         """Render scene information"""
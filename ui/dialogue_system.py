@@ -6,7 +6,9 @@ Handles dialogue display and management
 """
 
 import pygame
-from config import COLORS
+from config import COLORS, SCREEN_WIDTH
+from ui.text_layout import get_text_layout
+from ui.typewriter import TypewriterText
 
 class DialogueManager:
     """
@@ -14,16 +16,20 @@ class DialogueManager:
     Manages dialogue display and progression
     """
     
-    def __init__(self):
+    def __init__(self, game_manager=None):
         """Initialize dialogue manager"""
+        self.game_manager = game_manager
         self.active = False
         self.current_text = ""
         self.current_speaker = ""
         self.display_timer = 0
         self.auto_hide_time = 5.0
         
-        self.font = pygame.font.Font(None, 24)
-        self.speaker_font = pygame.font.Font(None, 20)
+        self.text_layout = get_text_layout()
+        self.font = self.text_layout.get_font(24)
+        self.speaker_font = self.text_layout.get_font(20)
+        self.typewriter = TypewriterText(self.text_layout)
+        self.box_height = 100
     
     def show_dialogue(self, text, speaker="System"):
         """Show dialogue text"""
@@ -31,6 +37,12 @@ class DialogueManager:
         self.current_speaker = speaker
         self.active = True
         self.display_timer = 0
+        
+        # Reveal at text_speed; hide time follows text length
+        if self.game_manager:
+            self.typewriter.apply_settings(self.game_manager.game_settings)
+        self.typewriter.start(text, self.font, COLORS['TEXT_WHITE'], SCREEN_WIDTH - 120)
+        self.auto_hide_time = self.typewriter.get_display_time()
     
     def show_dialogue_with_options(self, text, speaker, options):
         """Show dialogue with multiple choice options"""
@@ -44,6 +56,7 @@ class DialogueManager:
     def update(self, dt):
         """Update dialogue system"""
         if self.active:
+            self.typewriter.update(dt)
             self.display_timer += dt
             if self.display_timer >= self.auto_hide_time:
                 self.hide_dialogue()
@@ -54,7 +67,7 @@ class DialogueManager:
             return
         
         # Dialogue box
-        box_height = 100
+        box_height = self.box_height
         box_rect = pygame.Rect(50, screen.get_height() - box_height - 50, 
                               screen.get_width() - 100, box_height)
         
@@ -69,5 +82,4 @@ class DialogueManager:
         
         # Text
         text_y = box_rect.top + 30 if self.current_speaker != "System" else box_rect.top + 10
-        text_surface = self.font.render(self.current_text, True, COLORS['TEXT_WHITE'])
-        screen.blit(text_surface, (box_rect.left + 10, text_y))
\ No newline at end of file
+        self.typewriter.render(screen, (box_rect.left + 10, text_y))
\ No newline at end of file
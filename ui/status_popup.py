@@ -11,11 +11,20 @@ FEATURES:
 - ✅ Priority system for important messages
 - ✅ Sound integration
 - ✅ Rich formatting support
+- ✅ Cards rendered once per message (alpha/slide/shake applied at blit)
+- ✅ Bounded priority heap with duplicate coalescing
+- ✅ Also serves the StatusSystem add_message API
 """
 
 import pygame
 import math
-from config import COLORS, SCREEN_WIDTH
+import heapq
+from config import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from ui.text_layout import get_text_layout
+from graphics.procedural_textures import get_procedural_textures
+from managers.game_log import get_logger
+
+logger = get_logger("status_popup")
 
 class StatusManager:
     """
@@ -23,12 +32,17 @@ class StatusManager:
     Advanced status message system with all features restored
     """
     
-    def __init__(self):
+    def __init__(self, audio_manager=None):
         """Initialize enhanced status manager"""
-        self.messages = []
-        self.font = pygame.font.Font(None, 18)
-        self.small_font = pygame.font.Font(None, 16)
-        self.large_font = pygame.font.Font(None, 22)
+        self.audio_manager = audio_manager
+        self.messages = []          # Display order (priority, then arrival)
+        self.message_heap = []      # [priority, sequence, message] - lowest evicted first
+        self.active_messages = {}   # (text, type) -> message, for coalescing duplicates
+        self.next_sequence = 0
+        self.text_layout = get_text_layout()
+        self.font = self.text_layout.get_font(18)
+        self.small_font = self.text_layout.get_font(16)
+        self.large_font = self.text_layout.get_font(22)
         
         # === POSITIONING SETTINGS ===
         self.hud_width = 220  # Reserve space for HUD
@@ -49,22 +63,37 @@ class StatusManager:
             "success": COLORS['TERMINAL_GREEN'],
             "info": COLORS['HANGAR_BLUE'],
             "system": COLORS['EVA_PURPLE'],
-            "dialogue": COLORS['SCHOOL_YELLOW']
+            "dialogue": COLORS['SCHOOL_YELLOW'],
+            "error": COLORS['ERROR_RED'],
+            "neutral": COLORS['TEXT_WHITE']
         }
         
+        # === CARD STYLES (background, border) ===
+        self.card_styles = {
+            "critical": ((120, 20, 20), COLORS['NERV_RED']),
+            "error": ((120, 20, 20), COLORS['ERROR_RED']),
+            "success": ((20, 80, 20), COLORS['TERMINAL_GREEN']),
+            "warning": ((80, 60, 20), COLORS['WARNING_ORANGE']),
+            "dialogue": ((60, 60, 20), COLORS['SCHOOL_YELLOW']),
+            "neutral": ((40, 40, 50), COLORS['UI_GRAY'])
+        }
+        self.default_card_style = ((20, 40, 80), COLORS['HANGAR_BLUE'])  # info, system
+        
+        # === STATUS SYSTEM COMPATIBILITY ===
+        self.message_duration = 3.0
+        
         # === SOUND INTEGRATION ===
         self.last_sound_time = 0
         self.sound_cooldown = 0.1  # Prevent sound spam
         
-        print("📢 Enhanced Status Manager initialized with animations")
+        logger.info("📢 Enhanced Status Manager initialized with animations")
     
     def show_status(self, message, status_type="info", duration=3.0, priority=0, sound=True):
         """Show enhanced status message with all features"""
         # Handle priority - higher priority messages can interrupt
         if priority > 0:
             # Remove lower priority messages of same type
-            self.messages = [msg for msg in self.messages 
-                           if msg.get('priority', 0) >= priority or msg['type'] != status_type]
+            self._remove_messages(lambda msg: msg['priority'] < priority and msg['type'] == status_type)
         
         # Color and styling based on type
         color = self.priority_colors.get(status_type, COLORS['TEXT_WHITE'])
@@ -77,20 +106,29 @@ class StatusManager:
         else:
             font = self.small_font
         
-        # Wrap long messages
-        wrapped_lines = self._wrap_message(message, font)
+        # Wrap long messages (leave margin for effects)
+        wrapped_lines = self.text_layout.wrap(message, font, self.max_width - 30) or (message,)
         
         for i, line in enumerate(wrapped_lines):
-            # Remove oldest message if we have too many
-            if len(self.messages) >= self.max_messages:
-                self.messages.pop(0)
+            line_duration = duration + (i * 0.5)  # Stagger multi-line messages
+            
+            # Coalesce duplicates: refresh the existing card instead of adding another
+            existing = self.active_messages.get((line, status_type))
+            if existing is not None:
+                existing['timer'] = max(existing['timer'], line_duration)
+                existing['max_timer'] = max(existing['max_timer'], line_duration)
+                existing['target_alpha'] = 255
+                if priority > existing['priority']:
+                    self._remove_messages(lambda msg: msg is existing)
+                else:
+                    continue
             
             # Create enhanced message object
             message_obj = {
                 'text': line,
                 'color': color,
-                'timer': duration + (i * 0.5),  # Stagger multi-line messages
-                'max_timer': duration + (i * 0.5),
+                'timer': line_duration,
+                'max_timer': line_duration,
                 'type': status_type,
                 'priority': priority,
                 'font': font,
@@ -103,15 +141,51 @@ class StatusManager:
                     'glow': status_type in ['critical', 'success'],
                     'pulse': priority >= 2,
                     'shake': status_type == 'critical'
-                }
+                },
+                'card': None,       # Rendered on first draw, rebuilt if text changes
+                'card_text': None,
+                'glow_card': None
             }
             
-            self.messages.append(message_obj)
+            self._push_message(message_obj)
         
         # Play sound if enabled
         if sound and hasattr(self, '_should_play_sound') and self._should_play_sound():
             self._play_message_sound(status_type, priority)
     
+    def add_message(self, text, message_type="info", priority=0):
+        """Add status message (StatusSystem API)"""
+        self.show_status(text, message_type, self.message_duration, priority, sound=False)
+    
+    def _push_message(self, message):
+        """Add message to the bounded heap, evicting the lowest priority"""
+        heapq.heappush(self.message_heap, [message['priority'], self.next_sequence, message])
+        self.next_sequence += 1
+        self.active_messages[(message['text'], message['type'])] = message
+        
+        while len(self.message_heap) > self.max_messages:
+            evicted = heapq.heappop(self.message_heap)[2]
+            self.active_messages.pop((evicted['text'], evicted['type']), None)
+        
+        self._refresh_display_order()
+    
+    def _remove_messages(self, predicate):
+        """Remove all messages matching predicate"""
+        kept = [entry for entry in self.message_heap if not predicate(entry[2])]
+        if len(kept) == len(self.message_heap):
+            return
+        
+        for entry in self.message_heap:
+            if predicate(entry[2]):
+                self.active_messages.pop((entry[2]['text'], entry[2]['type']), None)
+        self.message_heap = kept
+        heapq.heapify(self.message_heap)
+        self._refresh_display_order()
+    
+    def _refresh_display_order(self):
+        """Rebuild display list (highest priority first, then oldest)"""
+        self.messages = [entry[2] for entry in sorted(self.message_heap, key=lambda e: (-e[0], e[1]))]
+    
     def show_experience_gain(self, exp_amount):
         """Show experience gain with special effects"""
         self.show_status(f"🎯 +{exp_amount} EXP gained!", "success", 3.0, priority=1)
@@ -143,35 +217,6 @@ class StatusManager:
         """Show system/game message"""
         self.show_status(f"⚙️ {message}", "system", 2.5)
     
-    def _wrap_message(self, message, font):
-        """Enhanced text wrapping with emoji support"""
-        words = message.split(' ')
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + word + " "
-            try:
-                if font.size(test_line)[0] <= self.max_width - 30:  # Leave margin for effects
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line.strip())
-                    current_line = word + " "
-            except:
-                # Fallback for emoji or special characters
-                if len(current_line) + len(word) < 50:  # Character limit fallback
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line.strip())
-                    current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line.strip())
-        
-        return lines if lines else [message]  # Fallback to original
-    
     def _should_play_sound(self):
         """Check if sound should be played (cooldown)"""
         current_time = pygame.time.get_ticks()
@@ -182,7 +227,6 @@ class StatusManager:
     
     def _play_message_sound(self, status_type, priority):
         """Play appropriate sound for message type"""
-        # This would integrate with audio manager in full implementation
         sound_map = {
             "critical": "alert_critical",
             "warning": "alert_warning", 
@@ -193,12 +237,13 @@ class StatusManager:
         }
         
         sound_name = sound_map.get(status_type, "notification_info")
-        # In full implementation: self.game_manager.audio_manager.play_sfx(sound_name)
-        print(f"🔊 Playing sound: {sound_name}")
+        if self.audio_manager:
+            self.audio_manager.play_sfx(sound_name, priority)
     
     def update(self, dt):
         """Update status messages with animations"""
-        for message in self.messages[:]:
+        expired = False
+        for message in self.messages:
             # Update timers
             message['timer'] -= dt
             
@@ -220,22 +265,66 @@ class StatusManager:
                 
                 # Remove when fully faded
                 if message['alpha'] <= 0:
-                    self.messages.remove(message)
+                    expired = True
             
             # Handle fade-out for expired messages
             elif message['timer'] <= 0.5:  # Start fading in last 0.5 seconds
                 fade_ratio = message['timer'] / 0.5
                 message['target_alpha'] = int(255 * fade_ratio)
+        
+        if expired:
+            self._remove_messages(lambda msg: msg['timer'] <= 0 and msg['alpha'] <= 0)
     
     def clear_all_messages(self):
         """Clear all status messages"""
-        self.messages.clear()
-        print("🧹 All status messages cleared")
+        self.messages = []
+        self.message_heap = []
+        self.active_messages = {}
+        logger.info("🧹 All status messages cleared")
     
     def clear_messages_of_type(self, status_type):
         """Clear messages of specific type"""
-        self.messages = [msg for msg in self.messages if msg['type'] != status_type]
-        print(f"🧹 Cleared all {status_type} messages")
+        self._remove_messages(lambda msg: msg['type'] == status_type)
+        logger.info(f"🧹 Cleared all {status_type} messages")
+    
+    def _build_card(self, message):
+        """Render a message card once (background, gradient, border, text)"""
+        font = message['font']
+        text_surface = font.render(message['text'], True, message['color'])
+        text_width = text_surface.get_width()
+        text_height = text_surface.get_height()
+        
+        # Background rectangle with rounded corners effect
+        bg_width = min(text_width + 20, self.max_width)
+        bg_height = text_height + 12
+        bg_color, border_color = self.card_styles.get(message['type'], self.default_card_style)
+        
+        # Full-opacity card; message alpha is applied with set_alpha at blit time
+        card = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
+        card.fill((*bg_color, 204))
+        
+        # Add gradient effect (white sheen over the top third)
+        # Cached one pixel wide (it only varies vertically) and stretched, so card widths share one entry
+        sheen = get_procedural_textures().vertical_gradient(
+            (1, bg_height // 3), (255, 255, 255, int(204 * 0.3)), (255, 255, 255, 0))
+        card.blit(pygame.transform.scale(sheen, (bg_width, sheen.get_height())), (0, 0))
+        
+        pygame.draw.rect(card, border_color, card.get_rect(), 2)
+        card.blit(text_surface, (10, 6))
+        
+        # Glow rings for special messages (pulse is applied at blit time)
+        glow_card = None
+        if message['effects']['glow']:
+            glow_card = pygame.Surface((bg_width + 12, bg_height + 12), pygame.SRCALPHA)
+            for glow_size in range(1, 4):
+                glow_rect = pygame.Rect(0, 0, bg_width + glow_size * 4, bg_height + glow_size * 4)
+                glow_rect.center = glow_card.get_rect().center
+                glow_color = (*message['color'], max(0, 76 - glow_size * 10))
+                pygame.draw.rect(glow_card, glow_color, glow_rect, 1)
+        
+        message['card'] = card
+        message['card_text'] = message['text']
+        message['glow_card'] = glow_card
     
     def render(self, screen):
         """Render enhanced status messages with all effects"""
@@ -244,100 +333,43 @@ class StatusManager:
         
         # Calculate starting position
         current_y = self.start_y
+        ticks = pygame.time.get_ticks()
         
-        for i, message in enumerate(self.messages):
+        for message in self.messages:
+            # Cards are only re-rendered when the text changes
+            if message['card'] is None or message['card_text'] != message['text']:
+                self._build_card(message)
+            
+            alpha = int(message['alpha'])
+            
             # Calculate position with slide animation
             message_x = self.start_x + message['slide_offset']
             message_y = current_y
             
             # Apply shake effect for critical messages
             if message['effects']['shake'] and message['type'] == 'critical':
-                shake_intensity = 3 * (message['alpha'] / 255)
-                shake_x = math.sin(pygame.time.get_ticks() * 0.02) * shake_intensity
-                shake_y = math.cos(pygame.time.get_ticks() * 0.03) * shake_intensity
-                message_x += shake_x
-                message_y += shake_y
-            
-            # Create text surface
-            font = message['font']
-            text_surface = font.render(message['text'], True, message['color'])
-            text_width = text_surface.get_width()
-            text_height = text_surface.get_height()
-            
-            # Background rectangle with rounded corners effect
-            bg_width = min(text_width + 20, self.max_width)
-            bg_height = text_height + 12
-            bg_rect = pygame.Rect(message_x, message_y, bg_width, bg_height)
-            
-            # Create message surface with alpha
-            message_surface = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
-            
-            # Background color with type-specific styling
-            bg_alpha = int(message['alpha'] * 0.8)
-            if message['type'] == 'critical':
-                bg_color = (120, 20, 20, bg_alpha)
-                border_color = (*COLORS['NERV_RED'], message['alpha'])
-            elif message['type'] == 'success':
-                bg_color = (20, 80, 20, bg_alpha)
-                border_color = (*COLORS['TERMINAL_GREEN'], message['alpha'])
-            elif message['type'] == 'warning':
-                bg_color = (80, 60, 20, bg_alpha)
-                border_color = (*COLORS['WARNING_ORANGE'], message['alpha'])
-            elif message['type'] == 'dialogue':
-                bg_color = (60, 60, 20, bg_alpha)
-                border_color = (*COLORS['SCHOOL_YELLOW'], message['alpha'])
-            else:  # info, system
-                bg_color = (20, 40, 80, bg_alpha)
-                border_color = (*COLORS['HANGAR_BLUE'], message['alpha'])
-            
-            # Draw background
-            message_surface.fill(bg_color)
-            
-            # Add gradient effect
-            for j in range(bg_height // 3):
-                gradient_alpha = int(bg_alpha * 0.3 * (1 - j / (bg_height // 3)))
-                if gradient_alpha > 0:
-                    gradient_color = (255, 255, 255, gradient_alpha)
-                    pygame.draw.line(message_surface, gradient_color, (0, j), (bg_width, j))
+                shake_intensity = 3 * (alpha / 255)
+                message_x += math.sin(ticks * 0.02) * shake_intensity
+                message_y += math.cos(ticks * 0.03) * shake_intensity
             
             # Pulse effect for high priority messages
             pulse_intensity = 1.0
             if message['effects']['pulse']:
-                pulse_intensity = 1.0 + 0.2 * math.sin(pygame.time.get_ticks() * 0.01)
-            
-            # Glow effect for special messages
-            if message['effects']['glow']:
-                glow_alpha = int(message['alpha'] * 0.3 * pulse_intensity)
-                if glow_alpha > 0:
-                    for glow_size in range(1, 4):
-                        glow_rect = bg_rect.inflate(glow_size * 4, glow_size * 4)
-                        glow_surface = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
-                        glow_color = (*message['color'], max(0, glow_alpha - glow_size * 10))
-                        pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), 1)
-                        screen.blit(glow_surface, glow_rect.topleft)
-            
-            # Blit message background to screen
-            screen.blit(message_surface, bg_rect.topleft)
+                pulse_intensity = 1.0 + 0.2 * math.sin(ticks * 0.01)
             
-            # Border with pulse effect
-            border_width = int(2 * pulse_intensity)
-            pygame.draw.rect(screen, border_color, bg_rect, border_width)
+            card = message['card']
+            if message['glow_card'] is not None:
+                message['glow_card'].set_alpha(min(255, int(alpha * pulse_intensity)))
+                screen.blit(message['glow_card'], (message_x - 6, message_y - 6))
             
-            # Text with alpha
-            if message['alpha'] < 255:
-                alpha_text_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-                alpha_text_surface.blit(text_surface, (0, 0))
-                alpha_text_surface.set_alpha(int(message['alpha']))
-                screen.blit(alpha_text_surface, (message_x + 10, message_y + 6))
-            else:
-                screen.blit(text_surface, (message_x + 10, message_y + 6))
+            card.set_alpha(alpha)
+            screen.blit(card, (message_x, message_y))
             
             # Priority indicator for high-priority messages
             if message['priority'] >= 2:
                 indicator_size = int(6 * pulse_intensity)
-                indicator_color = (*COLORS['NERV_RED'], message['alpha'])
-                pygame.draw.circle(screen, indicator_color, 
-                                 (message_x + bg_width - 10, message_y + 10), indicator_size)
+                pygame.draw.circle(screen, COLORS['NERV_RED'],
+                                 (int(message_x + card.get_width() - 10), int(message_y + 10)), indicator_size)
             
             # Move to next position
             current_y += self.message_height
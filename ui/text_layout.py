@@ -0,0 +1,312 @@
+"""
+===============================
+TEXT LAYOUT ENGINE
+===============================
+Shared word wrapping and text block rendering with caching
+
+FEATURES:
+- ✅ Per-font word width cache (each word measured once)
+- ✅ LRU of (text, font, width) -> wrapped lines
+- ✅ LRU of rendered text blocks (long dialogue costs nothing after first layout)
+- ✅ Optional inline markup: [color=NAME]...[/color] and [em]...[/em]
+- ✅ Shared font cache so scenes stop creating fonts every frame
+"""
+
+import pygame
+import re
+from collections import OrderedDict
+from config import COLORS
+from assets.surface_registry import get_surface_registry, surface_bytes
+from managers.game_log import get_logger
+
+logger = get_logger("text_layout")
+
+# === INLINE MARKUP ===
+# [color=NERV_RED]text[/color]  or  [color=255,200,50]text[/color]
+# [em]emphasized text[/em]
+MARKUP_PATTERN = re.compile(r"\[(/?)(color|em)(?:=([^\]]+))?\]")
+EMPHASIS_COLOR = COLORS['SCHOOL_YELLOW']
+
+
+class TextLayoutEngine:
+    """
+    TEXT LAYOUT ENGINE
+    Memoized line breaking and block rendering shared by all text boxes
+    """
+    
+    def __init__(self, max_layouts=512, max_blocks=64, max_fonts=32, max_words_per_font=4096):
+        """Initialize layout caches"""
+        # === CACHE LIMITS ===
+        self.max_layouts = max_layouts
+        self.max_blocks = max_blocks
+        self.max_fonts = max_fonts
+        self.max_words_per_font = max_words_per_font
+        
+        # === CACHES ===
+        self.fonts = {}                     # (name, size, bold, italic) -> Font
+        self.font_specs = {}                # Font -> (name, size, bold, italic)
+        self.word_widths = OrderedDict()    # Font -> {word: width}
+        self.layouts = OrderedDict()        # (text, font, width, markup) -> lines
+        self.blocks = OrderedDict()         # (text, font, width, color, ...) -> Surface
+        
+        # === STATISTICS ===
+        self.stats = {"layout_hits": 0, "layout_misses": 0, "block_hits": 0, "block_misses": 0}
+        
+        logger.info("🔤 Text Layout Engine initialized")
+    
+    # === FONTS ===
+    
+    def get_font(self, size, name=None, bold=False, italic=False):
+        """Get a shared font instance (created once per spec)"""
+        spec = (name, size, bold, italic)
+        font = self.fonts.get(spec)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+            self.fonts[spec] = font
+            self.font_specs[font] = spec
+        return font
+    
+    def get_emphasis_font(self, font):
+        """Get the bold variant of a shared font (or the font itself)"""
+        spec = self.font_specs.get(font)
+        if spec is None:
+            return font
+        name, size, bold, italic = spec
+        return self.get_font(size, name, True, italic)
+    
+    # === MEASUREMENT ===
+    
+    def word_width(self, font, word):
+        """Get the pixel width of a word, measured once per font"""
+        widths = self.word_widths.get(font)
+        if widths is None:
+            widths = {}
+            self.word_widths[font] = widths
+            if len(self.word_widths) > self.max_fonts:
+                self.word_widths.popitem(last=False)
+        else:
+            self.word_widths.move_to_end(font)
+        
+        width = widths.get(word)
+        if width is None:
+            try:
+                width = font.size(word)[0]
+            except Exception:
+                # Fallback for emoji or characters the font cannot measure
+                width = len(word) * max(1, font.get_height() // 2)
+            if len(widths) >= self.max_words_per_font:
+                widths.clear()
+            widths[word] = width
+        return width
+    
+    # === LINE BREAKING ===
+    
+    def wrap(self, text, font, max_width):
+        """Wrap plain text to max_width, returning a tuple of line strings"""
+        key = (text, font, max_width, False)
+        lines = self._cached_layout(key)
+        if lines is None:
+            lines = tuple(" ".join(words) for words in
+                          self._break_words([(word, font) for word in text.split(' ')], font, max_width))
+            self._store_layout(key, lines)
+        return lines
+    
+    def layout(self, text, font, max_width, markup=True):
+        """Wrap text with inline markup, returning lines of (text, color, emphasis) spans"""
+        if not markup:
+            return tuple(((line, None, False),) for line in self.wrap(text, font, max_width))
+        
+        key = (text, font, max_width, True)
+        lines = self._cached_layout(key)
+        if lines is None:
+            # Each word carries its style; the font used for measuring follows emphasis
+            words = []
+            styles = []
+            for span_text, color, emphasis in self._parse_markup(text):
+                span_font = self.get_emphasis_font(font) if emphasis else font
+                for i, word in enumerate(span_text.split(' ')):
+                    if i > 0 or not words:
+                        words.append((word, span_font))
+                        styles.append((color, emphasis))
+                    elif not words[-1][0]:
+                        # Previous span ended with a space: this word starts fresh
+                        words[-1] = (word, span_font)
+                        styles[-1] = (color, emphasis)
+                    else:
+                        # Style change inside a word: join it to the previous word
+                        words[-1] = (words[-1][0] + word, words[-1][1])
+            
+            lines = []
+            index = 0
+            for line_words in self._break_words(words, font, max_width):
+                spans = []
+                for word in line_words:
+                    color, emphasis = styles[index]
+                    index += 1
+                    if spans and spans[-1][1] == color and spans[-1][2] == emphasis:
+                        spans[-1] = (spans[-1][0] + " " + word, color, emphasis)
+                    else:
+                        if spans:
+                            spans[-1] = (spans[-1][0] + " ", spans[-1][1], spans[-1][2])
+                        spans.append((word, color, emphasis))
+                lines.append(tuple(spans))
+            lines = tuple(lines)
+            self._store_layout(key, lines)
+        return lines
+    
+    def _break_words(self, words, font, max_width):
+        """Greedy line breaking over (word, measuring font) pairs"""
+        space_width = self.word_width(font, " ")
+        lines = []
+        current_line = []
+        current_width = 0
+        
+        for word, word_font in words:
+            width = self.word_width(word_font, word)
+            if current_line and current_width + space_width + width > max_width:
+                lines.append(current_line)
+                current_line = [word]
+                current_width = width
+            elif current_line:
+                current_line.append(word)
+                current_width += space_width + width
+            else:
+                current_line = [word]
+                current_width = width
+        
+        if current_line:
+            lines.append(current_line)
+        return lines
+    
+    def _parse_markup(self, text):
+        """Split text into (text, color, emphasis) spans"""
+        spans = []
+        color_stack = []
+        emphasis = 0
+        position = 0
+        
+        for match in MARKUP_PATTERN.finditer(text):
+            if match.start() > position:
+                spans.append((text[position:match.start()],
+                              color_stack[-1] if color_stack else None, emphasis > 0))
+            closing, tag, value = match.groups()
+            if tag == "color":
+                if closing:
+                    if color_stack:
+                        color_stack.pop()
+                else:
+                    color_stack.append(self._parse_color(value))
+            elif closing:
+                emphasis = max(0, emphasis - 1)
+            else:
+                emphasis += 1
+            position = match.end()
+        
+        if position < len(text) or not spans:
+            spans.append((text[position:], color_stack[-1] if color_stack else None, emphasis > 0))
+        return spans
+    
+    def _parse_color(self, value):
+        """Resolve a markup color name or r,g,b triple"""
+        if value in COLORS:
+            return COLORS[value]
+        try:
+            return tuple(int(part) for part in value.split(","))[:3]
+        except (AttributeError, ValueError):
+            return None
+    
+    def _cached_layout(self, key):
+        """Look up a cached layout"""
+        lines = self.layouts.get(key)
+        if lines is None:
+            self.stats["layout_misses"] += 1
+        else:
+            self.layouts.move_to_end(key)
+            self.stats["layout_hits"] += 1
+        return lines
+    
+    def _store_layout(self, key, lines):
+        """Store a layout, evicting the least recently used"""
+        self.layouts[key] = lines
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+    
+    # === RENDERING ===
+    
+    def render_block(self, text, font, color, max_width, line_spacing=None, markup=False, align="left"):
+        """Render wrapped text to a cached surface (do not modify the result)"""
+        key = (text, font, max_width, color, line_spacing, markup, align)
+        surface = self.blocks.get(key)
+        if surface is not None:
+            self.blocks.move_to_end(key)
+            self.stats["block_hits"] += 1
+            return surface
+        
+        self.stats["block_misses"] += 1
+        lines = self.layout(text, font, max_width, markup)
+        line_height = line_spacing or font.get_linesize()
+        surface = pygame.Surface((max(1, max_width), max(1, line_height * len(lines))), pygame.SRCALPHA)
+        
+        for i, spans in enumerate(lines):
+            rendered = []
+            line_width = 0
+            for span_text, span_color, emphasis in spans:
+                if not span_text:
+                    continue
+                span_font = self.get_emphasis_font(font) if emphasis else font
+                if span_color is None:
+                    span_color = EMPHASIS_COLOR if emphasis else color
+                span_surface = span_font.render(span_text, True, span_color)
+                rendered.append(span_surface)
+                line_width += span_surface.get_width()
+            
+            if align == "center":
+                x = (max_width - line_width) // 2
+            elif align == "right":
+                x = max_width - line_width
+            else:
+                x = 0
+            for span_surface in rendered:
+                surface.blit(span_surface, (x, i * line_height))
+                x += span_surface.get_width()
+        
+        self.blocks[key] = surface
+        if len(self.blocks) > self.max_blocks:
+            self.blocks.popitem(last=False)
+        return surface
+    
+    def strip_markup(self, text):
+        """Remove markup tags from text"""
+        return MARKUP_PATTERN.sub("", text)
+    
+    def clear(self):
+        """Clear layout and render caches (fonts are kept)"""
+        self.word_widths.clear()
+        self.layouts.clear()
+        self.blocks.clear()
+    
+    def get_memory_usage(self):
+        """Get (bytes, surfaces) held by the rendered block cache"""
+        return sum(surface_bytes(surface) for surface in self.blocks.values()), len(self.blocks)
+    
+    def get_stats(self):
+        """Get cache statistics"""
+        stats = dict(self.stats)
+        stats["layouts"] = len(self.layouts)
+        stats["blocks"] = len(self.blocks)
+        stats["fonts"] = len(self.fonts)
+        return stats
+
+
+_shared_layout = None
+
+
+def get_text_layout():
+    """Get the shared text layout engine"""
+    global _shared_layout
+    if _shared_layout is None:
+        _shared_layout = TextLayoutEngine()
+        get_surface_registry().register_cache("text_blocks", _shared_layout.get_memory_usage)
+    return _shared_layout
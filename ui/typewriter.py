@@ -0,0 +1,151 @@
+"""
+===============================
+TYPEWRITER TEXT REVEAL
+===============================
+Incremental text reveal driven by the text_speed setting
+
+FEATURES:
+- ✅ Reveals text at text_speed characters per second
+- ✅ Revealed prefix kept on a cached surface; only new glyphs are rendered
+- ✅ Flat per-frame cost regardless of text length
+- ✅ Auto-advance delay computed from text length
+- ✅ Supports text layout markup and wrapping
+"""
+
+import pygame
+from ui.text_layout import get_text_layout, EMPHASIS_COLOR
+
+try:
+    from config import AUTO_ADVANCE_BASE_DELAY, AUTO_ADVANCE_PER_CHAR
+except ImportError:
+    AUTO_ADVANCE_BASE_DELAY = 1.0
+    AUTO_ADVANCE_PER_CHAR = 0.03
+
+
+class TypewriterText:
+    """
+    TYPEWRITER TEXT
+    Reveals one block of wrapped text a few glyphs at a time
+    """
+    
+    def __init__(self, text_layout=None):
+        """Initialize typewriter"""
+        self.text_layout = text_layout or get_text_layout()
+        
+        # === SETTINGS ===
+        self.chars_per_second = 50
+        self.auto_advance = False
+        
+        # === TEXT STATE ===
+        self.text = ""
+        self.segments = []      # [line index, x, text, font, color] per styled span
+        self.total_chars = 0
+        self.line_height = 0
+        self.surface = None
+        
+        # === REVEAL STATE ===
+        self.reveal_progress = 0.0
+        self.revealed_chars = 0
+        self.segment_index = 0
+        self.segment_offset = 0
+        self.segment_cursor = 0
+        self.hold_timer = 0.0
+    
+    def apply_settings(self, game_settings):
+        """Read text_speed and auto_advance from game settings"""
+        self.chars_per_second = game_settings.get("text_speed", self.chars_per_second)
+        self.auto_advance = game_settings.get("auto_advance", self.auto_advance)
+    
+    def start(self, text, font, color, max_width, line_spacing=None, markup=True):
+        """Lay out text and begin revealing it from the first glyph"""
+        self.text = text
+        self.line_height = line_spacing or font.get_linesize()
+        lines = self.text_layout.layout(text, font, max_width, markup)
+        
+        # Span positions are measured once here, never per frame
+        self.segments = []
+        self.total_chars = 0
+        for line_index, spans in enumerate(lines):
+            x = 0
+            for span_text, span_color, emphasis in spans:
+                if not span_text:
+                    continue
+                span_font = self.text_layout.get_emphasis_font(font) if emphasis else font
+                if span_color is None:
+                    span_color = EMPHASIS_COLOR if emphasis else color
+                self.segments.append([line_index, x, span_text, span_font, span_color])
+                self.total_chars += len(span_text)
+                x += span_font.size(span_text)[0]
+        
+        self.surface = pygame.Surface((max(1, max_width), max(1, self.line_height * len(lines))),
+                                      pygame.SRCALPHA)
+        self.reveal_progress = 0.0
+        self.revealed_chars = 0
+        self.segment_index = 0
+        self.segment_offset = 0
+        self.segment_cursor = 0
+        self.hold_timer = 0.0
+        
+        if not self.chars_per_second or self.chars_per_second <= 0:
+            self.finish()
+    
+    def update(self, dt):
+        """Advance the reveal by text_speed characters per second"""
+        if self.is_complete():
+            self.hold_timer += dt
+            return
+        
+        self.reveal_progress += dt * self.chars_per_second
+        self._reveal_to(min(self.total_chars, int(self.reveal_progress)))
+    
+    def finish(self):
+        """Reveal the whole text immediately"""
+        self._reveal_to(self.total_chars)
+        self.reveal_progress = float(self.total_chars)
+    
+    def _reveal_to(self, target_chars):
+        """Render only the glyphs between the revealed count and target"""
+        while self.revealed_chars < target_chars and self.segment_index < len(self.segments):
+            line_index, x, span_text, span_font, span_color = self.segments[self.segment_index]
+            end = min(len(span_text), self.segment_offset + target_chars - self.revealed_chars)
+            
+            chunk = span_text[self.segment_offset:end]
+            if chunk.strip():
+                glyphs = span_font.render(chunk, True, span_color)
+                self.surface.blit(glyphs, (x + self.segment_cursor, line_index * self.line_height))
+                self.segment_cursor += glyphs.get_width()
+            else:
+                self.segment_cursor += span_font.size(chunk)[0]
+            
+            self.revealed_chars += end - self.segment_offset
+            self.segment_offset = end
+            if self.segment_offset >= len(span_text):
+                self.segment_index += 1
+                self.segment_offset = 0
+                self.segment_cursor = 0
+    
+    def is_complete(self):
+        """Check if all text has been revealed"""
+        return self.revealed_chars >= self.total_chars
+    
+    def get_auto_advance_delay(self):
+        """Time to hold a fully revealed line, based on its length"""
+        return AUTO_ADVANCE_BASE_DELAY + self.total_chars * AUTO_ADVANCE_PER_CHAR
+    
+    def get_display_time(self):
+        """Total time from first glyph until the line should advance"""
+        reveal_time = self.total_chars / self.chars_per_second if self.chars_per_second else 0
+        return reveal_time + self.get_auto_advance_delay()
+    
+    def should_auto_advance(self):
+        """Check if auto-advance is enabled and the hold time has passed"""
+        return self.auto_advance and self.is_complete() and self.hold_timer >= self.get_auto_advance_delay()
+    
+    def render(self, screen, position):
+        """Blit the revealed text (a single cached surface)"""
+        if self.surface is not None:
+            screen.blit(self.surface, position)
+    
+    def get_size(self):
+        """Get size of the text block"""
+        return self.surface.get_size() if self.surface is not None else (0, 0)
@@ -0,0 +1,545 @@
+"""
+===============================
+RETAINED UI WIDGETS
+===============================
+Small retained-mode widget tree for menus and the HUD
+
+FEATURES:
+- ✅ Panel, label, button, slider and list widgets
+- ✅ Layout pass that only runs after something invalidates it
+- ✅ Each widget draws into its own cached surface, redrawn only when its state changes
+- ✅ Mouse events routed through a hit-test tree (hover, click, drag)
+- ✅ Menus build the tree once and only touch widgets whose state changed
+"""
+
+import pygame
+from config import COLORS
+
+
+class Widget:
+    """
+    WIDGET
+    Base node of the UI tree: a screen rect, children and a cached surface
+    """
+    
+    interactive = False     # Receives hover and press
+    captures_mouse = False  # Keeps receiving drags after a press until release
+    
+    def __init__(self, size=(0, 0), name=None):
+        """Initialize widget state"""
+        self.rect = pygame.Rect((0, 0), size)
+        self.name = name
+        self.parent = None
+        self.children = []
+        
+        # === STATE ===
+        self.visible = True
+        self.enabled = True
+        self.hovered = False
+        self.selected = False
+        
+        # === CALLBACKS ===
+        self.on_click = None        # on_click(widget)
+        self.on_hover = None        # on_hover(widget)
+        
+        # === CACHE ===
+        self.surface = None
+        self.needs_redraw = True
+        self.needs_layout = True
+    
+    # === TREE ===
+    
+    def add(self, child):
+        """Add a child widget (returns it)"""
+        child.parent = self
+        self.children.append(child)
+        self.invalidate_layout()
+        return child
+    
+    def clear_children(self):
+        """Remove every child widget"""
+        for child in self.children:
+            child.parent = None
+        self.children = []
+        self.invalidate_layout()
+    
+    def find(self, name):
+        """Find a descendant by name"""
+        for child in self.children:
+            if child.name == name:
+                return child
+            found = child.find(name)
+            if found is not None:
+                return found
+        return None
+    
+    # === INVALIDATION ===
+    
+    def invalidate(self):
+        """Mark the cached surface as stale"""
+        self.needs_redraw = True
+    
+    def invalidate_layout(self):
+        """Mark this widget and its ancestors for the next layout pass"""
+        widget = self
+        while widget is not None:
+            widget.needs_layout = True
+            widget = widget.parent
+    
+    def set(self, **state):
+        """Change attributes, redrawing only if a value actually changed"""
+        changed = False
+        for key, value in state.items():
+            if getattr(self, key) != value:
+                setattr(self, key, value)
+                changed = True
+        if changed:
+            self.invalidate()
+        return changed
+    
+    def set_rect(self, rect):
+        """Move or resize the widget"""
+        rect = pygame.Rect(rect)
+        if rect == self.rect:
+            return
+        if rect.size != self.rect.size:
+            self.invalidate()
+        self.rect = rect
+        # Children are positioned relative to this rect
+        self.needs_layout = True
+    
+    def place(self, **anchor):
+        """Position by Rect anchors, e.g. place(center=(x, y)) (returns self)"""
+        rect = self.rect.copy()
+        for key, value in anchor.items():
+            setattr(rect, key, value)
+        self.set_rect(rect)
+        return self
+    
+    def set_visible(self, visible):
+        """Show or hide the widget (hidden widgets take no space or events)"""
+        if self.visible != visible:
+            self.visible = visible
+            if self.parent is not None:
+                self.parent.invalidate_layout()
+    
+    # === LAYOUT ===
+    
+    def update_layout(self):
+        """Run the layout pass wherever it was invalidated"""
+        if self.needs_layout:
+            self.needs_layout = False
+            self.layout_children()
+        for child in self.children:
+            child.update_layout()
+    
+    def layout_children(self):
+        """Position children (absolute by default)"""
+        pass
+    
+    # === RENDERING ===
+    
+    def render(self, screen):
+        """Blit the cached surface and render children"""
+        if not self.visible:
+            return
+        if self.needs_layout:
+            self.update_layout()
+        if self.needs_redraw:
+            self.surface = self.build_surface()
+            self.needs_redraw = False
+        if self.surface is not None:
+            screen.blit(self.surface, self.rect.topleft)
+        for child in self.children:
+            child.render(screen)
+    
+    def build_surface(self):
+        """Draw this widget alone into a new surface (None draws nothing)"""
+        return None
+    
+    # === EVENTS ===
+    
+    def hit_test(self, pos):
+        """Get the deepest visible, enabled widget under pos"""
+        if not self.visible or not self.rect.collidepoint(pos):
+            return None
+        for child in reversed(self.children):
+            hit = child.hit_test(pos)
+            if hit is not None:
+                return hit
+        return self if self.enabled else None
+    
+    def on_press(self, pos):
+        """Handle a left press (return True to consume it)"""
+        if self.on_click:
+            self.on_click(self)
+            return True
+        return False
+    
+    def on_motion(self, pos):
+        """Handle the mouse moving over the widget"""
+        pass
+    
+    def on_drag(self, pos):
+        """Handle the mouse moving while this widget holds the capture"""
+        pass
+    
+    def on_release(self, pos):
+        """Handle the end of a captured press"""
+        pass
+
+
+class UIRoot(Widget):
+    """
+    UI ROOT
+    Top of a widget tree: routes mouse events and tracks hover and capture
+    """
+    
+    def __init__(self, rect, name=None):
+        """Initialize root covering rect"""
+        super().__init__(pygame.Rect(rect).size, name)
+        self.rect = pygame.Rect(rect)
+        self.hovered_widget = None
+        self.captured = None        # Widget receiving drags until release
+    
+    def handle_event(self, event):
+        """Route a pygame event through the tree (returns True if a widget used it)"""
+        if event.type == pygame.MOUSEMOTION:
+            if self.captured is not None:
+                self.captured.on_drag(event.pos)
+                return True
+            self.update_layout()
+            target = self._set_hover(self.hit_test(event.pos))
+            if target is not None:
+                target.on_motion(event.pos)
+            return target is not None
+        
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.update_layout()
+            widget = self.hit_test(event.pos)
+            self._set_hover(widget)
+            # Bubble up until a widget consumes the press
+            while widget is not None and widget is not self:
+                if widget.enabled and widget.on_press(event.pos):
+                    if widget.captures_mouse:
+                        self.captured = widget
+                    return True
+                widget = widget.parent
+            return False
+        
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.captured is not None:
+            self.captured.on_release(event.pos)
+            self.captured = None
+            return True
+        
+        return False
+    
+    def _set_hover(self, target):
+        """Move hover state to the nearest interactive widget"""
+        while target is not None and not target.interactive:
+            target = target.parent
+        if target is self.hovered_widget:
+            return target
+        
+        if self.hovered_widget is not None:
+            self.hovered_widget.set(hovered=False)
+        self.hovered_widget = target
+        if target is not None:
+            target.set(hovered=True)
+            if target.on_hover:
+                target.on_hover(target)
+        return target
+
+
+class Panel(Widget):
+    """
+    PANEL
+    Container with an optional background that stacks its children
+    """
+    
+    def __init__(self, size=(0, 0), name=None, layout=None, padding=0, spacing=0, align="center",
+                 color=None, border_color=None, border_width=0):
+        """Initialize panel (layout is None, "vertical" or "horizontal")"""
+        super().__init__(size, name)
+        self.layout = layout
+        self.padding = padding
+        self.spacing = spacing
+        self.align = align          # Cross-axis: "start", "center", "end" or "stretch"
+        self.color = color
+        self.border_color = border_color
+        self.border_width = border_width
+    
+    def layout_children(self):
+        """Stack visible children along the layout axis"""
+        if self.layout is None:
+            return
+        
+        vertical = self.layout == "vertical"
+        inner = self.rect.inflate(-self.padding * 2, -self.padding * 2)
+        cursor = inner.top if vertical else inner.left
+        for child in self.children:
+            if not child.visible:
+                continue
+            
+            width, height = child.rect.size
+            if self.align == "stretch":
+                width, height = (inner.width, height) if vertical else (width, inner.height)
+            
+            if vertical:
+                x = self._align_offset(inner.left, inner.width, width)
+                child.set_rect((x, cursor, width, height))
+                cursor += height + self.spacing
+            else:
+                y = self._align_offset(inner.top, inner.height, height)
+                child.set_rect((cursor, y, width, height))
+                cursor += width + self.spacing
+    
+    def _align_offset(self, start, available, size):
+        """Cross-axis position for a child"""
+        if self.align == "center":
+            return start + (available - size) // 2
+        if self.align == "end":
+            return start + available - size
+        return start
+    
+    def build_surface(self):
+        """Draw background and border"""
+        if self.color is None and not self.border_width:
+            return None
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        if self.color is not None:
+            surface.fill(self.color)
+        if self.border_width:
+            pygame.draw.rect(surface, self.border_color, surface.get_rect(), self.border_width)
+        return surface
+
+
+class Label(Widget):
+    """
+    LABEL
+    Single line of text, sized to fit unless given a size
+    """
+    
+    def __init__(self, text, font, color=None, size=None, name=None, align="center"):
+        """Initialize label"""
+        self.font = font
+        self.text = text
+        self.color = color or COLORS['TEXT_WHITE']
+        self.align = align
+        self.auto_size = size is None
+        super().__init__(size or font.size(text), name)
+    
+    def set_text(self, text, color=None):
+        """Change text (resizing auto-sized labels)"""
+        changed = self.set(text=text, color=color or self.color)
+        if changed and self.auto_size:
+            self.rect.size = self.font.size(text)
+            if self.parent is not None:
+                self.parent.invalidate_layout()
+        return changed
+    
+    def build_surface(self):
+        """Render the text"""
+        text_surface = self.font.render(self.text, True, self.color)
+        if self.auto_size:
+            return text_surface
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        text_rect = text_surface.get_rect(midleft=(0, self.rect.height // 2))
+        if self.align == "center":
+            text_rect.centerx = self.rect.width // 2
+        elif self.align == "right":
+            text_rect.right = self.rect.width
+        surface.blit(text_surface, text_rect)
+        return surface
+
+
+class Button(Widget):
+    """
+    BUTTON
+    Clickable text box with normal and selected looks
+    """
+    
+    interactive = True
+    
+    def __init__(self, text, font, size, on_click=None, name=None, color=(40, 40, 60), border_color=None,
+                 text_color=None, selected_color=None, selected_border_color=None, selected_text_color=None,
+                 border_width=2, selected_border_width=3, text_shadow=False):
+        """Initialize button (a None color leaves that part undrawn)"""
+        super().__init__(size, name)
+        self.text = text
+        self.font = font
+        self.on_click = on_click
+        
+        # === STYLE ===
+        self.color = color
+        self.border_color = border_color or COLORS['UI_GRAY']
+        self.text_color = text_color or COLORS['TEXT_WHITE']
+        self.selected_color = selected_color if selected_color is not None else color
+        self.selected_border_color = selected_border_color or self.border_color
+        self.selected_text_color = selected_text_color or self.text_color
+        self.border_width = border_width
+        self.selected_border_width = selected_border_width
+        self.text_shadow = text_shadow
+    
+    def build_surface(self):
+        """Draw background, border and centred text"""
+        # Menus select the hovered button themselves, so only selection changes the look
+        active = self.selected
+        color = self.selected_color if active else self.color
+        border_color = self.selected_border_color if active else self.border_color
+        border_width = self.selected_border_width if active else self.border_width
+        
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        if color is not None:
+            surface.fill(color)
+        if border_width:
+            pygame.draw.rect(surface, border_color, surface.get_rect(), border_width)
+        
+        text_surface = self.font.render(self.text, True, self.selected_text_color if active else self.text_color)
+        text_rect = text_surface.get_rect(center=surface.get_rect().center)
+        if self.text_shadow and active:
+            surface.blit(self.font.render(self.text, True, (0, 0, 0)), text_rect.move(2, 2))
+        surface.blit(text_surface, text_rect)
+        return surface
+
+
+class Slider(Widget):
+    """
+    SLIDER
+    Labelled horizontal value slider with click and drag
+    """
+    
+    interactive = True
+    captures_mouse = True
+    
+    def __init__(self, label, font, size, value=0, minimum=0, maximum=100, step=1, on_change=None, name=None,
+                 color=None):
+        """Initialize slider"""
+        super().__init__(size, name)
+        self.label = label
+        self.font = font
+        self.value = value
+        self.minimum = minimum
+        self.maximum = maximum
+        self.step = step
+        self.on_change = on_change      # on_change(slider, value)
+        self.color = color or COLORS['TERMINAL_GREEN']
+    
+    def _track_rect(self):
+        """Track area in screen coordinates (right half of the widget)"""
+        track_width = self.rect.width // 2
+        return pygame.Rect(self.rect.right - track_width - 50, self.rect.centery - 4, track_width, 8)
+    
+    def set_value(self, value):
+        """Clamp, snap and apply a value (callback only fires on change)"""
+        value = max(self.minimum, min(self.maximum, value))
+        value = self.minimum + round((value - self.minimum) / self.step) * self.step
+        if self.set(value=value) and self.on_change:
+            self.on_change(self, value)
+    
+    def _value_at(self, pos):
+        """Value under an x position on the track"""
+        track = self._track_rect()
+        ratio = (pos[0] - track.left) / max(1, track.width)
+        return self.minimum + ratio * (self.maximum - self.minimum)
+    
+    def on_press(self, pos):
+        """Jump to the pressed position and start dragging"""
+        self.set(selected=True)
+        self.set_value(self._value_at(pos))
+        return True
+    
+    def on_drag(self, pos):
+        """Follow the mouse"""
+        self.set_value(self._value_at(pos))
+    
+    def on_release(self, pos):
+        """Stop dragging"""
+        self.set(selected=False)
+    
+    def build_surface(self):
+        """Draw label, track, fill, knob and value"""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        active = self.hovered or self.selected
+        label_color = COLORS['TEXT_WHITE'] if active else COLORS['UI_GRAY']
+        
+        label_surface = self.font.render(self.label, True, label_color)
+        surface.blit(label_surface, label_surface.get_rect(midleft=(10, self.rect.height // 2)))
+        
+        track = self._track_rect().move(-self.rect.left, -self.rect.top)
+        ratio = (self.value - self.minimum) / max(1, self.maximum - self.minimum)
+        pygame.draw.rect(surface, (40, 40, 60), track)
+        pygame.draw.rect(surface, self.color, (track.left, track.top, int(track.width * ratio), track.height))
+        pygame.draw.rect(surface, label_color, track, 1)
+        pygame.draw.circle(surface, COLORS['TEXT_WHITE'], (track.left + int(track.width * ratio), track.centery), 7)
+        
+        value_surface = self.font.render(str(int(self.value)), True, label_color)
+        surface.blit(value_surface, value_surface.get_rect(midright=(self.rect.width - 10, self.rect.height // 2)))
+        return surface
+
+
+class ListWidget(Widget):
+    """
+    LIST WIDGET
+    Fixed-height rows drawn by a row renderer, with hover and selection
+    """
+    
+    interactive = True
+    
+    def __init__(self, size, row_height, row_renderer, items=None, on_select=None, name=None, spacing=0):
+        """Initialize list (row_renderer(surface, rect, item, index, selected) draws one row)"""
+        super().__init__(size, name)
+        self.row_height = row_height
+        self.row_renderer = row_renderer
+        self.items = list(items or [])
+        self.on_select = on_select      # on_select(list_widget, index)
+        self.spacing = spacing
+        self.selected_index = 0
+    
+    def set_items(self, items):
+        """Replace the list contents"""
+        items = list(items)
+        if items != self.items:
+            self.items = items
+            self.selected_index = min(self.selected_index, max(0, len(items) - 1))
+            self.invalidate()
+    
+    def select(self, index):
+        """Move the selection (returns True if it changed)"""
+        return self.set(selected_index=index)
+    
+    def get_row_rect(self, index):
+        """Row rect in screen coordinates"""
+        return pygame.Rect(self.rect.left, self.rect.top + index * (self.row_height + self.spacing),
+                           self.rect.width, self.row_height)
+    
+    def index_at(self, pos):
+        """Row under a screen position (None between or past rows)"""
+        for index in range(len(self.items)):
+            if self.get_row_rect(index).collidepoint(pos):
+                return index
+        return None
+    
+    def on_motion(self, pos):
+        """Hovering a row selects it"""
+        index = self.index_at(pos)
+        if index is not None and self.select(index) and self.on_hover:
+            self.on_hover(self)
+    
+    def on_press(self, pos):
+        """Select and activate the pressed row"""
+        index = self.index_at(pos)
+        if index is None:
+            return False
+        self.select(index)
+        if self.on_select:
+            self.on_select(self, index)
+        return True
+    
+    def build_surface(self):
+        """Draw every row"""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        for index, item in enumerate(self.items):
+            rect = self.get_row_rect(index).move(-self.rect.left, -self.rect.top)
+            self.row_renderer(surface, rect, item, index, index == self.selected_index)
+        return surface